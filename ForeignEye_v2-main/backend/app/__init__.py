@@ -12,7 +12,7 @@ from flask import current_app
 
 from app.config import get_config
 from app.extensions import db, jwt, limiter, migrate, celery_app, get_neo4j_driver
-from app.cli import seed_db_command
+from app.cli import backfill_graph_caches_command, rebuild_adjacency_command, seed_db_command
 
 def create_app(config_name=None):
     app = Flask(__name__)
@@ -52,7 +52,12 @@ def initialize_extensions(app):
                 "CREATE INDEX concept_name_index IF NOT EXISTS FOR (c:Concept) ON (c.name)",
                 database_=app.config.get("NEO4J_DATABASE", "neo4j")
             )
-            app.logger.info("Neo4j 드라이버 연결 성공 및 'concept_name_index' 보장됨.")
+            # ETL/동기화 작업의 MERGE (c:Concept {concept_id: ...})가 인덱스를 타도록 유니크 제약 보장
+            driver.execute_query(
+                "CREATE CONSTRAINT concept_id_unique IF NOT EXISTS FOR (c:Concept) REQUIRE c.concept_id IS UNIQUE",
+                database_=app.config.get("NEO4J_DATABASE", "neo4j")
+            )
+            app.logger.info("Neo4j 드라이버 연결 성공 및 'concept_name_index', 'concept_id_unique' 보장됨.")
         except Exception as e:
             app.logger.error(f"Neo4j 드라이버 연결 실패. .env 파일을 확인하세요. 오류: {e}")
 
@@ -151,7 +156,9 @@ def register_cli_commands(app):
             db.session.commit()
             print(f'✓ 관리자 계정이 생성되었습니다: {username}')
     
-    app.cli.add_command(seed_db_command)        
+    app.cli.add_command(seed_db_command)
+    app.cli.add_command(rebuild_adjacency_command)
+    app.cli.add_command(backfill_graph_caches_command)        
     app.logger.info('CLI 명령 등록 완료 (Flask-Migrate 사용)')
 
 def test_db_connection():
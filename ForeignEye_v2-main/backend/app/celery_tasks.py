@@ -27,10 +27,11 @@ def get_flask_app():
 
 # --- (신규) M1(캡스톤) 메인 ETL 작업 ---
 @celery_app.task(name='run_main_etl_task')
-def run_main_etl_task(max_articles: int = 3):
+def run_main_etl_task(max_articles: int = 3, workers: int = None):
     """
     GNews/OpenRouter/DBLoader를 비동기(Celery)로 실행하는
     M1(캡스톤)의 메인 ETL 작업입니다.
+    (workers: AI 분석 워커 수, None이면 ETL_WORKERS 환경 변수 사용)
     """
     if not ETL_LOGIC_FOUND:
         logger.error("ETL 로직을 찾을 수 없어 'run_main_etl_task'를 실행할 수 없습니다.")
@@ -38,16 +39,145 @@ def run_main_etl_task(max_articles: int = 3):
 
     app = get_flask_app()
     with app.app_context():
-        logger.info(f"Celery: 'run_main_etl_task' 시작 (Max Articles: {max_articles})...")
+        logger.info(f"Celery: 'run_main_etl_task' 시작 (Max Articles: {max_articles}, Workers: {workers})...")
         try:
             # v2.0의 ETL 파이프라인 로직을 그대로 호출
-            result = run_etl_pipeline(max_articles=max_articles)
+            result = run_etl_pipeline(max_articles=max_articles, workers=workers)
             logger.info(f"Celery: 'run_main_etl_task' 성공. 결과: {result}")
             return result
         except Exception as e:
             logger.error(f"Celery: 'run_main_etl_task' 실패. 오류: {e}", exc_info=True)
             raise e
 
+# --- 그래프 캐시 증분 재생성 작업 ---
+@celery_app.task(name='rebuild_stale_graph_caches_task')
+def rebuild_stale_graph_caches_task(batch_size: int = 50, max_batches: int = None):
+    """
+    관계 추가로 stale 표시된 기사들의 그래프 캐시를 배치 단위로 재생성합니다.
+    (재생성 전까지 기존 캐시가 계속 제공되므로 요청 경로에서 빌드가 일어나지 않습니다)
+    """
+    from app.services.etl_service import ETLService
+
+    app = get_flask_app()
+    with app.app_context():
+        logger.info(f"Celery: 'rebuild_stale_graph_caches_task' 시작 (Batch Size: {batch_size})...")
+        try:
+            rebuilt = ETLService.rebuild_stale_graph_caches(batch_size=batch_size, max_batches=max_batches)
+            logger.info(f"Celery: 'rebuild_stale_graph_caches_task' 성공. 재생성: {rebuilt}건")
+            return rebuilt
+        except Exception as e:
+            db.session.rollback()
+            logger.error(f"Celery: 'rebuild_stale_graph_caches_task' 실패. 오류: {e}", exc_info=True)
+            raise e
+
+# --- 관계 강도 재계산 작업 ---
+@celery_app.task(name='recompute_relation_strengths_task')
+def recompute_relation_strengths_task(full_refresh: bool = False, batch_size: int = None):
+    """
+    Concept_Relation.strength를 유사도 + 공동 등장 기사 수로 재계산합니다.
+    (기본은 마지막 실행 이후 추가된 관계/적재된 기사에 해당하는 관계만, full_refresh면 전체)
+    run_relations_etl의 강도 재계산 단계가 실패하면 예약되며, stale 기사가 생기면 그래프 캐시 재생성을 이어서 예약합니다.
+    """
+    from etl.relation_strength import recompute_relation_strengths
+
+    app = get_flask_app()
+    with app.app_context():
+        logger.info(f"Celery: 'recompute_relation_strengths_task' 시작 (Full Refresh: {full_refresh})...")
+        try:
+            result = recompute_relation_strengths(full_refresh=full_refresh, batch_size=batch_size)
+            logger.info(f"Celery: 'recompute_relation_strengths_task' 성공. 결과: {result}")
+            # 강도가 바뀌어 stale 표시된 기사의 그래프 캐시 재생성
+            if result['stale_articles']:
+                rebuild_stale_graph_caches_task.delay()
+            return result
+        except Exception as e:
+            db.session.rollback()
+            logger.error(f"Celery: 'recompute_relation_strengths_task' 실패. 오류: {e}", exc_info=True)
+            raise e
+
+# --- 개념 공동 등장 갱신 작업 ---
+@celery_app.task(name='update_concept_cooccurrence_task')
+def update_concept_cooccurrence_task(full_refresh: bool = False):
+    """
+    Article_Concept에서 개념 쌍별 공동 등장 기사 수/PMI를 계산해 Concept_Cooccurrence에 반영합니다.
+    (기본은 마지막 실행 이후 적재된 기사만, full_refresh면 테이블을 비우고 전체 재계산)
+    ETL 적재 후/관계 분석 전의 공동 등장 갱신이 실패하면 예약됩니다.
+    """
+    from etl.cooccurrence import update_cooccurrences
+
+    app = get_flask_app()
+    with app.app_context():
+        logger.info(f"Celery: 'update_concept_cooccurrence_task' 시작 (Full Refresh: {full_refresh})...")
+        try:
+            result = update_cooccurrences(full_refresh=full_refresh)
+            logger.info(f"Celery: 'update_concept_cooccurrence_task' 성공. 결과: {result}")
+            return result
+        except Exception as e:
+            db.session.rollback()
+            logger.error(f"Celery: 'update_concept_cooccurrence_task' 실패. 오류: {e}", exc_info=True)
+            raise e
+
+# --- 개념 이웃 목록 전체 재계산 작업 ---
+@celery_app.task(name='rebuild_concept_adjacency_task')
+def rebuild_concept_adjacency_task(batch_size: int = 500):
+    """
+    모든 개념의 이웃 목록(Concept_Adjacency)을 Concept_Relation에서 다시 계산합니다.
+    (마이그레이션 직후 기존 관계 채우기, CONCEPT_ADJACENCY_TOP_N 변경 시 사용)
+    run_relations_etl이 이웃 목록이 비어 있는 것을 발견하면 예약되며, `flask rebuild-adjacency`로도 실행할 수 있습니다.
+    """
+    from app.services.adjacency_service import AdjacencyService
+
+    app = get_flask_app()
+    with app.app_context():
+        logger.info(f"Celery: 'rebuild_concept_adjacency_task' 시작 (Batch Size: {batch_size})...")
+        try:
+            written = AdjacencyService.rebuild_all(batch_size=batch_size)
+            logger.info(f"Celery: 'rebuild_concept_adjacency_task' 성공. 저장: {written}건")
+            return written
+        except Exception as e:
+            db.session.rollback()
+            logger.error(f"Celery: 'rebuild_concept_adjacency_task' 실패. 오류: {e}", exc_info=True)
+            raise e
+
+@celery_app.task(name='precompute_graph_caches_task')
+def precompute_graph_caches_task(article_ids):
+    """
+    지정한 기사들의 그래프 캐시를 집합 단위로 계산하여 저장합니다.
+    (캐시가 누락된 기사를 조회 요청이 발견했을 때 예약)
+    """
+    from app.services.etl_service import ETLService
+
+    app = get_flask_app()
+    with app.app_context():
+        try:
+            written = ETLService.precompute_graph_caches(article_ids)
+            logger.info(f"Celery: 'precompute_graph_caches_task' 성공. 저장: {written}건")
+            return written
+        except Exception as e:
+            db.session.rollback()
+            logger.error(f"Celery: 'precompute_graph_caches_task' 실패. 오류: {e}", exc_info=True)
+            raise e
+
+@celery_app.task(name='backfill_graph_caches_task')
+def backfill_graph_caches_task(batch_size: int = None):
+    """
+    graph_cache가 없는 모든 기사의 그래프 캐시를 배치 단위로 생성합니다.
+    (사전 계산 단계 도입 이전 기사 백필, ETL 사전 계산 실패 시 예약. `flask backfill-graph-caches`로도 실행)
+    """
+    from app.services.etl_service import ETLService
+
+    app = get_flask_app()
+    with app.app_context():
+        logger.info(f"Celery: 'backfill_graph_caches_task' 시작 (Batch Size: {batch_size})...")
+        try:
+            written = ETLService.backfill_graph_caches(batch_size=batch_size)
+            logger.info(f"Celery: 'backfill_graph_caches_task' 성공. 저장: {written}건")
+            return written
+        except Exception as e:
+            db.session.rollback()
+            logger.error(f"Celery: 'backfill_graph_caches_task' 실패. 오류: {e}", exc_info=True)
+            raise e
+
 # --- (기존) P4 '유령 상태' 방어용 동기화 작업 ---
 @celery_app.task(name='sync_neo4j_task')
 def sync_neo4j_task(user_id):
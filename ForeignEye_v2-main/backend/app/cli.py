@@ -2,7 +2,7 @@
 
 import click
 from flask.cli import with_appcontext
-from app.extensions import db
+from app.extensions import celery_app, db
 from app.models.user import User
 
 @click.command('seed-db')
@@ -23,4 +23,45 @@ def seed_db_command():
             click.echo('✅ Successfully created user_id=1 (testuser).')
         except Exception as e:
             db.session.rollback()
-            click.echo(f'❌ Failed to create test user: {e}')
\ No newline at end of file
+            click.echo(f'❌ Failed to create test user: {e}')
+
+
+@click.command('rebuild-adjacency')
+@click.option('--batch-size', default=500, show_default=True, help='배치당 개념 수')
+@click.option('--background', is_flag=True, help='Celery 작업으로 예약하고 바로 종료')
+@with_appcontext
+def rebuild_adjacency_command(batch_size, background):
+    """모든 개념의 이웃 목록(Concept_Adjacency)을 다시 계산합니다. (마이그레이션 직후, CONCEPT_ADJACENCY_TOP_N 변경 시)"""
+    if background:
+        celery_app.send_task('rebuild_concept_adjacency_task', kwargs={'batch_size': batch_size})
+        click.echo('⟳ Scheduled rebuild_concept_adjacency_task.')
+        return
+
+    from app.services.adjacency_service import AdjacencyService
+    try:
+        written = AdjacencyService.rebuild_all(batch_size=batch_size)
+        click.echo(f'✅ Rebuilt adjacency lists for {written} concepts.')
+    except Exception as e:
+        db.session.rollback()
+        click.echo(f'❌ Failed to rebuild adjacency lists: {e}')
+
+
+
+@click.command('backfill-graph-caches')
+@click.option('--batch-size', default=None, type=int, help='배치당 기사 수 (기본값: GRAPH_CACHE_BATCH_SIZE)')
+@click.option('--background', is_flag=True, help='Celery 작업으로 예약하고 바로 종료')
+@with_appcontext
+def backfill_graph_caches_command(batch_size, background):
+    """graph_cache가 없는 모든 기사의 그래프 캐시를 생성합니다. (1회성 백필, 재실행 가능)"""
+    if background:
+        celery_app.send_task('backfill_graph_caches_task', kwargs={'batch_size': batch_size})
+        click.echo('⟳ Scheduled backfill_graph_caches_task.')
+        return
+
+    from app.services.etl_service import ETLService
+    try:
+        written = ETLService.backfill_graph_caches(batch_size=batch_size)
+        click.echo(f'✅ Built graph caches for {written} articles.')
+    except Exception as e:
+        db.session.rollback()
+        click.echo(f'❌ Failed to backfill graph caches: {e}')
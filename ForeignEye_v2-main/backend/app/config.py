@@ -108,8 +108,9 @@ class TestingConfig(Config):
     DEBUG = True
     TESTING = True
     
-    # 테스트용 In-Memory SQLite 데이터베이스
+    # 테스트용 In-Memory SQLite 데이터베이스 (MySQL 풀/SSL 옵션은 SQLite에서 사용할 수 없음)
     SQLALCHEMY_DATABASE_URI = 'sqlite:///:memory:'
+    SQLALCHEMY_ENGINE_OPTIONS = {}
     
     # Rate Limiting 비활성화
     RATELIMIT_ENABLED = False
@@ -13,6 +13,7 @@ from flask_limiter.util import get_remote_address
 from flask_migrate import Migrate
 from celery import Celery
 from neo4j import GraphDatabase
+import redis
 import os
 
 # --- DB, Auth, Limiter ---
@@ -54,3 +55,17 @@ def get_neo4j_driver():
             auth=(os.environ.get('NEO4J_USERNAME'), os.environ.get('NEO4J_PASSWORD'))
         )
     return neo4j_driver
+
+# --- Redis 클라이언트 (캐시 용도) ---
+redis_client = None
+
+def get_redis_client():
+    """Redis 클라이언트 싱글톤 (REDIS_URL 환경 변수, 기본값: Docker 내부망 DB 2)"""
+    global redis_client
+    if redis_client is None:
+        redis_client = redis.Redis.from_url(
+            os.environ.get('REDIS_URL', 'redis://redis:6379/2'),
+            socket_timeout=2,
+            socket_connect_timeout=2
+        )
+    return redis_client
@@ -7,7 +7,8 @@
 from app.models.user import User
 from app.models.article import Article
 from app.models.concept import Concept
-from app.models.relations import Article_Concept, Concept_Relation, User_Collection
+from app.models.relations import Article_Concept, Concept_Relation, Concept_Cooccurrence, Concept_Adjacency, User_Collection
+from app.models.etl_state import ETL_Watermark
 
 __all__ = [
     'User',
@@ -15,6 +16,9 @@ __all__ = [
     'Concept',
     'Article_Concept',
     'Concept_Relation',
-    'User_Collection'
+    'Concept_Cooccurrence',
+    'Concept_Adjacency',
+    'User_Collection',
+    'ETL_Watermark'
 ]
 
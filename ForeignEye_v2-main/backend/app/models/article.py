@@ -5,8 +5,9 @@ Article 모델
 """
 
 from datetime import datetime
-import json
 from app.extensions import db
+from app.utils.graph_format import encode_graph, decode_graph
+from app.utils.parsed_graph_cache import parsed_graph_cache
 
 
 class Article(db.Model):
@@ -19,7 +20,9 @@ class Article(db.Model):
         title_ko (str): 한국어 번역 제목
         original_url (str): 원본 기사 URL (Unique)
         summary_ko (str): AI 생성 한국어 요약
-        graph_cache (str): 사전 계산된 지식 그래프 JSON
+        graph_cache (bytes): 사전 계산된 지식 그래프 (app.utils.graph_format v2 압축 형식)
+        graph_cache_stale (bool): 관계 변경으로 재생성이 필요한지 여부 (재생성 전까지 기존 캐시 제공)
+        graph_cache_version (int): 그래프 캐시 버전 (재생성/stale 표시할 때마다 증가)
         created_at (datetime): 기사 생성 시각
         concepts (relationship): 기사에 등장하는 개념들
     """
@@ -32,7 +35,9 @@ class Article(db.Model):
     title_ko = db.Column(db.String(255), nullable=True)
     original_url = db.Column(db.String(512), unique=True, nullable=False, index=True)
     summary_ko = db.Column(db.Text, nullable=False)
-    graph_cache = db.Column(db.Text, nullable=True)  # JSON 형식의 그래프 캐시
+    graph_cache = db.Column(db.LargeBinary, nullable=True)  # 압축된 그래프 캐시 (개념 ID/엣지만 저장)
+    graph_cache_stale = db.Column(db.Boolean, nullable=False, default=False, index=True)
+    graph_cache_version = db.Column(db.Integer, nullable=False, default=0)
     created_at = db.Column(
         db.DateTime,
         nullable=False,
@@ -89,37 +94,79 @@ class Article(db.Model):
             ]
         
         if include_graph and self.graph_cache:
-            # 그래프 데이터 파싱
-            try:
-                data['graph'] = json.loads(self.graph_cache)
-            except json.JSONDecodeError:
-                data['graph'] = {'nodes': [], 'edges': []}
+            # 그래프 데이터 (파싱 결과는 프로세스 LRU에서 재사용)
+            data['graph'] = self.get_graph_cache()
         
         return data
     
+    @staticmethod
+    def serialize_graph(graph_data):
+        """
+        그래프 데이터를 graph_cache 컬럼 저장 형식(v2 압축)으로 직렬화
+        
+        노드의 스타일 키와 개념 설명은 저장하지 않고 개념 ID, 엣지, Primary 여부만 저장합니다.
+        
+        Args:
+            graph_data (dict): {'nodes': [...], 'edges': [...]} 형식의 그래프 데이터
+            
+        Returns:
+            bytes: 직렬화된 그래프
+        """
+        return encode_graph(graph_data)
+    
+    @staticmethod
+    def deserialize_graph(raw):
+        """
+        graph_cache 컬럼 값을 그래프 데이터로 역직렬화
+        
+        개념 이름/설명/사례는 공유 개념 캐시(ConceptService.get_concept_summaries)로 채웁니다.
+        마이그레이션 이전의 JSON 텍스트도 읽을 수 있습니다.
+        
+        Args:
+            raw (bytes): 직렬화된 그래프
+            
+        Returns:
+            dict: {'nodes': [...], 'edges': [...]}
+            
+        Raises:
+            ValueError: 형식이 올바르지 않음
+        """
+        from app.services.concept_service import ConceptService
+        return decode_graph(raw, ConceptService.get_concept_summaries)
+    
     def set_graph_cache(self, graph_data):
         """
-        그래프 데이터를 JSON으로 직렬화하여 캐시에 저장
+        그래프 데이터를 직렬화하여 캐시에 저장
         
         Args:
             graph_data (dict): {'nodes': [...], 'edges': [...]} 형식의 그래프 데이터
         """
-        self.graph_cache = json.dumps(graph_data, ensure_ascii=False)
+        self.graph_cache = Article.serialize_graph(graph_data)
+        self.graph_cache_version = (self.graph_cache_version or 0) + 1
+        self.graph_cache_stale = False
     
     def get_graph_cache(self):
         """
         캐시된 그래프 데이터를 파싱하여 반환
         
+        파싱 결과는 (article_id, graph_cache_version) 키의 프로세스 LRU에서 재사용하고,
+        호출자에게는 노드를 수정해도 공유 캐시가 바뀌지 않는 복사본을 반환합니다.
+        
         Returns:
             dict: 그래프 데이터 또는 빈 그래프
         """
         if not self.graph_cache:
             return {'nodes': [], 'edges': []}
         
-        try:
-            return json.loads(self.graph_cache)
-        except json.JSONDecodeError:
+        graph = parsed_graph_cache.get_or_parse(
+            (self.article_id, self.graph_cache_version),
+            self.graph_cache,
+            Article.deserialize_graph
+        )
+        if graph is None:
             return {'nodes': [], 'edges': []}
+        
+        return parsed_graph_cache.overlay(graph)
     
     def __repr__(self):
         """디버깅용 문자열 표현"""
@@ -0,0 +1,74 @@
+"""
+ETL 상태 모델
+
+증분 ETL 작업이 "마지막으로 처리한 위치"(워터마크)를 저장합니다.
+"""
+
+from datetime import datetime
+from app.extensions import db
+
+
+class ETL_Watermark(db.Model):
+    """
+    ETL 워터마크 테이블
+    
+    작업 이름별로 마지막으로 처리한 ID 등 단조 증가하는 값을 저장합니다.
+    (예: 'relations.concept_id' = 관계 분석을 마친 마지막 concept_id)
+    
+    Attributes:
+        name (str): 워터마크 이름 (Primary Key)
+        value (int): 워터마크 값
+        updated_at (datetime): 마지막 갱신 시각
+    """
+    
+    __tablename__ = 'ETL_Watermark'
+    
+    name = db.Column(db.String(100), primary_key=True)
+    value = db.Column(db.BigInteger, nullable=False, default=0)
+    updated_at = db.Column(
+        db.DateTime,
+        nullable=False,
+        default=datetime.utcnow,
+        onupdate=datetime.utcnow
+    )
+    
+    @staticmethod
+    def get_value(name, default=0):
+        """
+        워터마크 값 조회
+        
+        Args:
+            name (str): 워터마크 이름
+            default (int): 저장된 값이 없을 때 반환할 값
+            
+        Returns:
+            int: 워터마크 값
+        """
+        watermark = db.session.get(ETL_Watermark, name)
+        return watermark.value if watermark else default
+    
+    @staticmethod
+    def set_value(name, value):
+        """
+        워터마크 값 저장 (커밋은 호출자가 수행)
+        
+        Args:
+            name (str): 워터마크 이름
+            value (int): 저장할 값
+        """
+        watermark = db.session.get(ETL_Watermark, name)
+        if watermark:
+            watermark.value = value
+        else:
+            db.session.add(ETL_Watermark(name=name, value=value))
+    
+    def to_dict(self):
+        """딕셔너리로 변환"""
+        return {
+            'name': self.name,
+            'value': self.value,
+            'updated_at': self.updated_at.isoformat() + 'Z' if self.updated_at else None
+        }
+    
+    def __repr__(self):
+        return f'<ETL_Watermark {self.name}={self.value}>'
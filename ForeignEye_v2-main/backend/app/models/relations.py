@@ -3,6 +3,8 @@
 
 Article_Concept: 기사-개념 관계 (N:M)
 Concept_Relation: 개념-개념 관계 (방향성 그래프)
+Concept_Cooccurrence: 개념-개념 공동 등장 통계 (Article_Concept에서 계산)
+Concept_Adjacency: 개념별 상위 이웃 목록 (Concept_Relation 비정규화 캐시)
 User_Collection: 사용자-개념 수집 관계 (N:M)
 """
 
@@ -103,6 +105,92 @@ class Concept_Relation(db.Model):
         return f'<Concept_Relation {self.from_concept_id}→{self.to_concept_id} (strength={self.strength})>'
 
 
+class Concept_Cooccurrence(db.Model):
+    """
+    개념 공동 등장 테이블 (무방향, concept_a_id < concept_b_id 쌍 1행)
+    
+    두 개념이 함께 연결된 기사 수와 PMI를 저장합니다.
+    etl.cooccurrence 작업이 Article_Concept에서 계산하며, 새 기사가 적재되면 증분 갱신합니다.
+    (PMI는 해당 쌍이 마지막으로 갱신된 시점의 전체 기사 수/개념 빈도 기준)
+    
+    Attributes:
+        concept_a_id (int): 개념 ID (작은 쪽, Primary Key)
+        concept_b_id (int): 개념 ID (큰 쪽, Primary Key)
+        article_count (int): 두 개념이 함께 연결된 기사 수
+        pmi (float): log(P(a, b) / (P(a) · P(b)))
+    """
+    
+    __tablename__ = 'Concept_Cooccurrence'
+    
+    concept_a_id = db.Column(
+        db.Integer,
+        db.ForeignKey('Concept.concept_id', ondelete='CASCADE'),
+        primary_key=True
+    )
+    concept_b_id = db.Column(
+        db.Integer,
+        db.ForeignKey('Concept.concept_id', ondelete='CASCADE'),
+        primary_key=True
+    )
+    article_count = db.Column(db.Integer, nullable=False, default=0)
+    pmi = db.Column(db.Float, nullable=False, default=0.0)
+    
+    # 양방향 이웃 조회용 (개념별 기사 수 내림차순)
+    __table_args__ = (
+        db.Index('idx_cooccurrence_a_count', 'concept_a_id', 'article_count'),
+        db.Index('idx_cooccurrence_b_count', 'concept_b_id', 'article_count'),
+    )
+    
+    def to_dict(self):
+        """딕셔너리로 변환"""
+        return {
+            'concept_a_id': self.concept_a_id,
+            'concept_b_id': self.concept_b_id,
+            'article_count': self.article_count,
+            'pmi': self.pmi
+        }
+    
+    def __repr__(self):
+        return f'<Concept_Cooccurrence {self.concept_a_id}-{self.concept_b_id} (articles={self.article_count})>'
+
+
+class Concept_Adjacency(db.Model):
+    """
+    개념별 이웃 목록 테이블 (Concept_Relation 비정규화)
+    
+    개념 하나의 관계를 방향별로 강도 내림차순 상위 N개씩 JSON으로 저장하여,
+    이웃 조회를 조인 없이 기본 키 조회 한 번으로 처리합니다.
+    관계를 쓰는 곳(관계 적재, 강도 재계산)이 같은 트랜잭션에서 양 끝 개념의 행을 다시 계산합니다.
+    
+    Attributes:
+        concept_id (int): 개념 ID (Primary Key)
+        out_neighbours (JSON): 이 개념에서 시작하는 관계의 이웃
+            [{'concept_id', 'name', 'relation_type', 'strength', 'relation_id'}, ...]
+        in_neighbours (JSON): 이 개념으로 향하는 관계의 이웃 (형식 동일)
+        updated_at (datetime): 마지막 계산 시각
+    """
+    
+    __tablename__ = 'Concept_Adjacency'
+    
+    concept_id = db.Column(
+        db.Integer,
+        db.ForeignKey('Concept.concept_id', ondelete='CASCADE'),
+        primary_key=True
+    )
+    out_neighbours = db.Column(db.JSON, nullable=False)
+    in_neighbours = db.Column(db.JSON, nullable=False)
+    updated_at = db.Column(
+        db.DateTime,
+        nullable=False,
+        default=datetime.utcnow,
+        onupdate=datetime.utcnow
+    )
+    
+    def __repr__(self):
+        return (f'<Concept_Adjacency {self.concept_id} '
+                f'(out={len(self.out_neighbours or [])}, in={len(self.in_neighbours or [])})>')
+
+
 class User_Collection(db.Model):
     """
     사용자 개념 수집 테이블 (N:M 관계)
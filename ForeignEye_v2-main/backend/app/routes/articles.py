@@ -7,9 +7,11 @@
 from flask import Blueprint, request
 from flask_jwt_extended import jwt_required, get_jwt_identity
 
-from app.utils.response import success_response, paginated_response, error_response
+from app.utils.response import (
+    success_response, paginated_response, cursor_paginated_response, error_response
+)
 from app.utils.exceptions import NotFoundError, ValidationError
-from app.utils.validators import validate_pagination, validate_sort_params
+from app.utils.validators import validate_pagination, validate_limit, validate_sort_params
 from app.services.article_service import ArticleService
 
 bp = Blueprint('articles', __name__)
@@ -22,6 +24,10 @@ def get_articles():
     기사 목록 조회 API
     
     GET /api/v1/articles?page=1&limit=10&sort=created_at&order=desc
+    
+    키셋 모드 (cursor 파라미터가 있으면, 빈 값이면 첫 페이지):
+    GET /api/v1/articles?cursor=&limit=10
+    GET /api/v1/articles?cursor=<pagination.next_cursor>&limit=10
     """
     try:
         # 쿼리 파라미터
@@ -31,14 +37,28 @@ def get_articles():
         order = request.args.get('order', 'desc')
         
         # 검증
-        page, limit = validate_pagination(page, limit)
         sort, order = validate_sort_params(sort, order, ['created_at', 'title'])
         
+        if 'cursor' in request.args:
+            limit = validate_limit(limit, default=10)
+            articles, next_cursor, total = ArticleService.get_articles_keyset(
+                limit, request.args.get('cursor') or None, sort, order
+            )
+            
+            return cursor_paginated_response(
+                items=ArticleService.serialize_articles_with_preview(articles),
+                next_cursor=next_cursor,
+                items_per_page=limit,
+                total_items=total
+            )
+        
+        page, limit = validate_pagination(page, limit)
+        
         # 서비스 호출
         articles, total = ArticleService.get_articles(page, limit, sort, order)
         
-        # 응답 생성
-        articles_data = [a.to_dict(include_preview=True) for a in articles]
+        # 응답 생성 (미리보기 개념 일괄 조회)
+        articles_data = ArticleService.serialize_articles_with_preview(articles)
         
         return paginated_response(
             items=articles_data,
@@ -6,6 +6,8 @@ from flask import Blueprint, current_app
 from app.extensions import db, get_neo4j_driver
 from app.utils.response import success_response, error_response
 from sqlalchemy import text # [M1 수정] text() 함수 임포트
+from app.utils.parsed_graph_cache import parsed_graph_cache
+from app.utils.concept_search_index import concept_search_index
 
 bp = Blueprint('health', __name__)
 
@@ -56,6 +58,18 @@ def get_health_check():
         }
         current_app.logger.error(f"Health Check: Neo4j Error: {e}")
 
+    # 3. 파싱된 그래프 캐시 지표 (프로세스 로컬)
+    status['checks']['graph_parse_cache'] = {
+        'status': 'OK',
+        **parsed_graph_cache.stats()
+    }
+
+    # 4. 개념 검색 인덱스 지표 (프로세스 로컬)
+    status['checks']['concept_search_index'] = {
+        'status': 'OK',
+        **concept_search_index.stats()
+    }
+
     status['response_time_ms'] = round((time.time() - start_time) * 1000)
     
     if status['status'] == 'OK':
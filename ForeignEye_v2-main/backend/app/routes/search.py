@@ -6,8 +6,9 @@ from flask import Blueprint, request
 from flask_jwt_extended import jwt_required
 
 from app.services.search_service import SearchService
-from app.utils.response import success_response, error_response
+from app.utils.response import cursor_paginated_response, error_response
 from app.utils.exceptions import ValidationError
+from app.utils.validators import validate_limit
 
 bp = Blueprint("search", __name__)
 
@@ -17,19 +18,38 @@ bp = Blueprint("search", __name__)
 def get_articles_by_concept():
     """
     (P2/P3) 개념 이름으로 기사 목록 검색 (친척 개념 30개 포함)
+
+    Query Parameters:
+        concept_name (str): 개념 이름 (필수)
+        limit (int): 페이지당 항목 수 (기본값: 20, 최대: 50)
+        cursor (str): 이전 응답의 pagination.next_cursor (없으면 첫 페이지)
     """
     concept_name = request.args.get("concept_name", "").strip()
     if not concept_name:
         raise ValidationError("concept_name 파라미터는 필수입니다.", "concept_name")
 
+    limit = validate_limit(
+        request.args.get("limit"),
+        default=SearchService.DEFAULT_PAGE_SIZE,
+        max_limit=SearchService.MAX_PAGE_SIZE
+    )
+    cursor = request.args.get("cursor") or None
+
     try:
         # (P3 방어) SearchService가 LIMIT 30을 적용함
-        articles = SearchService.get_articles_by_concept(concept_name)
-        return success_response({
-            "concept": concept_name,
-            "total_results": len(articles),
-            "articles": articles
-        })
+        articles, next_cursor, total = SearchService.get_articles_by_concept(
+            concept_name, limit, cursor
+        )
+        return cursor_paginated_response(
+            articles,
+            next_cursor,
+            limit,
+            total,
+            items_key="articles",
+            extra={"concept": concept_name, "total_results": total}
+        )
+    except ValidationError:
+        raise
     except Exception as exc:
         return error_response("INTERNAL_ERROR", str(exc), 500)
 
@@ -37,6 +57,14 @@ def get_articles_by_concept():
 @bp.route("/articles_by_multiple_concepts", methods=["GET"])
 @jwt_required()
 def get_articles_by_multiple_concepts():
+    """
+    여러 개념을 모두 포함하는 기사 목록 검색
+
+    Query Parameters:
+        concepts (str): 쉼표로 구분한 개념 이름 (필수)
+        limit (int): 페이지당 항목 수 (기본값: 20, 최대: 50)
+        cursor (str): 이전 응답의 pagination.next_cursor (없으면 첫 페이지)
+    """
     concepts_param = request.args.get("concepts", "")
     if not concepts_param:
         raise ValidationError("concepts 파라미터는 최소 하나의 개념을 포함해야 합니다.", "concepts")
@@ -45,13 +73,27 @@ def get_articles_by_multiple_concepts():
     if not concept_names:
         raise ValidationError("concepts 파라미터가 유효하지 않습니다.", "concepts")
 
+    limit = validate_limit(
+        request.args.get("limit"),
+        default=SearchService.DEFAULT_PAGE_SIZE,
+        max_limit=SearchService.MAX_PAGE_SIZE
+    )
+    cursor = request.args.get("cursor") or None
+
     try:
-        articles = SearchService.get_articles_by_multiple_concepts(concept_names)
-        return success_response({
-            "concepts": concept_names,
-            "total_results": len(articles),
-            "articles": articles
-        })
+        articles, next_cursor, total = SearchService.get_articles_by_multiple_concepts(
+            concept_names, limit, cursor
+        )
+        return cursor_paginated_response(
+            articles,
+            next_cursor,
+            limit,
+            total,
+            items_key="articles",
+            extra={"concepts": concept_names, "total_results": total}
+        )
+    except ValidationError:
+        raise
     except Exception as exc:
         return error_response("INTERNAL_ERROR", str(exc), 500)
 
@@ -10,6 +10,8 @@ from app.services.concept_service import ConceptService
 from app.services.collection_service import CollectionService
 from app.services.graph_service import GraphService
 from app.services.etl_service import ETLService
+from app.services.cooccurrence_service import CooccurrenceService
+from app.services.adjacency_service import AdjacencyService
 
 __all__ = [
     'AuthService',
@@ -17,6 +19,8 @@ __all__ = [
     'ConceptService',
     'CollectionService',
     'GraphService',
-    'ETLService'
+    'ETLService',
+    'CooccurrenceService',
+    'AdjacencyService'
 ]
 
@@ -0,0 +1,215 @@
+"""
+개념 이웃 목록 서비스
+
+Concept_Adjacency(개념별 상위 이웃 목록)를 관리하고 조회합니다.
+관계를 쓰는 쪽은 refresh()로 바뀐 개념의 행을 다시 계산하고,
+읽는 쪽은 get_adjacency()로 개념 ID 기본 키 조회만 합니다.
+
+방향별 상위 N개로 잘린 목록이므로 개념별 가장 강한 이웃만 필요한 곳(검색 결과의 친척 개념)에서만 사용합니다.
+모든 관계가 필요한 곳(그래프 캐시 빌더, Concept.to_dict(include_relations=True),
+find_new_strong_connections)은 Concept_Relation을 직접 조회합니다.
+
+환경 변수:
+    CONCEPT_ADJACENCY_TOP_N   방향별로 저장할 최대 이웃 수 (기본값: 50)
+"""
+
+import os
+from datetime import datetime
+from typing import Dict, Iterable, List
+
+from sqlalchemy import delete, func, insert, literal_column, select, union_all
+
+from app.extensions import db
+from app.models.concept import Concept
+from app.models.relations import Concept_Adjacency, Concept_Relation
+
+
+ADJACENCY_TOP_N = int(os.getenv('CONCEPT_ADJACENCY_TOP_N', 50))
+# 한 번에 다시 계산하는 개념 수 (IN 목록 길이)
+REFRESH_BATCH_SIZE = 500
+
+
+class AdjacencyService:
+    """개념 이웃 목록 관련 비즈니스 로직"""
+
+    @staticmethod
+    def get_adjacency(concept_ids: Iterable[int]) -> Dict[int, Dict[str, List[Dict]]]:
+        """
+        개념별 이웃 목록 조회 (기본 키 IN 쿼리 1회)
+
+        아직 계산되지 않은 개념은 Concept_Relation에서 계산해 반환합니다. (저장하지 않음)
+
+        Args:
+            concept_ids (Iterable[int]): 개념 ID 목록
+
+        Returns:
+            dict: {concept_id: {'out': [...], 'in': [...]}}
+                각 이웃은 {'concept_id', 'name', 'relation_type', 'strength', 'relation_id'}
+                (방향별 강도 내림차순, 동점이면 relation_id 오름차순, 최대 ADJACENCY_TOP_N개)
+        """
+        concept_ids = list(dict.fromkeys(concept_ids))
+        if not concept_ids:
+            return {}
+
+        rows = db.session.query(
+            Concept_Adjacency.concept_id,
+            Concept_Adjacency.out_neighbours,
+            Concept_Adjacency.in_neighbours
+        ).filter(Concept_Adjacency.concept_id.in_(concept_ids)).all()
+
+        adjacency = {
+            concept_id: {'out': out_neighbours, 'in': in_neighbours}
+            for concept_id, out_neighbours, in_neighbours in rows
+        }
+
+        missing = [concept_id for concept_id in concept_ids if concept_id not in adjacency]
+        if missing:
+            adjacency.update(AdjacencyService._compute(missing))
+
+        return adjacency
+
+    @staticmethod
+    def get_neighbours(concept_id: int, min_strength: int = 0) -> List[Dict]:
+        """
+        한 개념의 양방향 이웃 (강도 내림차순, 같은 이웃은 더 강한 관계 하나만)
+
+        Args:
+            concept_id (int): 개념 ID
+            min_strength (int): 최소 관계 강도
+
+        Returns:
+            list: [{'concept_id', 'name', 'relation_type', 'strength', 'relation_id'}, ...]
+        """
+        entry = AdjacencyService.get_adjacency([concept_id]).get(concept_id, {'out': [], 'in': []})
+        merged = {}
+        for neighbour in entry['out'] + entry['in']:
+            if neighbour['strength'] < min_strength:
+                continue
+            current = merged.get(neighbour['concept_id'])
+            if current is None or neighbour['strength'] > current['strength']:
+                merged[neighbour['concept_id']] = neighbour
+
+        return sorted(merged.values(), key=lambda n: (-n['strength'], n['relation_id']))
+
+    @staticmethod
+    def refresh(concept_ids: Iterable[int]) -> int:
+        """
+        개념들의 이웃 목록을 다시 계산하여 저장 (커밋은 호출자가 수행)
+
+        관계를 추가하거나 강도를 바꾼 트랜잭션 안에서 양 끝 개념 ID로 호출합니다.
+
+        Args:
+            concept_ids (Iterable[int]): 다시 계산할 개념 ID
+
+        Returns:
+            int: 저장한 행 수
+        """
+        concept_ids = sorted(set(concept_ids))
+        now = datetime.utcnow()
+
+        for start in range(0, len(concept_ids), REFRESH_BATCH_SIZE):
+            batch = concept_ids[start:start + REFRESH_BATCH_SIZE]
+            adjacency = AdjacencyService._compute(batch)
+
+            db.session.execute(
+                delete(Concept_Adjacency).where(Concept_Adjacency.concept_id.in_(batch))
+            )
+            db.session.execute(insert(Concept_Adjacency), [
+                {
+                    'concept_id': concept_id,
+                    'out_neighbours': adjacency[concept_id]['out'],
+                    'in_neighbours': adjacency[concept_id]['in'],
+                    'updated_at': now
+                }
+                for concept_id in batch
+            ])
+
+        return len(concept_ids)
+
+    @staticmethod
+    def needs_rebuild() -> bool:
+        """관계는 있는데 이웃 목록이 하나도 없는지 여부 (마이그레이션 직후 채우기 전 상태)"""
+        return db.session.query(
+            select(Concept_Relation.relation_id).exists()
+            & ~select(Concept_Adjacency.concept_id).exists()
+        ).scalar()
+
+    @staticmethod
+    def rebuild_all(batch_size: int = REFRESH_BATCH_SIZE) -> int:
+        """
+        모든 개념의 이웃 목록 재계산 (concept_id 키셋 배치, 배치마다 커밋)
+
+        Returns:
+            int: 저장한 행 수
+        """
+        written = 0
+        last_id = 0
+        while True:
+            batch = [
+                concept_id for (concept_id,) in db.session.query(Concept.concept_id).filter(
+                    Concept.concept_id > last_id
+                ).order_by(Concept.concept_id).limit(batch_size).all()
+            ]
+            if not batch:
+                break
+
+            written += AdjacencyService.refresh(batch)
+            db.session.commit()
+            last_id = batch[-1]
+
+        return written
+
+    @staticmethod
+    def _compute(concept_ids: List[int]) -> Dict[int, Dict[str, List[Dict]]]:
+        """
+        Concept_Relation에서 개념별 방향별 상위 N개 이웃 계산 (UNION ALL + ROW_NUMBER() 쿼리 1회)
+        """
+        def direction(name, anchor, other):
+            return select(
+                anchor.label('anchor_id'),
+                other.label('other_id'),
+                literal_column(f"'{name}'").label('direction'),
+                Concept_Relation.relation_id,
+                Concept_Relation.relation_type,
+                Concept_Relation.strength
+            ).where(anchor.in_(concept_ids))
+
+        edges = union_all(
+            direction('out', Concept_Relation.from_concept_id, Concept_Relation.to_concept_id),
+            direction('in', Concept_Relation.to_concept_id, Concept_Relation.from_concept_id)
+        ).subquery('edges')
+
+        ranked = select(
+            edges,
+            func.row_number().over(
+                partition_by=(edges.c.anchor_id, edges.c.direction),
+                order_by=(edges.c.strength.desc(), edges.c.relation_id)
+            ).label('neighbour_rank')
+        ).subquery('ranked')
+
+        rows = db.session.execute(
+            select(
+                ranked.c.anchor_id,
+                ranked.c.direction,
+                ranked.c.other_id,
+                Concept.name,
+                ranked.c.relation_type,
+                ranked.c.strength,
+                ranked.c.relation_id
+            )
+            .join(Concept, Concept.concept_id == ranked.c.other_id)
+            .where(ranked.c.neighbour_rank <= ADJACENCY_TOP_N)
+            .order_by(ranked.c.anchor_id, ranked.c.direction, ranked.c.neighbour_rank)
+        ).all()
+
+        adjacency = {concept_id: {'out': [], 'in': []} for concept_id in concept_ids}
+        for anchor_id, direction_name, other_id, name, relation_type, strength, relation_id in rows:
+            adjacency[anchor_id][direction_name].append({
+                'concept_id': other_id,
+                'name': name,
+                'relation_type': relation_type,
+                'strength': strength,
+                'relation_id': relation_id
+            })
+
+        return adjacency
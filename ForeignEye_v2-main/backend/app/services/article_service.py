@@ -4,9 +4,27 @@
 기사 관련 비즈니스 로직을 처리합니다.
 """
 
+import os
+
+from sqlalchemy import func
+
 from app.extensions import db
 from app.models.article import Article
+from app.models.concept import Concept
+from app.models.relations import Article_Concept
+from app.utils.cache import TTLCache
 from app.utils.exceptions import NotFoundError
+from app.utils.pagination import keyset_paginate
+
+
+# 목록 응답에 포함하는 미리보기 개념 수 (Article.to_dict(include_preview=True)와 동일)
+PREVIEW_CONCEPT_LIMIT = 3
+
+# 목록/검색 전체 개수 캐시: {key: (MAX(article_id), count)}
+_article_count_cache = TTLCache(
+    ttl=int(os.getenv('ARTICLE_COUNT_CACHE_TTL', 300)),
+    max_entries=int(os.getenv('ARTICLE_COUNT_CACHE_MAX_ENTRIES', 10000))
+)
 
 
 class ArticleService:
@@ -15,7 +33,7 @@ class ArticleService:
     @staticmethod
     def get_articles(page=1, limit=10, sort='created_at', order='desc'):
         """
-        기사 목록 조회
+        기사 목록 조회 (OFFSET 페이지)
         
         Args:
             page (int): 페이지 번호 (1부터 시작)
@@ -28,20 +46,162 @@ class ArticleService:
         """
         query = Article.query
         
-        # 정렬
+        # 정렬 (동률은 article_id로 고정해 페이지 간 순서를 안정화)
         sort_column = getattr(Article, sort, Article.created_at)
         if order == 'desc':
-            query = query.order_by(sort_column.desc())
+            query = query.order_by(sort_column.desc(), Article.article_id.desc())
         else:
-            query = query.order_by(sort_column.asc())
+            query = query.order_by(sort_column.asc(), Article.article_id.asc())
         
         # 페이지네이션
         offset = (page - 1) * limit
         articles = query.offset(offset).limit(limit).all()
-        total = query.count()
+        total = ArticleService.count_all_articles()
         
         return articles, total
     
+    @staticmethod
+    def get_articles_keyset(limit=10, cursor=None, sort='created_at', order='desc'):
+        """
+        기사 목록 조회 (키셋 페이지)
+        
+        OFFSET 없이 (정렬 컬럼, article_id) 기준으로 이어서 읽으므로
+        페이지 깊이와 무관하게 일정한 비용으로 조회합니다.
+        
+        Args:
+            limit (int): 페이지당 항목 수
+            cursor (str, optional): 이전 페이지의 next_cursor. None이면 첫 페이지
+            sort (str): 정렬 기준 ('created_at', 'title')
+            order (str): 정렬 순서 ('asc', 'desc')
+            
+        Returns:
+            tuple: (기사 리스트, next_cursor 또는 None, 전체 개수)
+            
+        Raises:
+            ValidationError: 형식이 올바르지 않은 커서
+        """
+        sort_column = getattr(Article, sort, Article.created_at)
+        articles, next_cursor = keyset_paginate(
+            Article.query,
+            sort_column,
+            Article.article_id,
+            limit,
+            cursor,
+            descending=(order == 'desc')
+        )
+        total = ArticleService.count_all_articles()
+        
+        return articles, next_cursor, total
+    
+    @staticmethod
+    def count_all_articles():
+        """
+        전체 기사 수 (캐시)
+        
+        Returns:
+            int: 전체 기사 수
+        """
+        return ArticleService.count_articles_cached(
+            ('all',),
+            lambda: db.session.query(func.count(Article.article_id)).scalar()
+        )
+    
+    @staticmethod
+    def count_articles_cached(key, count_func):
+        """
+        기사 전체 개수를 캐시에서 조회 (없거나 무효화되었으면 count_func로 계산)
+        
+        기사는 추가만 되고 개념 연결도 기사 적재 시점에 함께 만들어지므로,
+        캐시된 값은 MAX(article_id)가 바뀌지 않는 동안 유효합니다.
+        MAX(article_id)는 PK 인덱스 끝만 읽으므로 COUNT보다 훨씬 저렴하며,
+        삭제 등 그 밖의 변경은 TTL이 지나면 반영됩니다.
+        (ETL은 다른 프로세스에서 적재하므로 명시적 무효화 대신 MAX(article_id) 비교에 의존)
+        
+        Args:
+            key (Hashable): 개수의 범위를 나타내는 키 (예: ('concept', 12))
+            count_func (callable): 실제 개수를 계산하는 함수
+            
+        Returns:
+            int: 전체 개수
+        """
+        max_article_id = db.session.query(func.max(Article.article_id)).scalar() or 0
+        
+        cached = _article_count_cache.get(key)
+        if cached is not None and cached[0] == max_article_id:
+            return cached[1]
+        
+        total = count_func()
+        _article_count_cache.set(key, (max_article_id, total))
+        return total
+    
+    @staticmethod
+    def get_preview_concepts_bulk(article_ids):
+        """
+        여러 기사의 개념 수와 미리보기 개념을 쿼리 1회로 조회
+        
+        기사마다 article.concepts → ac.concept를 지연 로딩하던 N+1 쿼리를 대체합니다.
+        
+        Args:
+            article_ids (Iterable[int]): 기사 ID 목록
+            
+        Returns:
+            dict: {article_id: {'concept_count': int, 'preview_concepts': [{'concept_id', 'name'}, ...]}}
+        """
+        previews = {
+            article_id: {'concept_count': 0, 'preview_concepts': []}
+            for article_id in article_ids
+        }
+        if not previews:
+            return previews
+        
+        rows = db.session.query(
+            Article_Concept.article_id,
+            Concept.concept_id,
+            Concept.name
+        ).join(
+            Concept, Concept.concept_id == Article_Concept.concept_id
+        ).filter(
+            Article_Concept.article_id.in_(list(previews))
+        ).order_by(
+            # 기존 지연 로딩 결과와 같은 순서 (idx_article_concept 순서)
+            Article_Concept.article_id,
+            Article_Concept.concept_id
+        ).all()
+        
+        for article_id, concept_id, name in rows:
+            preview = previews[article_id]
+            preview['concept_count'] += 1
+            if len(preview['preview_concepts']) < PREVIEW_CONCEPT_LIMIT:
+                preview['preview_concepts'].append({
+                    'concept_id': concept_id,
+                    'name': name
+                })
+        
+        return previews
+    
+    @staticmethod
+    def serialize_articles_with_preview(articles):
+        """
+        기사 목록을 미리보기 개념과 함께 직렬화 (결과 수와 무관하게 추가 쿼리 1회)
+        
+        Args:
+            articles (list): Article 객체 리스트
+            
+        Returns:
+            list: article.to_dict(include_preview=True)와 같은 형식의 dict 리스트
+        """
+        previews = ArticleService.get_preview_concepts_bulk(
+            [article.article_id for article in articles]
+        )
+        
+        serialized = []
+        for article in articles:
+            data = article.to_dict()
+            data.update(previews[article.article_id])
+            serialized.append(data)
+        
+        return serialized
+    
     @staticmethod
     def get_article_by_id(article_id):
         """
@@ -4,10 +4,13 @@
 사용자의 개념 수집 관련 비즈니스 로직을 처리합니다.
 """
 
+from sqlalchemy import select
+
 from app.extensions import db
 from app.models.concept import Concept
 from app.models.relations import User_Collection, Concept_Relation
 from app.utils.exceptions import NotFoundError, DuplicateEntryError
+from app.utils.collection_cache import get_collection_cache
 
 
 class CollectionService:
@@ -55,6 +58,11 @@ class CollectionService:
         db.session.add(collection)
         db.session.commit()
         
+        # 수집 상태 캐시 write-through
+        cache = get_collection_cache()
+        if cache:
+            cache.add(user_id, concept_id)
+        
         # 새로운 강한 연결 찾기
         new_connections = CollectionService.find_new_strong_connections(
             user_id,
@@ -162,8 +170,56 @@ class CollectionService:
         db.session.delete(collection)
         db.session.commit()
         
+        # 수집 상태 캐시 write-through
+        cache = get_collection_cache()
+        if cache:
+            cache.remove(user_id, concept_id)
+        
         return concept_name
     
+    @staticmethod
+    def get_collected_concept_ids_among(user_id, concept_ids):
+        """
+        주어진 개념 중 사용자가 수집한 개념 ID 집합 조회
+        
+        수집 상태 캐시를 우선 사용하므로 비용이 컬렉션 크기가 아닌 concept_ids 수에 비례합니다.
+        캐시되지 않은 사용자는 concept_id 컬럼만 조회하여 캐시에 적재합니다.
+        (조회하는 동안 수집/취소가 커밋되면 적재하지 않고 다음 조회에서 다시 읽음)
+        
+        Args:
+            user_id (int): 사용자 ID
+            concept_ids (Iterable[int]): 확인할 개념 ID들 (예: 그래프 노드 ID)
+            
+        Returns:
+            set: 수집한 개념 ID 집합
+        """
+        concept_ids = list(concept_ids)
+        cache = get_collection_cache()
+        
+        if not cache:
+            all_collected_ids = {
+                row[0] for row in
+                db.session.query(User_Collection.concept_id)
+                .filter(User_Collection.user_id == user_id)
+                .all()
+            }
+            return all_collected_ids.intersection(concept_ids)
+        
+        collected = cache.collected_among(user_id, concept_ids)
+        if collected is not None:
+            return collected
+        
+        # epoch 토큰을 먼저 받고, 요청 세션의 이전 스냅샷이 아닌 새 트랜잭션에서 읽음
+        # (그 사이 수집/취소가 커밋되면 epoch가 바뀌어 store()가 저장하지 않음)
+        token = cache.begin_fill(user_id)
+        with db.engine.connect() as connection:
+            all_collected_ids = set(connection.execute(
+                select(User_Collection.concept_id).where(User_Collection.user_id == user_id)
+            ).scalars())
+        cache.store(user_id, all_collected_ids, token)
+        
+        return all_collected_ids.intersection(concept_ids)
+    
     @staticmethod
     def get_user_collections(user_id, sort='collected_at', order='desc'):
         """
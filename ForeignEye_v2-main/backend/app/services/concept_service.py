@@ -4,14 +4,74 @@
 개념 관련 비즈니스 로직을 처리합니다.
 """
 
+import os
+import threading
+import time
+
+from flask import current_app
+
 from app.extensions import db
 from app.models.concept import Concept
+from app.utils.cache import TTLCache
+from app.utils.concept_search_index import concept_search_index
 from app.utils.exceptions import NotFoundError
 
 
+# 그래프 노드 하이드레이션용 개념 요약 캐시 (concept_id -> (name, description_ko, real_world_examples_ko))
+_concept_summary_cache = TTLCache(
+    ttl=int(os.getenv('CONCEPT_CACHE_TTL', 300)),
+    max_entries=int(os.getenv('CONCEPT_CACHE_MAX_ENTRIES', 50000))
+)
+
+# 검색 인덱스 갱신 주기 (초): 다른 프로세스(ETL/Celery)가 만든 개념은 증분 주기마다 반영,
+# 삭제/설명 변경은 전체 재구축 주기마다 반영
+CONCEPT_SEARCH_REFRESH_INTERVAL = float(os.getenv('CONCEPT_SEARCH_REFRESH_INTERVAL', 30))
+CONCEPT_SEARCH_REBUILD_INTERVAL = float(os.getenv('CONCEPT_SEARCH_REBUILD_INTERVAL', 3600))
+
+# 인덱스 구축/갱신은 프로세스당 하나만 실행 (요청 스레드는 기다리지 않고 기존 인덱스로 검색)
+_search_index_lock = threading.Lock()
+
+
 class ConceptService:
     """개념 관련 비즈니스 로직"""
     
+    @staticmethod
+    def get_concept_summaries(concept_ids):
+        """
+        개념 요약 일괄 조회 (프로세스 공유 TTL 캐시 + 미스만 IN 쿼리 1회)
+        
+        압축 저장된 그래프 캐시를 읽을 때 노드의 이름/설명을 채우는 데 사용합니다.
+        
+        Args:
+            concept_ids (Iterable[int]): 개념 ID 목록
+            
+        Returns:
+            dict: {concept_id: (name, description_ko, real_world_examples_ko)} (없는 개념은 제외)
+        """
+        summaries = {}
+        missing = []
+        for concept_id in set(concept_ids):
+            summary = _concept_summary_cache.get(concept_id)
+            if summary is None:
+                missing.append(concept_id)
+            else:
+                summaries[concept_id] = summary
+        
+        if missing:
+            rows = db.session.query(
+                Concept.concept_id,
+                Concept.name,
+                Concept.description_ko,
+                Concept.real_world_examples_ko
+            ).filter(Concept.concept_id.in_(missing)).all()
+            
+            for concept_id, name, description_ko, examples in rows:
+                summary = (name, description_ko, examples)
+                _concept_summary_cache.set(concept_id, summary)
+                summaries[concept_id] = summary
+        
+        return summaries
+    
     @staticmethod
     def get_concept_by_id(concept_id, include_relations=False, include_articles=False):
         """
@@ -38,20 +98,106 @@ class ConceptService:
     @staticmethod
     def search_concepts(query, limit=10):
         """
-        개념 검색
+        개념 검색 (이름/별칭/설명 관련도 순)
+        
+        메모리 검색 인덱스로 후보를 고른 뒤 결과 개념만 PK로 조회합니다.
+        인덱스가 백그라운드에서 처음 구축되는 동안에는 이름 LIKE 검색으로 대체합니다.
         
         Args:
             query (str): 검색어
             limit (int): 결과 수 제한
             
         Returns:
-            list: 개념 객체 리스트
+            list: 개념 객체 리스트 (관련도 내림차순)
         """
-        concepts = Concept.query.filter(
-            Concept.name.like(f'%{query}%')
-        ).limit(limit).all()
+        ConceptService.refresh_search_index()
+        if not concept_search_index.is_built:
+            return Concept.query.filter(
+                Concept.name.like(f'%{query}%')
+            ).limit(limit).all()
         
-        return concepts
+        concept_ids = concept_search_index.search(query, limit)
+        if not concept_ids:
+            return []
+        
+        concepts = Concept.query.filter(Concept.concept_id.in_(concept_ids)).all()
+        by_id = {concept.concept_id: concept for concept in concepts}
+        
+        # 인덱스 반영 이후 삭제된 개념은 제외
+        return [by_id[concept_id] for concept_id in concept_ids if concept_id in by_id]
+    
+    @staticmethod
+    def refresh_search_index(force=False):
+        """
+        개념 검색 인덱스 구축/갱신 (프로세스당 한 번에 하나만 실행)
+        
+        - 구축 전이거나 재구축 주기가 지났으면 백그라운드 스레드에서 전체 재구축
+          (재구축 중에는 기존 인덱스로 검색)
+        - 증분 주기가 지났으면 색인된 최대 ID 이후의 개념만 추가 (PK 범위 조회)
+        - 다른 스레드가 이미 구축/갱신 중이면 기다리지 않고 건너뜀
+        
+        Args:
+            force (bool): 주기와 무관하게 현재 스레드에서 전체 재구축 (진행 중인 구축을 기다림)
+        """
+        if force:
+            with _search_index_lock:
+                ConceptService._rebuild_search_index()
+            return
+        
+        now = time.monotonic()
+        needs_rebuild = not concept_search_index.is_built or \
+            now - concept_search_index.built_at >= CONCEPT_SEARCH_REBUILD_INTERVAL
+        if not needs_rebuild and now - concept_search_index.refreshed_at < CONCEPT_SEARCH_REFRESH_INTERVAL:
+            return
+        
+        if not _search_index_lock.acquire(blocking=False):
+            return
+        
+        if needs_rebuild:
+            # 잠금은 구축 스레드가 끝날 때 해제
+            threading.Thread(
+                target=ConceptService._rebuild_search_index_in_background,
+                args=(current_app._get_current_object(),),
+                name='concept-search-index',
+                daemon=True
+            ).start()
+            return
+        
+        try:
+            rows = db.session.query(
+                Concept.concept_id,
+                Concept.name,
+                Concept.description_ko
+            ).filter(
+                Concept.concept_id > concept_search_index.max_concept_id
+            ).all()
+            concept_search_index.apply_delta(rows)
+        finally:
+            _search_index_lock.release()
+    
+    @staticmethod
+    def _rebuild_search_index():
+        """전체 개념으로 검색 인덱스 재구축 (호출자가 _search_index_lock 보유)"""
+        rows = db.session.query(
+            Concept.concept_id,
+            Concept.name,
+            Concept.description_ko
+        ).all()
+        concept_search_index.rebuild(rows)
+    
+    @staticmethod
+    def _rebuild_search_index_in_background(app):
+        """백그라운드 스레드 본문 (실패하면 다음 검색 요청이 다시 시도)"""
+        try:
+            with app.app_context():
+                try:
+                    ConceptService._rebuild_search_index()
+                except Exception as e:
+                    app.logger.warning(f'개념 검색 인덱스 구축 실패: {e}')
+                finally:
+                    db.session.remove()
+        finally:
+            _search_index_lock.release()
     
     @staticmethod
     def create_concept(name, description_ko, real_world_examples_ko=None):
@@ -75,6 +221,8 @@ class ConceptService:
         db.session.add(concept)
         db.session.commit()
         
+        concept_search_index.add([(concept.concept_id, concept.name, concept.description_ko)])
+        
         return concept
     
     @staticmethod
@@ -0,0 +1,90 @@
+"""
+공동 등장 서비스
+
+Concept_Cooccurrence(기사 공동 등장 통계)를 개념 간 관계 소스로 제공합니다.
+LLM 관계가 없는 개념도 실제 기사에서 함께 언급된 이웃을 인덱스 조회만으로 얻을 수 있습니다.
+(현재 소비자: run_relations_etl의 관계 발견 청크 구성)
+"""
+
+from typing import Dict, Iterable, List, Optional
+
+from sqlalchemy import func, select, union_all
+
+from app.extensions import db
+from app.models.concept import Concept
+from app.models.relations import Concept_Cooccurrence
+
+
+class CooccurrenceService:
+    """공동 등장 관련 비즈니스 로직"""
+
+    @staticmethod
+    def get_neighbours(concept_ids: Iterable[int], limit: int = 10, min_count: int = 1,
+                       min_pmi: Optional[float] = None) -> Dict[int, List[Dict]]:
+        """
+        개념별 공동 등장 이웃 (양방향, 개념별 상위 limit개를 ROW_NUMBER()로 DB에서 자름)
+
+        Args:
+            concept_ids (Iterable[int]): 기준 개념 ID
+            limit (int): 개념당 최대 이웃 수
+            min_count (int): 최소 공동 등장 기사 수
+            min_pmi (float, optional): 최소 PMI (None이면 필터 없음)
+
+        Returns:
+            dict: {concept_id: [{'concept_id', 'name', 'article_count', 'pmi'}, ...]}
+                (기사 수 내림차순, 동점이면 PMI 내림차순, 이웃 ID 오름차순)
+        """
+        concept_ids = list(dict.fromkeys(concept_ids))
+        neighbours = {concept_id: [] for concept_id in concept_ids}
+        if not concept_ids:
+            return neighbours
+
+        def direction(anchor, other):
+            query = select(
+                anchor.label('concept_id'),
+                other.label('neighbour_id'),
+                Concept_Cooccurrence.article_count,
+                Concept_Cooccurrence.pmi
+            ).where(
+                anchor.in_(concept_ids),
+                Concept_Cooccurrence.article_count >= min_count
+            )
+            if min_pmi is not None:
+                query = query.where(Concept_Cooccurrence.pmi >= min_pmi)
+            return query
+
+        edges = union_all(
+            direction(Concept_Cooccurrence.concept_a_id, Concept_Cooccurrence.concept_b_id),
+            direction(Concept_Cooccurrence.concept_b_id, Concept_Cooccurrence.concept_a_id)
+        ).subquery('edges')
+
+        ranked = select(
+            edges,
+            func.row_number().over(
+                partition_by=edges.c.concept_id,
+                order_by=(edges.c.article_count.desc(), edges.c.pmi.desc(), edges.c.neighbour_id)
+            ).label('neighbour_rank')
+        ).subquery('ranked')
+
+        rows = db.session.execute(
+            select(
+                ranked.c.concept_id,
+                ranked.c.neighbour_id,
+                ranked.c.article_count,
+                ranked.c.pmi,
+                Concept.name
+            )
+            .join(Concept, Concept.concept_id == ranked.c.neighbour_id)
+            .where(ranked.c.neighbour_rank <= limit)
+            .order_by(ranked.c.concept_id, ranked.c.neighbour_rank)
+        ).all()
+
+        for concept_id, neighbour_id, article_count, pmi, name in rows:
+            neighbours[concept_id].append({
+                'concept_id': neighbour_id,
+                'name': name,
+                'article_count': article_count,
+                'pmi': pmi
+            })
+
+        return neighbours
@@ -2,25 +2,61 @@
 ETL 서비스
 
 데이터 추출, 변환, 적재 관련 로직을 처리합니다.
-(현재는 그래프 캐시 생성 로직만 포함, 추후 확장 예정)
+(그래프 캐시 생성 및 증분 무효화/재생성 로직)
 """
 
+import os
+
+from sqlalchemy import bindparam, update
+
+from app.extensions import celery_app, db
+from app.models.article import Article
+from app.models.relations import Article_Concept
 from app.services.graph_service import GraphService
 
 
 class ETLService:
     """ETL 관련 비즈니스 로직"""
-    
+
+    @staticmethod
+    def schedule_task(task_name, **kwargs):
+        """
+        Celery 작업을 이름으로 예약 (ETL 단계 실패 시 백그라운드 재시도용)
+
+        브로커에 연결할 수 없어도 예외를 내지 않습니다.
+
+        Args:
+            task_name (str): app.celery_tasks에 등록된 작업 이름
+            **kwargs: 작업 인자
+
+        Returns:
+            bool: 예약 성공 여부
+        """
+        try:
+            celery_app.send_task(task_name, kwargs=kwargs)
+            print(f"  ⟳ Scheduled background task '{task_name}'")
+            return True
+        except Exception as e:
+            print(f"  ! Could not schedule background task '{task_name}': {e}")
+            return False
+
+    @staticmethod
+    def has_stale_graph_caches():
+        """stale 표시된 기사가 하나라도 있는지 여부"""
+        return db.session.query(
+            Article.query.filter(Article.graph_cache_stale.is_(True)).exists()
+        ).scalar()
+
     @staticmethod
     def build_graph_cache_for_article(article_id, min_strength=3, max_secondary_nodes=15):
         """
         기사의 지식 그래프 캐시 생성 (GraphService 위임)
-        
+
         Args:
             article_id (int): 기사 ID
             min_strength (int): 최소 관계 강도
             max_secondary_nodes (int): 최대 2차 노드 수
-            
+
         Returns:
             dict: 그래프 데이터
         """
@@ -30,3 +66,176 @@ class ETLService:
             max_secondary_nodes=max_secondary_nodes
         )
 
+    @staticmethod
+    def precompute_graph_caches(article_ids, batch_size=None):
+        """
+        여러 기사의 그래프 캐시를 집합 단위로 계산하여 저장 (ETL 적재 후 단계)
+
+        배치마다 GraphService.build_graph_caches_bulk로 한 번에 계산하고,
+        executemany UPDATE 한 번으로 graph_cache를 쓰면서 graph_cache_version을 올립니다.
+        stale 플래그는 건드리지 않습니다. (커밋은 배치마다 수행)
+
+        Args:
+            article_ids (Iterable[int]): 기사 ID 목록
+            batch_size (int, optional): 배치당 기사 수. None이면 GRAPH_CACHE_BATCH_SIZE 환경 변수 (기본값: 200)
+
+        Returns:
+            int: 캐시가 저장된 기사 수
+        """
+        article_ids = list(dict.fromkeys(article_ids))
+        batch_size = max(1, batch_size or int(os.getenv('GRAPH_CACHE_BATCH_SIZE', 200)))
+
+        article_table = Article.__table__
+        write_statement = (
+            update(article_table)
+            .where(article_table.c.article_id == bindparam('b_article_id'))
+            .values(
+                graph_cache=bindparam('b_graph_cache'),
+                graph_cache_version=article_table.c.graph_cache_version + 1
+            )
+        )
+
+        written = 0
+        for start in range(0, len(article_ids), batch_size):
+            batch = article_ids[start:start + batch_size]
+            graphs = GraphService.build_graph_caches_bulk(batch)
+            db.session.execute(write_statement, [
+                {'b_article_id': article_id, 'b_graph_cache': Article.serialize_graph(graph_data)}
+                for article_id, graph_data in graphs.items()
+            ])
+            db.session.commit()
+            written += len(graphs)
+
+        return written
+
+    @staticmethod
+    def backfill_graph_caches(batch_size=None):
+        """
+        graph_cache가 없는 모든 기사의 그래프 캐시 생성 (1회성 백필, 재실행 가능)
+
+        사전 계산 단계가 생기기 전에 적재됐거나 사전 계산이 실패한 기사를 기사 ID 키셋 배치로 채웁니다.
+
+        Args:
+            batch_size (int, optional): 배치당 기사 수. None이면 GRAPH_CACHE_BATCH_SIZE 환경 변수 (기본값: 200)
+
+        Returns:
+            int: 캐시가 저장된 기사 수
+        """
+        batch_size = max(1, batch_size or int(os.getenv('GRAPH_CACHE_BATCH_SIZE', 200)))
+
+        written = 0
+        last_id = 0
+        while True:
+            batch = [
+                article_id for (article_id,) in db.session.query(Article.article_id).filter(
+                    Article.article_id > last_id,
+                    Article.graph_cache.is_(None)
+                ).order_by(Article.article_id).limit(batch_size).all()
+            ]
+            if not batch:
+                break
+
+            written += ETLService.precompute_graph_caches(batch, batch_size=batch_size)
+            last_id = batch[-1]
+
+        return written
+
+    @staticmethod
+    def mark_graph_caches_stale(concept_ids):
+        """
+        관계가 바뀐 개념과 Article_Concept로 연결된 기사들의 그래프 캐시를 stale로 표시
+
+        기존 graph_cache는 그대로 두므로 재생성 전까지 독자는 이전 버전을 계속 봅니다.
+        이미 stale인 기사도 graph_cache_version을 올려, 진행 중인 재생성이 이 변경 이전 그래프로
+        플래그를 내리지 못하게 합니다. (커밋은 호출자가 수행)
+
+        Args:
+            concept_ids (Iterable[int]): 관계가 추가/변경된 개념 ID들 (관계의 양 끝점)
+
+        Returns:
+            int: stale로 표시된 기사 수
+        """
+        concept_ids = set(concept_ids)
+        if not concept_ids:
+            return 0
+
+        affected_articles = (
+            db.session.query(Article_Concept.article_id)
+            .filter(Article_Concept.concept_id.in_(concept_ids))
+            .distinct()
+            .scalar_subquery()
+        )
+        result = db.session.execute(
+            update(Article)
+            .where(Article.article_id.in_(affected_articles))
+            .values(
+                graph_cache_stale=True,
+                graph_cache_version=Article.graph_cache_version + 1
+            )
+            .execution_options(synchronize_session=False)
+        )
+        return result.rowcount
+
+    @staticmethod
+    def rebuild_stale_graph_caches(batch_size=50, max_batches=None):
+        """
+        stale 기사들의 그래프 캐시를 배치 단위로 재생성
+
+        배치마다 stale 기사의 graph_cache_version을 읽어 두고 그래프를 만든 뒤,
+        캐시 저장과 stale 해제를 한 UPDATE(WHERE graph_cache_version = 읽은 값)로 수행합니다.
+        - 재생성이 실패하면 플래그가 그대로 남아 다음 실행에서 다시 처리됩니다.
+        - 재생성 도중 다시 stale로 표시된 기사(버전 증가)는 쓰지 않고 남겨 다음 배치에서 재처리합니다.
+
+        Args:
+            batch_size (int): 배치당 기사 수
+            max_batches (int, optional): 최대 배치 수 (None이면 stale 기사가 없을 때까지)
+
+        Returns:
+            int: 재생성된 기사 수
+        """
+        article_table = Article.__table__
+        write_statement = (
+            update(article_table)
+            .where(article_table.c.article_id == bindparam('b_article_id'))
+            .where(article_table.c.graph_cache_version == bindparam('b_seen_version'))
+            .values(
+                graph_cache=bindparam('b_graph_cache'),
+                graph_cache_stale=False,
+                graph_cache_version=article_table.c.graph_cache_version + 1
+            )
+        )
+
+        rebuilt = 0
+        batches = 0
+
+        while max_batches is None or batches < max_batches:
+            seen_versions = dict(
+                db.session.query(Article.article_id, Article.graph_cache_version)
+                .filter(Article.graph_cache_stale.is_(True))
+                .order_by(Article.article_id)
+                .limit(batch_size)
+                .all()
+            )
+            if not seen_versions:
+                break
+
+            try:
+                graphs = GraphService.build_graph_caches_bulk(list(seen_versions))
+                result = db.session.execute(write_statement, [
+                    {
+                        'b_article_id': article_id,
+                        'b_seen_version': seen_versions[article_id],
+                        'b_graph_cache': Article.serialize_graph(graph_data)
+                    }
+                    for article_id, graph_data in graphs.items()
+                ])
+                db.session.commit()
+            except Exception:
+                # 아무 기사의 플래그도 내리지 않았으므로 전부 stale로 남음
+                db.session.rollback()
+                raise
+
+            rebuilt += result.rowcount
+            batches += 1
+
+        return rebuilt
@@ -4,12 +4,28 @@
 지식 그래프 생성 및 관리 로직을 처리합니다.
 """
 
-import json
+import os
+import threading
+import time
+
+from flask import current_app
+
 from app.extensions import db
 from app.models.article import Article
 from app.models.concept import Concept
 from app.models.relations import Article_Concept, Concept_Relation, User_Collection
-from sqlalchemy.orm import aliased
+from app.services.collection_service import CollectionService
+from app.utils.graph_format import make_node
+from app.utils.cache import TTLCache
+from sqlalchemy import and_, case, func, literal_column, null, or_, select, union_all
+
+
+# Redis를 쓸 수 없을 때 기사별 캐시 생성 예약 중복 방지 (프로세스 로컬)
+_scheduled_builds = TTLCache(ttl=int(os.getenv('GRAPH_CACHE_SCHEDULE_TTL', 300)), max_entries=10000)
+_scheduled_builds_lock = threading.Lock()
+# Redis 오류 후 이 시각(time.monotonic)까지는 Redis를 시도하지 않음 (요청마다 소켓 타임아웃을 기다리지 않도록)
+_redis_retry_at = 0.0
+REDIS_RETRY_INTERVAL = float(os.getenv('GRAPH_CACHE_REDIS_RETRY_INTERVAL', 60))
 
 
 class GraphService:
@@ -40,28 +56,75 @@ class GraphService:
         
         # 2. 캐시된 그래프 확인
         if not article.graph_cache:
-            # 캐시가 없으면 즉시 생성
-            from app.services.etl_service import ETLService
-            graph_data = ETLService.build_graph_cache_for_article(article_id)
-            article.graph_cache = json.dumps(graph_data, ensure_ascii=False)
-            db.session.commit()
-        else:
-            # 캐시 파싱
-            try:
-                graph_data = json.loads(article.graph_cache)
-            except json.JSONDecodeError:
-                return {"nodes": [], "edges": []}
+            # 캐시는 ETL에서 사전 계산됨. 누락된 경우 요청 경로에서 만들지 않고 백그라운드로 예약
+            GraphService._schedule_graph_cache_build(article_id)
+            return {"nodes": [], "edges": []}
         
-        # 3. 사용자의 수집 상태 조회 (단 1회 쿼리)
-        user_collections = User_Collection.query.filter_by(user_id=user_id).all()
-        collected_concept_ids = {uc.concept_id for uc in user_collections}
+        # 파싱된 그래프는 프로세스 LRU에서 재사용하고, 노드를 수정해도 되는 복사본을 받음
+        graph_data = article.get_graph_cache()
+        
+        # 3. 그래프 노드 중 사용자가 수집한 개념만 조회 (수집 상태 캐시, 컬렉션 크기와 무관)
+        nodes = graph_data.get('nodes', [])
+        collected_concept_ids = CollectionService.get_collected_concept_ids_among(
+            user_id,
+            [node['id'] for node in nodes]
+        )
         
         # 4. 노드의 is_collected 플래그 업데이트 (메모리 상 O(N) 연산)
-        for node in graph_data.get('nodes', []):
+        for node in nodes:
             node['is_collected'] = node['id'] in collected_concept_ids
         
         return graph_data
     
+    @staticmethod
+    def _schedule_graph_cache_build(article_id):
+        """
+        누락된 그래프 캐시 생성을 Celery 작업으로 예약 (실패해도 요청은 계속 진행)
+        
+        같은 기사에 대한 예약은 GRAPH_CACHE_SCHEDULE_TTL(초, 기본값: 300) 동안 한 번만 보냅니다.
+        """
+        if not GraphService._claim_graph_cache_build(article_id):
+            return
+        
+        try:
+            from app.celery_tasks import precompute_graph_caches_task
+            precompute_graph_caches_task.delay([article_id])
+        except Exception as e:
+            current_app.logger.warning(
+                "Could not schedule graph cache build for article %s: %s", article_id, e
+            )
+    
+    @staticmethod
+    def _claim_graph_cache_build(article_id):
+        """
+        기사별 예약 키 선점 (Redis SET NX + TTL, Redis를 쓸 수 없으면 프로세스 로컬 TTL 캐시)
+        
+        Redis 오류가 나면 GRAPH_CACHE_REDIS_RETRY_INTERVAL(초, 기본값: 60) 동안은 Redis를 건너뜁니다.
+        
+        Returns:
+            bool: 이번 요청이 예약해야 하면 True
+        """
+        global _redis_retry_at
+        
+        ttl = int(os.getenv('GRAPH_CACHE_SCHEDULE_TTL', 300))
+        if time.monotonic() >= _redis_retry_at:
+            try:
+                from app.extensions import get_redis_client
+                return bool(get_redis_client().set(
+                    f"graph_cache_build:{article_id}", 1, nx=True, ex=ttl
+                ))
+            except Exception as e:
+                _redis_retry_at = time.monotonic() + REDIS_RETRY_INTERVAL
+                current_app.logger.warning(
+                    "Graph cache schedule lock unavailable for %ss, using local: %s", REDIS_RETRY_INTERVAL, e
+                )
+        
+        with _scheduled_builds_lock:
+            if _scheduled_builds.get(article_id):
+                return False
+            _scheduled_builds.set(article_id, True)
+            return True
+    
     @staticmethod
     def build_graph_cache_for_article(article_id, min_strength=3, max_secondary_nodes=15):
         """
@@ -79,113 +142,204 @@ class GraphService:
         Returns:
             dict: {'nodes': [...], 'edges': [...]} 형식의 그래프 데이터
         """
-        # 1. Primary 개념들 조회
-        primary_concepts = db.session.query(Concept).join(
-            Article_Concept,
-            Concept.concept_id == Article_Concept.concept_id
-        ).filter(
-            Article_Concept.article_id == article_id
-        ).all()
+        graphs = GraphService.build_graph_caches_bulk(
+            [article_id],
+            min_strength=min_strength,
+            max_secondary_nodes=max_secondary_nodes
+        )
+        return graphs.get(article_id, {"nodes": [], "edges": []})
+    
+    @staticmethod
+    def build_graph_caches_bulk(article_ids, min_strength=3, max_secondary_nodes=15):
+        """
+        여러 기사의 지식 그래프를 단일 쿼리로 한 번에 계산
         
-        primary_concept_ids = {c.concept_id for c in primary_concepts}
+        🚀 기사 수와 무관하게 UNION ALL + 윈도 함수 쿼리 1회만 사용합니다.
+        - (Primary) -> (Other) 관계를 pass 1, (Other) -> (Primary) 관계를 pass 2로 합치고
+          기사별 ROW_NUMBER(pass, 강도 내림차순, relation_id)로 순서를 매깁니다.
+        - 외부 개념은 처음 등장한 순서의 DENSE_RANK로 순위를 매겨
+          max_secondary_nodes 제한을 DB에서 적용합니다. (잘린 2차 노드의 엣지는 전송되지 않음)
+        - 노드 정보(Concept)는 Primary 행과 2차 노드가 처음 등장하는 행에만 조인합니다.
         
-        if not primary_concept_ids:
-            return {"nodes": [], "edges": []}
+        Args:
+            article_ids (Iterable[int]): 기사 ID 목록
+            min_strength (int): 최소 관계 강도 (기본값: 3)
+            max_secondary_nodes (int): 기사당 최대 2차 노드 수 (기본값: 15)
+            
+        Returns:
+            dict: {article_id: {'nodes': [...], 'edges': [...]}} (개념이 없는 기사는 빈 그래프)
+        """
+        article_ids = list(dict.fromkeys(article_ids))
+        graphs = {article_id: {"nodes": [], "edges": []} for article_id in article_ids}
+        if not article_ids:
+            return graphs
         
-        # 2. 관계 조회 (필터링 적용)
-        C1 = aliased(Concept)
-        C2 = aliased(Concept)
+        nodes_by_article = {article_id: {} for article_id in article_ids}
+        for row in db.session.execute(
+            GraphService._graph_rows_query(article_ids, min_strength, max_secondary_nodes)
+        ):
+            nodes_map = nodes_by_article[row.article_id]
+            
+            # Primary 행 또는 2차 노드가 처음 등장하는 행에만 개념 정보가 조인됨
+            if row.concept_id is not None and row.concept_id not in nodes_map:
+                if row.pass_no == 0:
+                    nodes_map[row.concept_id] = GraphService._primary_node(row)
+                else:
+                    nodes_map[row.concept_id] = GraphService._related_node(row, False)
+            
+            if row.pass_no != 0:
+                graphs[row.article_id]["edges"].append({
+                    "from": row.from_concept_id,
+                    "to": row.to_concept_id,
+                    "strength": row.strength
+                })
         
-        # Query 1: (Primary) -> (Other)
-        relations_query_1 = db.session.query(Concept_Relation, C2).join(
-            C2, Concept_Relation.to_concept_id == C2.concept_id
-        ).filter(
-            Concept_Relation.from_concept_id.in_(primary_concept_ids),
-            Concept_Relation.strength >= min_strength
-        ).order_by(Concept_Relation.strength.desc())
+        for article_id, nodes_map in nodes_by_article.items():
+            graphs[article_id]["nodes"] = list(nodes_map.values())
         
-        # Query 2: (Other) -> (Primary)
-        relations_query_2 = db.session.query(Concept_Relation, C1).join(
-            C1, Concept_Relation.from_concept_id == C1.concept_id
-        ).filter(
-            Concept_Relation.to_concept_id.in_(primary_concept_ids),
-            Concept_Relation.strength >= min_strength
-        ).order_by(Concept_Relation.strength.desc())
-        
-        # 3. 노드 및 엣지 구축
-        nodes_map = {}
-        edges_data = []
-        secondary_nodes_added = 0
-        
-        # 3a. Primary 노드 추가
-        for concept in primary_concepts:
-            nodes_map[concept.concept_id] = {
-                "id": concept.concept_id,
-                "label": concept.name,
-                "description": concept.description_ko,
-                "real_world_examples": concept.real_world_examples_ko or [],
-                "is_collected": False,  # 동적으로 업데이트됨
-                "is_primary": True,
-                "borderWidth": 4,
-                "color": {"border": "#007bff", "background": "#ffffff"},
-                "shape": "dot",
-                "size": 25
-            }
+        return graphs
+    
+    @staticmethod
+    def _graph_rows_query(article_ids, min_strength, max_secondary_nodes):
+        """
+        build_graph_caches_bulk용 단일 SELECT 구성
         
-        # 3b. 관계 처리 1: (Primary) -> (Other)
-        for relation, concept_to in relations_query_1.all():
-            if concept_to.concept_id not in nodes_map:
-                if concept_to.concept_id not in primary_concept_ids:
-                    if secondary_nodes_added >= max_secondary_nodes:
-                        continue
-                    secondary_nodes_added += 1
-                
-                nodes_map[concept_to.concept_id] = {
-                    "id": concept_to.concept_id,
-                    "label": concept_to.name,
-                    "description": concept_to.description_ko,
-                    "real_world_examples": concept_to.real_world_examples_ko or [],
-                    "is_collected": False,
-                    "is_primary": concept_to.concept_id in primary_concept_ids,
-                    "shape": "dot",
-                    "size": 15
-                }
-            
-            edges_data.append({
-                "from": relation.from_concept_id,
-                "to": relation.to_concept_id,
-                "strength": relation.strength
-            })
+        Returns:
+            Select: (article_id, pass_no, seq, from/to_concept_id, strength, 개념 컬럼) 행.
+                pass_no 0은 Primary 노드 행, 1/2는 엣지 행이며 (article_id, pass_no, seq) 순으로 정렬됨
+        """
+        primaries = (
+            select(Article_Concept.article_id, Article_Concept.concept_id)
+            .where(Article_Concept.article_id.in_(article_ids))
+            .distinct()
+            .cte('primaries')
+        )
         
-        # 3c. 관계 처리 2: (Other) -> (Primary)
-        for relation, concept_from in relations_query_2.all():
-            if concept_from.concept_id not in nodes_map:
-                if concept_from.concept_id not in primary_concept_ids:
-                    if secondary_nodes_added >= max_secondary_nodes:
-                        continue
-                    secondary_nodes_added += 1
-                
-                nodes_map[concept_from.concept_id] = {
-                    "id": concept_from.concept_id,
-                    "label": concept_from.name,
-                    "description": concept_from.description_ko,
-                    "real_world_examples": concept_from.real_world_examples_ko or [],
-                    "is_collected": False,
-                    "is_primary": concept_from.concept_id in primary_concept_ids,
-                    "shape": "dot",
-                    "size": 15
-                }
-            
-            edges_data.append({
-                "from": relation.from_concept_id,
-                "to": relation.to_concept_id,
-                "strength": relation.strength
-            })
+        def candidates(pass_no, anchor_column, other_column):
+            # anchor가 Primary인 관계 + 반대편 개념이 같은 기사의 Primary인지 여부
+            other_primary = primaries.alias(f'other_primary_{pass_no}')
+            return (
+                select(
+                    primaries.c.article_id,
+                    literal_column(str(pass_no)).label('pass_no'),
+                    Concept_Relation.relation_id,
+                    Concept_Relation.from_concept_id,
+                    Concept_Relation.to_concept_id,
+                    Concept_Relation.strength,
+                    other_column.label('other_id'),
+                    case((other_primary.c.concept_id.is_not(None), 1), else_=0).label('other_is_primary')
+                )
+                .select_from(primaries)
+                .join(Concept_Relation, anchor_column == primaries.c.concept_id)
+                .outerjoin(other_primary, and_(
+                    other_primary.c.article_id == primaries.c.article_id,
+                    other_primary.c.concept_id == other_column
+                ))
+                .where(Concept_Relation.strength >= min_strength)
+            )
         
-        return {
-            "nodes": list(nodes_map.values()),
-            "edges": edges_data
-        }
+        edges = union_all(
+            candidates(1, Concept_Relation.from_concept_id, Concept_Relation.to_concept_id),
+            candidates(2, Concept_Relation.to_concept_id, Concept_Relation.from_concept_id)
+        ).subquery('edges')
+        
+        # 기사별 전체 순서 (기존 빌더의 순회 순서와 동일)
+        ordered = select(
+            edges,
+            func.row_number().over(
+                partition_by=edges.c.article_id,
+                order_by=(edges.c.pass_no, edges.c.strength.desc(), edges.c.relation_id)
+            ).label('seq')
+        ).subquery('ordered')
+        
+        # 반대편 개념이 처음 등장한 위치
+        first_seen = select(
+            ordered,
+            func.min(ordered.c.seq).over(
+                partition_by=(ordered.c.article_id, ordered.c.other_id)
+            ).label('first_seq')
+        ).subquery('first_seen')
+        
+        # 2차 노드 순위 (처음 등장한 순서)
+        ranked = select(
+            first_seen,
+            func.dense_rank().over(
+                partition_by=(first_seen.c.article_id, first_seen.c.other_is_primary),
+                order_by=first_seen.c.first_seq
+            ).label('secondary_rank')
+        ).subquery('ranked')
+        
+        edge_rows = select(
+            ranked.c.article_id,
+            ranked.c.pass_no,
+            ranked.c.seq,
+            ranked.c.from_concept_id,
+            ranked.c.to_concept_id,
+            ranked.c.strength,
+            case(
+                (and_(ranked.c.other_is_primary == 0, ranked.c.seq == ranked.c.first_seq), ranked.c.other_id),
+                else_=null()
+            ).label('node_id')
+        ).where(or_(
+            ranked.c.other_is_primary == 1,
+            ranked.c.secondary_rank <= max_secondary_nodes
+        ))
+        
+        node_rows = select(
+            primaries.c.article_id,
+            literal_column('0').label('pass_no'),
+            literal_column('0').label('seq'),
+            null().label('from_concept_id'),
+            null().label('to_concept_id'),
+            null().label('strength'),
+            primaries.c.concept_id.label('node_id')
+        )
+        
+        graph_rows = union_all(node_rows, edge_rows).subquery('graph_rows')
+        
+        return (
+            select(
+                graph_rows.c.article_id,
+                graph_rows.c.pass_no,
+                graph_rows.c.from_concept_id,
+                graph_rows.c.to_concept_id,
+                graph_rows.c.strength,
+                Concept.concept_id,
+                Concept.name,
+                Concept.description_ko,
+                Concept.real_world_examples_ko
+            )
+            .select_from(graph_rows)
+            .outerjoin(Concept, Concept.concept_id == graph_rows.c.node_id)
+            .order_by(
+                graph_rows.c.article_id,
+                graph_rows.c.pass_no,
+                graph_rows.c.seq,
+                graph_rows.c.node_id
+            )
+        )
+    
+    @staticmethod
+    def _primary_node(concept):
+        """기사에 직접 등장하는 개념 노드 (concept: Concept 또는 동일한 컬럼을 가진 행)"""
+        return make_node(
+            concept.concept_id,
+            concept.name,
+            concept.description_ko,
+            concept.real_world_examples_ko,
+            True
+        )
+    
+    @staticmethod
+    def _related_node(concept, is_primary):
+        """관계로 연결된 개념 노드 (concept: Concept 또는 동일한 컬럼을 가진 행)"""
+        return make_node(
+            concept.concept_id,
+            concept.name,
+            concept.description_ko,
+            concept.real_world_examples_ko,
+            is_primary
+        )
     
     @staticmethod
     def get_knowledge_map_for_user(user_id):
@@ -13,13 +13,20 @@ from textwrap import dedent
 
 from openai import OpenAI
 
+from app.utils.llm_cache import LLMCache, get_llm_cache
+
 
 class KnowledgeService:
     """Service responsible for defining concepts via OpenRouter."""
 
     MODEL_DEFAULT = "anthropic/claude-3-haiku"
 
-    def __init__(self, api_key: Optional[str] = None, model: Optional[str] = None):
+    def __init__(
+        self,
+        api_key: Optional[str] = None,
+        model: Optional[str] = None,
+        cache: Optional[LLMCache] = None
+    ):
         self.api_key = api_key or os.getenv("OPENROUTER_API_KEY")
         if not self.api_key:
             raise ValueError("OPENROUTER_API_KEY not found. Please set it before running the ETL pipeline.")
@@ -33,28 +40,40 @@ class KnowledgeService:
                 "X-Title": "TechExplained Project"
             }
         )
+        self.cache = cache if cache is not None else get_llm_cache()
 
     def define_concept(self, concept_name: str, article_summary: str) -> Dict:
         """Retrieve a structured definition for the given concept name within article context."""
         prompt = self._build_prompt(concept_name, article_summary)
 
-        response = self.client.chat.completions.create(
-            model=self.model,
-            messages=[{"role": "user", "content": prompt}],
-            temperature=0.3,
-            max_tokens=1200
-        )
+        ai_content = self.cache.get(self.model, prompt, 0.3, 1200) if self.cache else None
+        from_cache = ai_content is not None
+
+        if not from_cache:
+            response = self.client.chat.completions.create(
+                model=self.model,
+                messages=[{"role": "user", "content": prompt}],
+                temperature=0.3,
+                max_tokens=1200
+            )
+
+            if not response or not response.choices:
+                raise RuntimeError("Empty response from OpenRouter while defining concept")
 
-        if not response or not response.choices:
-            raise RuntimeError("Empty response from OpenRouter while defining concept")
+            ai_content = response.choices[0].message.content.strip()
 
-        ai_content = response.choices[0].message.content.strip()
         try:
             definition = json.loads(ai_content)
         except json.JSONDecodeError as exc:
             raise RuntimeError(f"Failed to parse concept definition JSON: {exc}")
 
-        return self._validate_definition(definition, concept_name)
+        definition = self._validate_definition(definition, concept_name)
+
+        # Cache only validated responses so a retry after a bad answer still hits the network.
+        if self.cache and not from_cache:
+            self.cache.set(self.model, prompt, 0.3, 1200, ai_content)
+
+        return definition
 
     def _build_prompt(self, concept_name: str, article_summary: str) -> str:
         return dedent(
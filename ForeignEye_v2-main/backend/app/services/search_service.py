@@ -2,29 +2,51 @@
 Search service
 """
 
-from typing import List, Dict
+from typing import List, Dict, Optional, Tuple
 
-from sqlalchemy import func
+from sqlalchemy import func, select
 from app.extensions import db
 from app.models import Article, Concept, Article_Concept
-from app.models.relations import Concept_Relation
+from app.services.adjacency_service import AdjacencyService
+from app.services.article_service import ArticleService
+from app.utils.pagination import keyset_paginate
 
 
 class SearchService:
     # [M1] (P3 방어) '슈퍼 노드' 함정 방어를 위한 임베딩 제한
     RELATIVE_LIMIT = 10
+    DEFAULT_PAGE_SIZE = 20
+    MAX_PAGE_SIZE = 50
 
     @staticmethod
-    def get_articles_by_concept(concept_name: str) -> List[Dict]:
+    def get_articles_by_concept(
+        concept_name: str,
+        limit: int = DEFAULT_PAGE_SIZE,
+        cursor: Optional[str] = None
+    ) -> Tuple[List[Dict], Optional[str], int]:
+        """
+        개념 이름으로 기사 검색 (최신순 키셋 페이지)
+
+        Args:
+            concept_name (str): 개념 이름 (대소문자 무시)
+            limit (int): 페이지 크기
+            cursor (str, optional): 이전 페이지의 next_cursor
+
+        Returns:
+            tuple: (직렬화된 기사 리스트, next_cursor 또는 None, 전체 결과 수)
+
+        Raises:
+            ValidationError: 형식이 올바르지 않은 커서
+        """
         cleaned = (concept_name or "").strip()
         if not cleaned:
-            return []
+            return [], None, 0
 
         concept = Concept.query.filter(
             func.lower(Concept.name) == cleaned.lower()
         ).first()
         if not concept:
-            return []
+            return [], None, 0
 
         article_ids = (
             db.session.query(Article_Concept.article_id)
@@ -32,26 +54,50 @@ class SearchService:
             .subquery()
         )
 
-        articles = (
-            Article.query.filter(Article.article_id.in_(article_ids))
-            .order_by(Article.created_at.desc())
-            .all()
+        query = Article.query.filter(Article.article_id.in_(article_ids))
+        articles, next_cursor = keyset_paginate(
+            query, Article.created_at, Article.article_id, limit, cursor
         )
-        return [SearchService._serialize_article(article) for article in articles]
+
+        total = ArticleService.count_articles_cached(
+            ('concept', concept.concept_id),
+            lambda: db.session.query(func.count(func.distinct(Article_Concept.article_id)))
+            .filter(Article_Concept.concept_id == concept.concept_id)
+            .scalar()
+        )
+        return SearchService._serialize_articles(articles), next_cursor, total
 
     @staticmethod
-    def get_articles_by_multiple_concepts(concept_names: List[str]) -> List[Dict]:
+    def get_articles_by_multiple_concepts(
+        concept_names: List[str],
+        limit: int = DEFAULT_PAGE_SIZE,
+        cursor: Optional[str] = None
+    ) -> Tuple[List[Dict], Optional[str], int]:
+        """
+        모든 개념을 포함하는 기사 검색 (최신순 키셋 페이지)
+
+        Args:
+            concept_names (list): 개념 이름 목록 (대소문자 무시)
+            limit (int): 페이지 크기
+            cursor (str, optional): 이전 페이지의 next_cursor
+
+        Returns:
+            tuple: (직렬화된 기사 리스트, next_cursor 또는 None, 전체 결과 수)
+
+        Raises:
+            ValidationError: 형식이 올바르지 않은 커서
+        """
         cleaned_names = [name.strip() for name in concept_names if name and name.strip()]
         if not cleaned_names:
-            return []
+            return [], None, 0
 
         concepts = Concept.query.filter(
             func.lower(Concept.name).in_(map(str.lower, cleaned_names))
         ).all()
         if len(concepts) != len(set(name.lower() for name in cleaned_names)):
-            return []
+            return [], None, 0
 
-        concept_ids = [concept.concept_id for concept in concepts]
+        concept_ids = sorted(concept.concept_id for concept in concepts)
 
         matching_articles_subquery = (
             db.session.query(Article_Concept.article_id)
@@ -61,52 +107,89 @@ class SearchService:
             .subquery()
         )
 
-        articles = (
-            Article.query.filter(Article.article_id.in_(matching_articles_subquery))
-            .order_by(Article.created_at.desc())
-            .all()
+        query = Article.query.filter(Article.article_id.in_(matching_articles_subquery))
+        articles, next_cursor = keyset_paginate(
+            query, Article.created_at, Article.article_id, limit, cursor
         )
-        return [SearchService._serialize_article(article) for article in articles]
+
+        total = ArticleService.count_articles_cached(
+            ('concepts', tuple(concept_ids)),
+            lambda: db.session.query(func.count())
+            .select_from(matching_articles_subquery)
+            .scalar()
+        )
+        return SearchService._serialize_articles(articles), next_cursor, total
 
     @staticmethod
-    def _serialize_article(article: Article) -> Dict:
-        data = article.to_dict(include_preview=True)
+    def _serialize_articles(articles: List[Article]) -> List[Dict]:
+        """
+        검색 결과 일괄 직렬화
+
+        결과 기사 수와 무관하게 미리보기 개념 1회 + 친척 개념 1회의 쿼리만 사용합니다.
+        """
+        serialized = ArticleService.serialize_articles_with_preview(articles)
         # [M1] (P3 방어) 직렬화 시 '친척 개념'을 임베딩
-        data['relative_concepts'] = SearchService._fetch_relative_concepts(article)
-        return data
+        relatives = SearchService._fetch_relative_concepts_bulk(
+            [article.article_id for article in articles]
+        )
+        for data in serialized:
+            data['relative_concepts'] = relatives[data['article_id']]
+        return serialized
+
+    @staticmethod
+    def _serialize_article(article: Article) -> Dict:
+        return SearchService._serialize_articles([article])[0]
 
     @staticmethod
-    def _fetch_relative_concepts(article: Article) -> List[Dict]:
+    def _fetch_relative_concepts_bulk(article_ids: List[int]) -> Dict[int, List[Dict]]:
         """
-        [M1] (P3 방어) 기사와 연결된 개념들의 '친척 개념'을 30개 제한으로 가져옴
+        [M1] (P3 방어) 기사별로 연결된 개념들의 '친척 개념'을 30개 제한으로 가져옴
         [FIX] 중복된 concept_id 제거 (같은 개념이 여러 관계로 연결된 경우 가장 강한 것만 유지)
+
+        기사-개념 1회 + 개념별 이웃 목록(Concept_Adjacency) 1회의 기본 키 조회만 사용하며,
+        기사별 상위 30개 관계는 이웃 목록(강도 내림차순)을 합쳐 자릅니다.
+
+        Returns:
+            dict: {article_id: [{'concept_id', 'name', 'relation_type', 'strength'}, ...]}
         """
-        concept_ids = [ac.concept_id for ac in article.concepts]
-        if not concept_ids:
-            return []
-
-        related_rows = (
-            db.session.query(Concept_Relation, Concept)
-            .join(Concept, Concept.concept_id == Concept_Relation.to_concept_id)
-            .filter(Concept_Relation.from_concept_id.in_(concept_ids))
-            .order_by(Concept_Relation.strength.desc())
-            .limit(SearchService.RELATIVE_LIMIT * 3)  # 중복 제거 전 여유있게 가져옴
-            .all()
+        relatives_by_article = {article_id: [] for article_id in article_ids}
+        if not relatives_by_article:
+            return relatives_by_article
+
+        concepts_by_article = {article_id: set() for article_id in relatives_by_article}
+        for article_id, concept_id in db.session.execute(
+            select(Article_Concept.article_id, Article_Concept.concept_id)
+            .where(Article_Concept.article_id.in_(list(relatives_by_article)))
+            .distinct()
+        ):
+            concepts_by_article[article_id].add(concept_id)
+
+        adjacency = AdjacencyService.get_adjacency(
+            set().union(*concepts_by_article.values())
         )
 
-        # 중복 제거: concept_id를 키로 하고, 가장 강한 관계만 유지
-        unique_concepts = {}
-        for relation, concept in related_rows:
-            cid = concept.concept_id
-            # 이미 존재하는 경우, 더 강한 strength를 가진 것만 유지
-            if cid not in unique_concepts or relation.strength > unique_concepts[cid]['strength']:
-                unique_concepts[cid] = {
-                    'concept_id': cid,
-                    'name': concept.name,
-                    'relation_type': relation.relation_type,
-                    'strength': relation.strength
-                }
-        
-        # strength 순으로 정렬 후 RELATIVE_LIMIT만큼만 반환
-        relatives = sorted(unique_concepts.values(), key=lambda x: x['strength'], reverse=True)
-        return relatives[:SearchService.RELATIVE_LIMIT]
+        for article_id, concept_ids in concepts_by_article.items():
+            # 기사 개념에서 시작하는 관계를 강도 순으로 합친 뒤 상위 30개 (중복 제거 전 여유있게)
+            ranked = sorted(
+                (
+                    neighbour
+                    for concept_id in concept_ids
+                    for neighbour in adjacency.get(concept_id, {}).get('out', [])
+                ),
+                key=lambda n: (-n['strength'], n['relation_id'])
+            )[:SearchService.RELATIVE_LIMIT * 3]
+
+            # 중복 제거: concept_id를 키로 하고, 가장 강한 관계만 유지 (강도 순이므로 처음 것이 가장 강함)
+            unique_concepts = {}
+            for neighbour in ranked:
+                if neighbour['concept_id'] not in unique_concepts:
+                    unique_concepts[neighbour['concept_id']] = {
+                        'concept_id': neighbour['concept_id'],
+                        'name': neighbour['name'],
+                        'relation_type': neighbour['relation_type'],
+                        'strength': neighbour['strength']
+                    }
+
+            relatives_by_article[article_id] = list(unique_concepts.values())[:SearchService.RELATIVE_LIMIT]
+
+        return relatives_by_article
@@ -0,0 +1,93 @@
+"""
+프로세스 로컬 캐시
+
+스레드 안전한 TTL + 크기 제한(LRU) 캐시입니다.
+Redis를 쓸 수 없을 때의 대체 저장소나, 요청 간에 재사용하는 작은 값 캐시로 사용합니다.
+"""
+
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Hashable
+
+
+_MISSING = object()
+
+
+class TTLCache:
+    """
+    TTL + LRU 캐시
+
+    Attributes:
+        ttl (float): 항목 유효 시간 (초). 0이면 만료 없음
+        max_entries (int): 최대 항목 수 (초과 시 가장 오래 사용되지 않은 항목 제거)
+    """
+
+    def __init__(self, ttl: float = 60, max_entries: int = 10000):
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self._data: "OrderedDict[Hashable, tuple]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """
+        값 조회 (만료된 항목은 제거 후 default 반환)
+        """
+        with self._lock:
+            entry = self._data.get(key, _MISSING)
+            if entry is _MISSING:
+                return default
+
+            expires_at, value = entry
+            if expires_at and expires_at < time.monotonic():
+                del self._data[key]
+                return default
+
+            self._data.move_to_end(key)
+            return value
+
+    def set(self, key: Hashable, value: Any):
+        """값 저장 (TTL 갱신)"""
+        expires_at = time.monotonic() + self.ttl if self.ttl else 0
+        with self._lock:
+            self._data[key] = (expires_at, value)
+            self._data.move_to_end(key)
+            while len(self._data) > self.max_entries:
+                self._data.popitem(last=False)
+
+    def update(self, key: Hashable, func: Callable[[Any], None]) -> bool:
+        """
+        캐시된 값을 락 안에서 제자리 수정 (write-through 갱신용)
+
+        Args:
+            key: 캐시 키
+            func: 캐시된 값을 받아 수정하는 함수
+
+        Returns:
+            bool: 유효한 항목이 있어 수정했으면 True
+        """
+        with self._lock:
+            entry = self._data.get(key, _MISSING)
+            if entry is _MISSING:
+                return False
+
+            expires_at, value = entry
+            if expires_at and expires_at < time.monotonic():
+                del self._data[key]
+                return False
+
+            func(value)
+            return True
+
+    def delete(self, key: Hashable):
+        """항목 제거"""
+        with self._lock:
+            self._data.pop(key, None)
+
+    def clear(self):
+        """전체 제거"""
+        with self._lock:
+            self._data.clear()
+
+    def __len__(self) -> int:
+        return len(self._data)
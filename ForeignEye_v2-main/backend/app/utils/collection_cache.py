@@ -0,0 +1,307 @@
+"""
+사용자 수집 상태 캐시
+
+사용자별 수집 개념 ID 집합을 캐시하여, 그래프 오버레이가
+컬렉션 크기와 무관하게 그래프 노드 ID만큼의 비용으로 수집 여부를 판별하도록 합니다.
+
+백엔드:
+- RedisCollectionBackend: 여러 웹 워커가 공유하는 Redis SET (기본값)
+- LocalCollectionBackend: 프로세스 로컬 TTL 캐시 (Redis를 쓸 수 없을 때)
+
+CollectionService의 수집/취소는 커밋 후 캐시를 write-through로 갱신하고 사용자별 epoch를 올립니다.
+캐시가 없는 사용자는 첫 조회 때 concept_id 컬럼만 읽어 적재하는데,
+DB를 읽기 전에 begin_fill()로 받은 epoch가 그대로이고 키가 여전히 없을 때만 저장합니다.
+(읽는 도중 커밋된 수집/취소가 이전 스냅샷으로 덮어써지는 것을 방지)
+
+환경 변수:
+    COLLECTION_CACHE_BACKEND      'redis' | 'local' | 'none' (기본값: 'redis')
+    COLLECTION_CACHE_TTL          캐시 유효 시간 (초, 기본값: Redis 3600 / 로컬 60)
+    COLLECTION_CACHE_MAX_USERS    로컬 백엔드 최대 사용자 수 (기본값: 10000)
+"""
+
+import itertools
+import os
+import threading
+from typing import Iterable, Optional, Set
+
+from flask import current_app
+
+from app.utils.cache import TTLCache
+
+
+class RedisCollectionBackend:
+    """
+    Redis SET 기반 백엔드
+
+    빈 컬렉션과 캐시 미스를 구분하기 위해 SET에 센티널 멤버(0)를 함께 저장합니다.
+    수집/취소마다 사용자별 epoch 키(collected_epoch:)를 올리고, 채우기는 epoch가 그대로일 때만 씁니다.
+    """
+
+    PREFIX = 'collected:'
+    EPOCH_PREFIX = 'collected_epoch:'
+    SENTINEL = 0
+
+    # epoch를 올리고, 키가 있을 때만 갱신 (부분 집합이 캐시되는 것을 방지)
+    _ADD_IF_CACHED = """
+    redis.call('INCR', KEYS[2])
+    redis.call('EXPIRE', KEYS[2], ARGV[2])
+    if redis.call('EXISTS', KEYS[1]) == 1 then
+        return redis.call('SADD', KEYS[1], ARGV[1])
+    end
+    return -1
+    """
+    _REMOVE_IF_CACHED = """
+    redis.call('INCR', KEYS[2])
+    redis.call('EXPIRE', KEYS[2], ARGV[2])
+    if redis.call('EXISTS', KEYS[1]) == 1 then
+        return redis.call('SREM', KEYS[1], ARGV[1])
+    end
+    return -1
+    """
+    # 키가 없고 epoch가 begin_fill() 시점 그대로일 때만 저장
+    _STORE_IF_UNCHANGED = """
+    if redis.call('EXISTS', KEYS[1]) == 1 then
+        return 0
+    end
+    if (redis.call('GET', KEYS[2]) or '0') ~= ARGV[1] then
+        return 0
+    end
+    for i = 3, #ARGV, 1000 do
+        redis.call('SADD', KEYS[1], unpack(ARGV, i, math.min(i + 999, #ARGV)))
+    end
+    redis.call('EXPIRE', KEYS[1], ARGV[2])
+    return 1
+    """
+
+    def __init__(self, client, ttl: int = 3600):
+        """
+        Args:
+            client: redis.Redis 클라이언트
+            ttl (int): 키 유효 시간 (초)
+        """
+        self.client = client
+        self.ttl = ttl
+        # epoch는 채우기(DB 조회 한 번) 동안만 유지되면 되지만, 캐시 키보다 먼저 사라지지 않게 둠
+        self.epoch_ttl = max(ttl, 60)
+        self._add_script = client.register_script(self._ADD_IF_CACHED)
+        self._remove_script = client.register_script(self._REMOVE_IF_CACHED)
+        self._store_script = client.register_script(self._STORE_IF_UNCHANGED)
+
+    def _key(self, user_id: int) -> str:
+        return f"{self.PREFIX}{user_id}"
+
+    def _epoch_key(self, user_id: int) -> str:
+        return f"{self.EPOCH_PREFIX}{user_id}"
+
+    def collected_among(self, user_id: int, concept_ids: list) -> Optional[Set[int]]:
+        key = self._key(user_id)
+        pipe = self.client.pipeline()
+        pipe.exists(key)
+        if concept_ids:
+            pipe.smismember(key, concept_ids)
+        results = pipe.execute()
+
+        if not results[0]:
+            return None
+        if not concept_ids:
+            return set()
+        return {cid for cid, is_member in zip(concept_ids, results[1]) if is_member}
+
+    def begin_fill(self, user_id: int) -> str:
+        epoch = self.client.get(self._epoch_key(user_id))
+        if isinstance(epoch, bytes):
+            epoch = epoch.decode()
+        return epoch or '0'
+
+    def store(self, user_id: int, concept_ids: Set[int], token: str) -> bool:
+        return bool(self._store_script(
+            keys=[self._key(user_id), self._epoch_key(user_id)],
+            args=[token, self.ttl, self.SENTINEL, *concept_ids]
+        ))
+
+    def add(self, user_id: int, concept_id: int):
+        self._add_script(
+            keys=[self._key(user_id), self._epoch_key(user_id)],
+            args=[concept_id, self.epoch_ttl]
+        )
+
+    def remove(self, user_id: int, concept_id: int):
+        self._remove_script(
+            keys=[self._key(user_id), self._epoch_key(user_id)],
+            args=[concept_id, self.epoch_ttl]
+        )
+
+    def invalidate(self, user_id: int):
+        self.client.delete(self._key(user_id))
+
+
+class LocalCollectionBackend:
+    """프로세스 로컬 TTL 캐시 백엔드 (다른 프로세스의 변경은 TTL 이후 반영)"""
+
+    def __init__(self, ttl: int = 60, max_users: int = 10000):
+        """
+        Args:
+            ttl (int): 사용자별 유효 시간 (초)
+            max_users (int): 최대 사용자 수
+        """
+        self._cache = TTLCache(ttl=ttl, max_entries=max_users)
+        # 사용자별 마지막 수집/취소 번호 (프로세스 전역 단조 증가, 없으면 0)
+        self._epochs = TTLCache(ttl=max(ttl, 60), max_entries=max_users)
+        self._epoch_counter = itertools.count(1)
+        self._lock = threading.Lock()
+
+    def _bump(self, user_id: int):
+        self._epochs.set(user_id, next(self._epoch_counter))
+
+    def collected_among(self, user_id: int, concept_ids: list) -> Optional[Set[int]]:
+        collected = self._cache.get(user_id)
+        if collected is None:
+            return None
+        return {cid for cid in concept_ids if cid in collected}
+
+    def begin_fill(self, user_id: int) -> int:
+        return self._epochs.get(user_id, 0)
+
+    def store(self, user_id: int, concept_ids: Set[int], token: int) -> bool:
+        with self._lock:
+            if self._cache.get(user_id) is not None or self._epochs.get(user_id, 0) != token:
+                return False
+            self._cache.set(user_id, set(concept_ids))
+            return True
+
+    def add(self, user_id: int, concept_id: int):
+        with self._lock:
+            self._bump(user_id)
+            self._cache.update(user_id, lambda collected: collected.add(concept_id))
+
+    def remove(self, user_id: int, concept_id: int):
+        with self._lock:
+            self._bump(user_id)
+            self._cache.update(user_id, lambda collected: collected.discard(concept_id))
+
+    def invalidate(self, user_id: int):
+        self._cache.delete(user_id)
+
+
+class CollectionStateCache:
+    """
+    사용자 수집 상태 캐시 (백엔드 교체 가능)
+
+    백엔드 오류는 캐시 미스로 처리하고, 쓰기 오류 시에는 해당 사용자 캐시를 무효화합니다.
+    """
+
+    def __init__(self, backend):
+        self.backend = backend
+
+    def collected_among(self, user_id: int, concept_ids: Iterable[int]) -> Optional[Set[int]]:
+        """
+        주어진 개념 중 사용자가 수집한 개념 ID 집합
+
+        Returns:
+            set: 수집한 개념 ID. 캐시되지 않은 사용자면 None
+        """
+        try:
+            return self.backend.collected_among(user_id, list(concept_ids))
+        except Exception as e:
+            current_app.logger.warning("Collection cache read failed: %s", e)
+            return None
+
+    def begin_fill(self, user_id: int):
+        """
+        캐시 채우기 시작 (DB 조회 전에 호출)
+
+        Returns:
+            현재 epoch 토큰. 읽기 실패 시 None (이 경우 store()는 저장하지 않음)
+        """
+        try:
+            return self.backend.begin_fill(user_id)
+        except Exception as e:
+            current_app.logger.warning("Collection cache read failed: %s", e)
+            return None
+
+    def store(self, user_id: int, concept_ids: Iterable[int], token) -> bool:
+        """
+        사용자의 전체 수집 개념 ID 저장 (키가 없고 begin_fill() 이후 수집/취소가 없을 때만)
+
+        Returns:
+            bool: 저장했으면 True
+        """
+        if token is None:
+            return False
+        try:
+            return self.backend.store(user_id, set(concept_ids), token)
+        except Exception as e:
+            current_app.logger.warning("Collection cache write failed: %s", e)
+            return False
+
+    def add(self, user_id: int, concept_id: int):
+        """수집 추가 반영 (캐시된 사용자만)"""
+        self._write_through(self.backend.add, user_id, concept_id)
+
+    def remove(self, user_id: int, concept_id: int):
+        """수집 취소 반영 (캐시된 사용자만)"""
+        self._write_through(self.backend.remove, user_id, concept_id)
+
+    def _write_through(self, operation, user_id: int, concept_id: int):
+        try:
+            operation(user_id, concept_id)
+        except Exception as e:
+            current_app.logger.warning(
+                "Collection cache update failed, invalidating user %s: %s", user_id, e
+            )
+            self.invalidate(user_id)
+
+    def invalidate(self, user_id: int):
+        """사용자 캐시 제거 (다음 조회 때 DB에서 다시 적재)"""
+        try:
+            self.backend.invalidate(user_id)
+        except Exception as e:
+            current_app.logger.warning("Collection cache invalidation failed: %s", e)
+
+
+_collection_cache = None
+_collection_cache_initialized = False
+_collection_cache_lock = threading.Lock()
+
+
+def get_collection_cache() -> Optional[CollectionStateCache]:
+    """
+    환경 변수 설정에 따른 CollectionStateCache 싱글톤 반환
+
+    Redis 연결에 실패하면 프로세스 로컬 백엔드로 대체합니다.
+
+    Returns:
+        CollectionStateCache: 캐시 객체. COLLECTION_CACHE_BACKEND=none 이면 None
+    """
+    global _collection_cache, _collection_cache_initialized
+
+    with _collection_cache_lock:
+        if _collection_cache_initialized:
+            return _collection_cache
+        _collection_cache_initialized = True
+
+        backend_name = os.getenv('COLLECTION_CACHE_BACKEND', 'redis').lower()
+        if backend_name == 'none':
+            return None
+
+        backend = None
+        if backend_name == 'redis':
+            try:
+                from app.extensions import get_redis_client
+                client = get_redis_client()
+                client.ping()
+                backend = RedisCollectionBackend(
+                    client,
+                    ttl=int(os.getenv('COLLECTION_CACHE_TTL', 3600))
+                )
+            except Exception as e:
+                current_app.logger.warning("수집 상태 캐시 Redis 연결 실패 (프로세스 로컬 캐시 사용): %s", e)
+
+        if backend is None:
+            backend = LocalCollectionBackend(
+                ttl=int(os.getenv('COLLECTION_CACHE_TTL', 60)),
+                max_users=int(os.getenv('COLLECTION_CACHE_MAX_USERS', 10000))
+            )
+
+        _collection_cache = CollectionStateCache(backend)
+        return _collection_cache
@@ -0,0 +1,347 @@
+"""
+개념 검색 인덱스 (프로세스 로컬)
+
+Concept.name.like('%q%')는 앞쪽 와일드카드 때문에 name 인덱스를 쓰지 못하므로,
+자동완성 요청마다 테이블 전체를 읽습니다. 이 모듈은 메모리에 역색인을 두고
+이름/별칭/설명(description_ko)을 관련도 순으로 검색합니다.
+
+색인 구성:
+- 접두어 색인: 이름/별칭 전체와 각 토큰의 접두어 → 개념 ID (자동완성)
+- 2-gram 색인: 공백을 제거한 이름/별칭, 설명의 문자 2-gram → 개념 ID
+  (한국어처럼 띄어쓰기가 일정하지 않은 텍스트의 부분 문자열 검색과 오타 허용 검색)
+
+별칭은 스키마에 별도 컬럼이 없으므로 이름에서 만듭니다.
+- 괄호 표기: 'Retrieval-Augmented Generation (RAG)' → 'rag', 'retrieval-augmented generation'
+- 여러 단어 영문 이름의 두문자어: 'Large Language Model' → 'llm'
+
+관련도 (아래 단계 순서, 같은 단계 안에서는 짧은 이름 → 개념 ID 순):
+    1. 이름 일치          2. 별칭 일치
+    3. 이름 접두어        4. 별칭 접두어
+    5. 이름 토큰 접두어    6. 별칭 토큰 접두어 (검색어의 모든 토큰이 각각 어떤 토큰의 접두어)
+    7. 이름 부분 문자열    8. 별칭 부분 문자열
+    9. 2-gram 유사도(오타 허용, 유사도 순)
+    10. 설명 부분 문자열
+단계마다 별도 색인을 두고 위 단계부터 채워 limit개가 모이면 멈추므로,
+후보가 많은 짧은 검색어도 후보 전체를 점수 계산하지 않습니다.
+"""
+
+import heapq
+import re
+import threading
+import time
+import unicodedata
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+
+MAX_PREFIX_LENGTH = 20
+FUZZY_MIN_SIMILARITY = 0.5
+
+_TOKEN_RE = re.compile(r'\w+')
+_PAREN_RE = re.compile(r'\(([^)]*)\)')
+_SPACE_RE = re.compile(r'\s+')
+
+
+def normalize(text: str) -> str:
+    """검색용 정규화 (NFKC + casefold + 공백 정리)"""
+    text = unicodedata.normalize('NFKC', text or '').casefold()
+    return _SPACE_RE.sub(' ', text).strip()
+
+
+def _compact(text: str) -> str:
+    return text.replace(' ', '')
+
+
+def _bigrams(text: str) -> Set[str]:
+    return {text[i:i + 2] for i in range(len(text) - 1)}
+
+
+def _aliases(name: str) -> List[str]:
+    """이름에서 별칭 생성 (괄호 표기, 두문자어)"""
+    aliases = []
+
+    for inner in _PAREN_RE.findall(name):
+        inner = inner.strip()
+        if inner:
+            aliases.append(inner)
+    outer = _SPACE_RE.sub(' ', _PAREN_RE.sub(' ', name)).strip()
+    if outer and outer != name:
+        aliases.append(outer)
+
+    words = _TOKEN_RE.findall(outer.replace('-', ' '))
+    if len(words) >= 2 and all(word.isascii() and word.isalpha() for word in words):
+        aliases.append(''.join(word[0] for word in words))
+
+    return aliases
+
+
+class _Doc:
+    __slots__ = ('name', 'keys', 'key_tokens', 'compact_keys', 'desc')
+
+    def __init__(self, name: str, description: str):
+        normalized_name = normalize(name)
+        keys = [normalized_name]
+        for alias in _aliases(name):
+            alias = normalize(alias)
+            if alias and alias not in keys:
+                keys.append(alias)
+
+        self.name = normalized_name
+        self.keys = keys  # keys[0]은 이름, 나머지는 별칭
+        self.key_tokens = [_TOKEN_RE.findall(key) for key in keys]
+        self.compact_keys = [_compact(key) for key in keys]
+        self.desc = _compact(normalize(description))
+
+    def entries(self) -> Set[Tuple[str, str]]:
+        """이 문서의 (색인 이름, 색인어) 목록"""
+        entries = set()
+        for position, (key, tokens) in enumerate(zip(self.keys, self.key_tokens)):
+            kind = 'alias' if position else 'name'
+            entries.add((f'{kind}_exact', key))
+            for end in range(1, min(len(key), MAX_PREFIX_LENGTH) + 1):
+                entries.add((f'{kind}_prefix', key[:end]))
+            for token in tokens:
+                for end in range(1, min(len(token), MAX_PREFIX_LENGTH) + 1):
+                    entries.add((f'{kind}_token', token[:end]))
+        for compact_key in self.compact_keys:
+            for gram in _bigrams(compact_key):
+                entries.add(('key_gram', gram))
+        for gram in _bigrams(self.desc):
+            entries.add(('desc_gram', gram))
+        return entries
+
+    def matches_tokens(self, q_tokens: List[str], aliases: bool) -> bool:
+        """검색어의 모든 토큰이 같은 키(이름 또는 별칭 하나)의 토큰 접두어인지 여부"""
+        key_tokens = self.key_tokens[1:] if aliases else self.key_tokens[:1]
+        return any(
+            all(any(token.startswith(q_token) for token in tokens) for q_token in q_tokens)
+            for tokens in key_tokens
+        )
+
+
+_FIELDS = (
+    'name_exact', 'alias_exact',
+    'name_prefix', 'alias_prefix',
+    'name_token', 'alias_token',
+    'key_gram', 'desc_gram'
+)
+
+
+class ConceptSearchIndex:
+    """
+    개념 이름/별칭/설명 역색인
+
+    rebuild()로 전체를 만든 뒤 apply_delta()(DB 증분)와 add()(같은 프로세스의 새 개념)로 갱신합니다.
+    구축 전에는 둘 다 무시되므로 호출자는 is_built를 확인해 rebuild()를 먼저 호출해야 합니다.
+
+    Attributes:
+        is_built (bool): 전체 색인 완료 여부
+        built_at (float): 마지막 전체 색인 시각 (time.monotonic)
+        refreshed_at (float): 마지막 증분 반영 시각 (time.monotonic)
+        max_concept_id (int): DB에서 읽어 색인한 개념 ID 최댓값 (증분 반영 기준)
+    """
+
+    def __init__(self):
+        self.is_built = False
+        self.built_at = 0.0
+        self.refreshed_at = 0.0
+        self.max_concept_id = 0
+        self._docs: Dict[int, _Doc] = {}
+        self._postings: Dict[str, Dict[str, Set[int]]] = {field: {} for field in _FIELDS}
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._docs)
+
+    def rebuild(self, concepts: Iterable[Tuple[int, str, str]]):
+        """
+        전체 색인 재구축 (새 색인을 만든 뒤 교체하므로 구축 중에도 기존 색인으로 검색 가능)
+
+        Args:
+            concepts: (concept_id, name, description_ko) 목록
+        """
+        fresh = ConceptSearchIndex()
+        for concept_id, name, description in concepts:
+            fresh._add(concept_id, name, description)
+            fresh.max_concept_id = max(fresh.max_concept_id, concept_id)
+
+        now = time.monotonic()
+        with self._lock:
+            self._docs = fresh._docs
+            self._postings = fresh._postings
+            self.max_concept_id = fresh.max_concept_id
+            self.is_built = True
+            self.built_at = now
+            self.refreshed_at = now
+
+    def add(self, concepts: Iterable[Tuple[int, str, str]]):
+        """
+        개념 즉시 반영 (같은 프로세스에서 만든 개념, 구축 전이면 무시)
+
+        DB 증분 반영 기준(max_concept_id)은 바꾸지 않으므로,
+        다른 프로세스가 그사이 만든 더 작은 ID의 개념도 apply_delta()에서 누락되지 않습니다.
+
+        Args:
+            concepts: (concept_id, name, description_ko) 목록
+        """
+        with self._lock:
+            if self.is_built:
+                for concept_id, name, description in concepts:
+                    self._remove(concept_id)
+                    self._add(concept_id, name, description)
+
+    def apply_delta(self, concepts: Iterable[Tuple[int, str, str]]):
+        """
+        DB 증분 조회 결과 반영 (max_concept_id 이후의 개념)
+
+        Args:
+            concepts: (concept_id, name, description_ko) 목록
+        """
+        with self._lock:
+            if self.is_built:
+                for concept_id, name, description in concepts:
+                    self._remove(concept_id)
+                    self._add(concept_id, name, description)
+                    self.max_concept_id = max(self.max_concept_id, concept_id)
+            self.refreshed_at = time.monotonic()
+
+    def remove(self, concept_id: int):
+        """개념을 색인에서 제거"""
+        with self._lock:
+            self._remove(concept_id)
+
+    def search(self, query: str, limit: int = 10) -> List[int]:
+        """
+        관련도 순 개념 ID 검색
+
+        Args:
+            query (str): 검색어
+            limit (int): 결과 수 제한
+
+        Returns:
+            list: 개념 ID 리스트 (관련도 내림차순)
+        """
+        q = normalize(query)
+        qc = _compact(q)
+        if not qc or limit < 1:
+            return []
+
+        q_key = q[:MAX_PREFIX_LENGTH]
+        q_tokens = _TOKEN_RE.findall(q)
+        q_grams = _bigrams(qc)
+
+        with self._lock:
+            postings = self._postings
+            docs = self._docs
+            results: List[int] = []
+            seen: Set[int] = set()
+
+            def take(ids, check=None) -> bool:
+                # 한 단계의 결과를 (이름 길이, ID) 순으로 채우고, limit에 도달하면 True
+                ids = [
+                    concept_id for concept_id in ids
+                    if concept_id not in seen and (check is None or check(docs[concept_id]))
+                ]
+                best = heapq.nsmallest(
+                    limit - len(results), ids,
+                    key=lambda concept_id: (len(docs[concept_id].name), concept_id)
+                )
+                results.extend(best)
+                seen.update(best)
+                return len(results) >= limit
+
+            def long_prefix_check(position):
+                if len(q) <= MAX_PREFIX_LENGTH:
+                    return None
+                return lambda doc: any(key.startswith(q) for key in doc.keys[position])
+
+            tiers = [
+                (postings['name_exact'].get(q, ()), None),
+                (postings['alias_exact'].get(q, ()), None),
+                (postings['name_prefix'].get(q_key, ()), long_prefix_check(slice(0, 1))),
+                (postings['alias_prefix'].get(q_key, ()), long_prefix_check(slice(1, None))),
+            ]
+            if q_tokens:
+                tiers += [
+                    (self._intersect(postings['name_token'], [t[:MAX_PREFIX_LENGTH] for t in q_tokens]),
+                     lambda doc: doc.matches_tokens(q_tokens, aliases=False)),
+                    (self._intersect(postings['alias_token'], [t[:MAX_PREFIX_LENGTH] for t in q_tokens]),
+                     lambda doc: doc.matches_tokens(q_tokens, aliases=True)),
+                ]
+
+            for ids, check in tiers:
+                if take(ids, check):
+                    return results
+            if not q_grams:
+                return results
+
+            key_candidates = self._intersect(postings['key_gram'], q_grams)
+            if take(key_candidates, lambda doc: qc in doc.compact_keys[0]):
+                return results
+            if take(key_candidates, lambda doc: any(qc in key for key in doc.compact_keys[1:])):
+                return results
+
+            if len(q_grams) >= 2:
+                # 오타 허용: 2-gram 절반 이상을 공유하는 키를 Dice 유사도 순으로
+                counts: Dict[int, int] = {}
+                for gram in q_grams:
+                    for concept_id in postings['key_gram'].get(gram, ()):
+                        if concept_id not in seen:
+                            counts[concept_id] = counts.get(concept_id, 0) + 1
+                threshold = len(q_grams) * FUZZY_MIN_SIMILARITY
+                fuzzy = []
+                for concept_id, count in counts.items():
+                    if count < threshold:
+                        continue
+                    doc = docs[concept_id]
+                    similarity = max(
+                        2 * len(q_grams & key_grams) / (len(q_grams) + len(key_grams))
+                        for key_grams in (_bigrams(key) for key in doc.compact_keys)
+                        if key_grams
+                    )
+                    if similarity >= FUZZY_MIN_SIMILARITY:
+                        fuzzy.append((-similarity, len(doc.name), concept_id))
+                for _, _, concept_id in heapq.nsmallest(limit - len(results), fuzzy):
+                    results.append(concept_id)
+                    seen.add(concept_id)
+                if len(results) >= limit:
+                    return results
+
+            take(self._intersect(postings['desc_gram'], q_grams), lambda doc: qc in doc.desc)
+            return results
+
+    def stats(self) -> Dict:
+        """색인 지표 (health check용)"""
+        with self._lock:
+            return {
+                'built': self.is_built,
+                'concepts': len(self._docs),
+                **{f'{field}_terms': len(terms) for field, terms in self._postings.items()}
+            }
+
+    @staticmethod
+    def _intersect(postings: Dict[str, Set[int]], terms: Iterable[str]) -> Set[int]:
+        lists = sorted((postings.get(term, set()) for term in terms), key=len)
+        if not lists or not lists[0]:
+            return set()
+        return lists[0].intersection(*lists[1:])
+
+    def _add(self, concept_id: int, name: str, description: Optional[str]):
+        doc = _Doc(name, description or '')
+        self._docs[concept_id] = doc
+        for field, term in doc.entries():
+            self._postings[field].setdefault(term, set()).add(concept_id)
+
+    def _remove(self, concept_id: int):
+        doc = self._docs.pop(concept_id, None)
+        if doc is None:
+            return
+        for field, term in doc.entries():
+            ids = self._postings[field].get(term)
+            if ids is not None:
+                ids.discard(concept_id)
+                if not ids:
+                    del self._postings[field][term]
+
+
+# 프로세스 공유 인스턴스 (ConceptService가 DB에서 구축/증분 반영)
+concept_search_index = ConceptSearchIndex()
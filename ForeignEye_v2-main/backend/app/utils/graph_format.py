@@ -0,0 +1,143 @@
+"""
+그래프 캐시 저장 형식
+
+Article.graph_cache에 저장되는 지식 그래프의 직렬화/역직렬화를 담당합니다.
+
+형식 버전:
+- v1 (레거시): 노드마다 스타일 키와 개념 설명을 모두 담은 JSON 텍스트
+- v2 (현재): 1바이트 버전 헤더 + zlib 압축된 컬럼형 JSON
+    {"p": [Primary 개념 ID...], "s": [2차 개념 ID...], "e": [[from, to, strength], ...]}
+  개념 이름/설명/사례는 저장하지 않고 읽을 때 개념 조회 함수로 채워 넣으며,
+  스타일 키는 is_primary 플래그로부터 다시 만듭니다.
+"""
+
+import json
+import zlib
+from typing import Callable, Dict, Iterable, Optional, Tuple
+
+
+GRAPH_FORMAT_V2 = 2
+
+# (name, description_ko, real_world_examples_ko)
+ConceptSummary = Tuple[str, str, Optional[list]]
+
+
+def make_node(concept_id: int, name: str, description: str, examples, is_primary: bool) -> Dict:
+    """
+    그래프 노드 dict 생성 (Primary 노드는 강조 스타일 적용)
+
+    Args:
+        concept_id (int): 개념 ID
+        name (str): 개념 이름
+        description (str): 개념 설명
+        examples (list): 실제 사례
+        is_primary (bool): 기사에 직접 등장하는 개념인지 여부
+
+    Returns:
+        dict: vis-network 노드 형식
+    """
+    if is_primary:
+        return {
+            "id": concept_id,
+            "label": name,
+            "description": description,
+            "real_world_examples": examples or [],
+            "is_collected": False,  # 동적으로 업데이트됨
+            "is_primary": True,
+            "borderWidth": 4,
+            "color": {"border": "#007bff", "background": "#ffffff"},
+            "shape": "dot",
+            "size": 25
+        }
+
+    return {
+        "id": concept_id,
+        "label": name,
+        "description": description,
+        "real_world_examples": examples or [],
+        "is_collected": False,
+        "is_primary": False,
+        "shape": "dot",
+        "size": 15
+    }
+
+
+def encode_graph(graph_data: Dict) -> bytes:
+    """
+    그래프를 v2 형식으로 직렬화
+
+    노드 순서는 Primary 노드 다음 2차 노드 순서로 저장됩니다. (그래프 빌더의 출력 순서)
+
+    Args:
+        graph_data (dict): {'nodes': [...], 'edges': [...]}
+
+    Returns:
+        bytes: 버전 헤더 + 압축된 페이로드
+    """
+    primary_ids = []
+    secondary_ids = []
+    for node in graph_data.get('nodes', []):
+        (primary_ids if node.get('is_primary') else secondary_ids).append(node['id'])
+
+    payload = {
+        'p': primary_ids,
+        's': secondary_ids,
+        'e': [[edge['from'], edge['to'], edge['strength']] for edge in graph_data.get('edges', [])]
+    }
+    body = json.dumps(payload, separators=(',', ':')).encode('utf-8')
+    return bytes([GRAPH_FORMAT_V2]) + zlib.compress(body, 6)
+
+
+def decode_graph(raw, concept_lookup: Callable[[Iterable[int]], Dict[int, ConceptSummary]]) -> Dict:
+    """
+    저장된 그래프를 역직렬화 (v1 JSON과 v2 모두 지원)
+
+    Args:
+        raw (bytes | str): graph_cache 컬럼 값
+        concept_lookup: 개념 ID 목록을 받아 {concept_id: (name, description, examples)}를 반환하는 함수
+
+    Returns:
+        dict: {'nodes': [...], 'edges': [...]}
+
+    Raises:
+        ValueError: 알 수 없는 형식이거나 손상된 데이터
+    """
+    if isinstance(raw, str):
+        return json.loads(raw)
+
+    raw = bytes(raw)
+    if not raw:
+        raise ValueError('empty graph cache')
+
+    if raw[:1] == b'{':
+        # v1: 마이그레이션 이전에 저장된 JSON 텍스트
+        return json.loads(raw.decode('utf-8'))
+
+    if raw[0] != GRAPH_FORMAT_V2:
+        raise ValueError(f'unknown graph cache format: {raw[0]}')
+
+    try:
+        payload = json.loads(zlib.decompress(raw[1:]).decode('utf-8'))
+    except zlib.error as e:
+        raise ValueError(f'corrupt graph cache: {e}') from e
+
+    concepts = concept_lookup(payload['p'] + payload['s'])
+
+    nodes = []
+    for ids, is_primary in ((payload['p'], True), (payload['s'], False)):
+        for concept_id in ids:
+            summary = concepts.get(concept_id)
+            if summary is None:
+                # 캐시 생성 이후 삭제된 개념
+                continue
+            name, description, examples = summary
+            nodes.append(make_node(concept_id, name, description, examples, is_primary))
+
+    node_ids = {node['id'] for node in nodes}
+    edges = [
+        {"from": from_id, "to": to_id, "strength": strength}
+        for from_id, to_id, strength in payload['e']
+        if from_id in node_ids and to_id in node_ids
+    ]
+
+    return {"nodes": nodes, "edges": edges}
@@ -0,0 +1,277 @@
+"""
+LLM 응답 캐시
+
+(model, prompt, temperature, max_tokens) 해시를 키로 하는 콘텐츠 주소 기반 캐시입니다.
+동일한 프롬프트를 다시 보낼 때 OpenRouter 호출 없이 이전 응답을 재사용합니다.
+
+백엔드:
+- SQLiteCacheBackend: 로컬 디스크 (기본값)
+- RedisCacheBackend: 여러 워커가 공유하는 Redis
+
+환경 변수:
+    LLM_CACHE_BACKEND      'sqlite' | 'redis' | 'none' (기본값: 'sqlite')
+    LLM_CACHE_PATH         SQLite 파일 경로 (기본값: 'instance/llm_cache.sqlite3')
+    LLM_CACHE_TTL          캐시 유효 시간 (초, 기본값: 30일, 0이면 만료 없음)
+    LLM_CACHE_MAX_ENTRIES  최대 항목 수 (초과 시 LRU 제거, 기본값: 50000)
+"""
+
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+from typing import Dict, Optional
+
+
+class SQLiteCacheBackend:
+    """SQLite 파일 기반 캐시 백엔드 (TTL + 크기 제한 LRU)"""
+
+    def __init__(self, path: str, ttl: int = 0, max_entries: int = 50000):
+        """
+        Args:
+            path (str): SQLite 파일 경로
+            ttl (int): 유효 시간 (초). 0이면 만료 없음
+            max_entries (int): 최대 항목 수
+        """
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        self.ttl = ttl
+        self.max_entries = max_entries
+        # ETL 워커 스레드들이 공유하므로 단일 연결 + 락으로 직렬화
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS llm_cache ("
+            " cache_key TEXT PRIMARY KEY,"
+            " value TEXT NOT NULL,"
+            " created_at REAL NOT NULL,"
+            " accessed_at REAL NOT NULL)"
+        )
+        self._conn.execute(
+            "CREATE INDEX IF NOT EXISTS idx_llm_cache_accessed ON llm_cache (accessed_at)"
+        )
+        self._conn.commit()
+
+    def get(self, key: str) -> Optional[str]:
+        now = time.time()
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT value, created_at FROM llm_cache WHERE cache_key = ?", (key,)
+            ).fetchone()
+            if row is None:
+                return None
+
+            value, created_at = row
+            if self.ttl and now - created_at > self.ttl:
+                self._conn.execute("DELETE FROM llm_cache WHERE cache_key = ?", (key,))
+                self._conn.commit()
+                return None
+
+            self._conn.execute(
+                "UPDATE llm_cache SET accessed_at = ? WHERE cache_key = ?", (now, key)
+            )
+            self._conn.commit()
+            return value
+
+    def set(self, key: str, value: str) -> int:
+        """
+        Returns:
+            int: LRU로 제거된 항목 수
+        """
+        now = time.time()
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO llm_cache (cache_key, value, created_at, accessed_at)"
+                " VALUES (?, ?, ?, ?)",
+                (key, value, now, now)
+            )
+            evicted = 0
+            (count,) = self._conn.execute("SELECT COUNT(*) FROM llm_cache").fetchone()
+            if count > self.max_entries:
+                cursor = self._conn.execute(
+                    "DELETE FROM llm_cache WHERE cache_key IN ("
+                    " SELECT cache_key FROM llm_cache ORDER BY accessed_at ASC LIMIT ?)",
+                    (count - self.max_entries,)
+                )
+                evicted = cursor.rowcount
+            self._conn.commit()
+            return evicted
+
+
+class RedisCacheBackend:
+    """Redis 기반 캐시 백엔드 (키 TTL + sorted set으로 LRU 관리)"""
+
+    PREFIX = 'llm_cache:'
+    LRU_KEY = 'llm_cache:__lru__'
+
+    def __init__(self, client, ttl: int = 0, max_entries: int = 50000):
+        """
+        Args:
+            client: redis.Redis 클라이언트
+            ttl (int): 유효 시간 (초). 0이면 만료 없음
+            max_entries (int): 최대 항목 수
+        """
+        self.client = client
+        self.ttl = ttl
+        self.max_entries = max_entries
+
+    def get(self, key: str) -> Optional[str]:
+        value = self.client.get(self.PREFIX + key)
+        if value is None:
+            # TTL로 만료된 키는 LRU 목록에서도 정리
+            self.client.zrem(self.LRU_KEY, key)
+            return None
+
+        self.client.zadd(self.LRU_KEY, {key: time.time()})
+        return value.decode('utf-8') if isinstance(value, bytes) else value
+
+    def set(self, key: str, value: str) -> int:
+        pipe = self.client.pipeline()
+        pipe.set(self.PREFIX + key, value, ex=self.ttl or None)
+        pipe.zadd(self.LRU_KEY, {key: time.time()})
+        pipe.zcard(self.LRU_KEY)
+        count = pipe.execute()[-1]
+
+        overflow = count - self.max_entries
+        if overflow <= 0:
+            return 0
+
+        evicted_keys = [
+            member.decode('utf-8') if isinstance(member, bytes) else member
+            for member, _ in self.client.zpopmin(self.LRU_KEY, overflow)
+        ]
+        if evicted_keys:
+            self.client.delete(*[self.PREFIX + k for k in evicted_keys])
+        return len(evicted_keys)
+
+
+class LLMCache:
+    """
+    LLM 응답 캐시 (백엔드 교체 가능)
+
+    Attributes:
+        backend: get(key)/set(key, value) 인터페이스를 가진 백엔드
+        hits (int): 캐시 적중 수
+        misses (int): 캐시 미스 수
+        stores (int): 저장 횟수
+        evictions (int): LRU 제거 수
+    """
+
+    def __init__(self, backend):
+        self.backend = backend
+        self.hits = 0
+        self.misses = 0
+        self.stores = 0
+        self.evictions = 0
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def make_key(model: str, prompt: str, temperature: float, max_tokens: int) -> str:
+        """
+        요청 파라미터의 SHA-256 해시 생성
+
+        Returns:
+            str: 캐시 키 (hex)
+        """
+        payload = json.dumps(
+            [model, prompt, float(temperature), int(max_tokens)],
+            ensure_ascii=False,
+            separators=(',', ':')
+        )
+        return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+
+    def get(self, model: str, prompt: str, temperature: float, max_tokens: int) -> Optional[str]:
+        """
+        캐시된 응답 조회 (백엔드 오류는 미스로 처리)
+
+        Returns:
+            str: 캐시된 응답 텍스트. 없으면 None
+        """
+        key = self.make_key(model, prompt, temperature, max_tokens)
+        try:
+            value = self.backend.get(key)
+        except Exception as e:
+            print(f"     ! LLM cache read failed: {e}")
+            value = None
+
+        with self._lock:
+            if value is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+        return value
+
+    def set(self, model: str, prompt: str, temperature: float, max_tokens: int, value: str):
+        """
+        응답 저장 (검증을 통과한 응답만 저장해야 재시도 시 잘못된 응답이 반복되지 않음)
+        """
+        key = self.make_key(model, prompt, temperature, max_tokens)
+        try:
+            evicted = self.backend.set(key, value)
+        except Exception as e:
+            print(f"     ! LLM cache write failed: {e}")
+            return
+
+        with self._lock:
+            self.stores += 1
+            self.evictions += evicted
+
+    def stats(self) -> Dict:
+        """
+        캐시 지표 반환
+
+        Returns:
+            dict: {'hits', 'misses', 'stores', 'evictions', 'hit_rate'}
+        """
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                'hits': self.hits,
+                'misses': self.misses,
+                'stores': self.stores,
+                'evictions': self.evictions,
+                'hit_rate': round(self.hits / lookups, 4) if lookups else 0.0
+            }
+
+
+_llm_cache = None
+_llm_cache_initialized = False
+_llm_cache_lock = threading.Lock()
+
+
+def get_llm_cache() -> Optional[LLMCache]:
+    """
+    환경 변수 설정에 따른 LLMCache 싱글톤 반환
+
+    Returns:
+        LLMCache: 캐시 객체. LLM_CACHE_BACKEND=none 이거나 초기화 실패 시 None
+    """
+    global _llm_cache, _llm_cache_initialized
+
+    with _llm_cache_lock:
+        if _llm_cache_initialized:
+            return _llm_cache
+        _llm_cache_initialized = True
+
+        backend_name = os.getenv('LLM_CACHE_BACKEND', 'sqlite').lower()
+        ttl = int(os.getenv('LLM_CACHE_TTL', 30 * 24 * 3600))
+        max_entries = int(os.getenv('LLM_CACHE_MAX_ENTRIES', 50000))
+
+        try:
+            if backend_name == 'none':
+                return None
+            if backend_name == 'redis':
+                from app.extensions import get_redis_client
+                backend = RedisCacheBackend(get_redis_client(), ttl=ttl, max_entries=max_entries)
+            else:
+                path = os.getenv('LLM_CACHE_PATH', os.path.join('instance', 'llm_cache.sqlite3'))
+                backend = SQLiteCacheBackend(path, ttl=ttl, max_entries=max_entries)
+        except Exception as e:
+            print(f"⚠️ LLM 캐시 초기화 실패 (캐시 없이 진행): {e}")
+            return None
+
+        _llm_cache = LLMCache(backend)
+        return _llm_cache
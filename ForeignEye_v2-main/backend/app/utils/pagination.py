@@ -0,0 +1,111 @@
+"""
+키셋(커서) 페이지네이션
+
+OFFSET 대신 마지막으로 본 행의 (정렬 값, ID)를 불투명 커서로 넘겨,
+페이지 깊이와 무관하게 인덱스 범위 탐색 한 번으로 다음 페이지를 가져옵니다.
+커서는 정렬 값과 ID를 담은 JSON의 base64url 인코딩입니다.
+"""
+
+import base64
+import binascii
+import json
+from datetime import datetime
+
+from sqlalchemy import and_, or_
+
+from app.utils.exceptions import ValidationError
+
+
+def encode_cursor(sort_value, row_id) -> str:
+    """
+    (정렬 값, ID)를 불투명 커서 문자열로 인코딩
+
+    Args:
+        sort_value: 마지막 행의 정렬 컬럼 값 (datetime, str, int)
+        row_id (int): 마지막 행의 ID
+
+    Returns:
+        str: 커서
+    """
+    if isinstance(sort_value, datetime):
+        payload = {'t': 'dt', 'v': sort_value.isoformat(), 'i': row_id}
+    else:
+        payload = {'t': 'raw', 'v': sort_value, 'i': row_id}
+
+    raw = json.dumps(payload, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+    return base64.urlsafe_b64encode(raw).decode('ascii').rstrip('=')
+
+
+def decode_cursor(cursor: str):
+    """
+    커서 문자열을 (정렬 값, ID)로 디코딩
+
+    Args:
+        cursor (str): encode_cursor로 만든 커서
+
+    Returns:
+        tuple: (sort_value, row_id)
+
+    Raises:
+        ValidationError: 형식이 올바르지 않은 커서
+    """
+    try:
+        padded = cursor + '=' * (-len(cursor) % 4)
+        payload = json.loads(base64.urlsafe_b64decode(padded.encode('ascii')).decode('utf-8'))
+        row_id = int(payload['i'])
+        sort_value = payload['v']
+        if payload.get('t') == 'dt':
+            sort_value = datetime.fromisoformat(sort_value)
+    except (ValueError, KeyError, TypeError, UnicodeError, binascii.Error):
+        raise ValidationError('유효하지 않은 커서입니다.', 'cursor')
+
+    return sort_value, row_id
+
+
+def keyset_paginate(query, sort_column, id_column, limit, cursor=None, descending=True):
+    """
+    (sort_column, id_column) 키셋 페이지 조회
+
+    Args:
+        query: 필터가 적용된 SQLAlchemy Query
+        sort_column: 정렬 컬럼 (예: Article.created_at)
+        id_column: 동률을 깨는 유일 컬럼 (예: Article.article_id)
+        limit (int): 페이지 크기
+        cursor (str, optional): 이전 페이지의 next_cursor. None이면 첫 페이지
+        descending (bool): 내림차순 여부
+
+    Returns:
+        tuple: (행 리스트, next_cursor 또는 None)
+
+    Raises:
+        ValidationError: 형식이 올바르지 않은 커서
+    """
+    if cursor:
+        sort_value, row_id = decode_cursor(cursor)
+        if descending:
+            query = query.filter(or_(
+                sort_column < sort_value,
+                and_(sort_column == sort_value, id_column < row_id)
+            ))
+        else:
+            query = query.filter(or_(
+                sort_column > sort_value,
+                and_(sort_column == sort_value, id_column > row_id)
+            ))
+
+    if descending:
+        query = query.order_by(sort_column.desc(), id_column.desc())
+    else:
+        query = query.order_by(sort_column.asc(), id_column.asc())
+
+    # 다음 페이지 존재 여부 확인용으로 1건 더 조회
+    rows = query.limit(limit + 1).all()
+    has_next = len(rows) > limit
+    rows = rows[:limit]
+
+    next_cursor = None
+    if has_next:
+        last = rows[-1]
+        next_cursor = encode_cursor(getattr(last, sort_column.key), getattr(last, id_column.key))
+
+    return rows, next_cursor
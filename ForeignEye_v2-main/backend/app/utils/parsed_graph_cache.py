@@ -0,0 +1,144 @@
+"""
+파싱된 그래프 캐시 (프로세스 로컬 LRU)
+
+Article.graph_cache에 저장된 직렬화 그래프를 (article_id, graph_cache_version) 키로
+파싱(개념 정보 하이드레이션 포함)된 상태로 보관하여, 인기 기사를 조회할 때마다 같은 문서를 다시 파싱하지 않도록 합니다.
+그래프 캐시가 재생성되면 버전이 올라가므로 이전 항목은 자연스럽게 LRU로 밀려납니다.
+
+캐시된 그래프는 여러 요청이 공유하므로 직접 수정하면 안 됩니다.
+overlay()가 반환하는 복사본(노드 dict만 얕은 복사)을 수정해야 합니다.
+
+환경 변수:
+    GRAPH_PARSE_CACHE_MAX_BYTES  파싱된 그래프의 추정 메모리 총량 상한 (바이트, 기본값: 32MB, 0이면 비활성화)
+"""
+
+import os
+import threading
+from collections import OrderedDict
+from typing import Callable, Dict, Hashable, Optional
+
+
+class ParsedGraphCache:
+    """
+    추정 메모리 크기 합계로 제한되는 파싱 그래프 LRU
+
+    Attributes:
+        max_bytes (int): 추정 메모리 크기 합계 상한
+        hits (int): 캐시 적중 수
+        misses (int): 캐시 미스(파싱) 수
+        evictions (int): LRU 제거 수
+    """
+
+    def __init__(self, max_bytes: int = 32 * 1024 * 1024):
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._size = 0
+        self._data: "OrderedDict[Hashable, tuple]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get_or_parse(self, key: Hashable, raw, parse: Callable) -> Optional[Dict]:
+        """
+        파싱된 그래프 조회 (없으면 파싱 후 저장)
+
+        Args:
+            key: (article_id, graph_cache_version)
+            raw: 직렬화된 그래프
+            parse: raw를 그래프 dict로 변환하는 함수 (실패 시 예외)
+
+        Returns:
+            dict: 공유 그래프 (읽기 전용). 파싱 실패 시 None
+        """
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is not None:
+                self._data.move_to_end(key)
+                self.hits += 1
+                return entry[1]
+            self.misses += 1
+
+        try:
+            graph = parse(raw)
+        except (ValueError, TypeError, AttributeError):
+            return None
+
+        # 공유 객체의 목록이 실수로 변경되지 않도록 튜플로 고정 (JSON 직렬화 결과는 동일)
+        graph = {
+            'nodes': tuple(graph.get('nodes', ())),
+            'edges': tuple(graph.get('edges', ()))
+        }
+
+        size = self._estimate_size(graph)
+        if not self.max_bytes or size > self.max_bytes:
+            return graph
+
+        with self._lock:
+            if key not in self._data:
+                self._data[key] = (size, graph)
+                self._size += size
+                while self._size > self.max_bytes:
+                    _, (evicted_size, _) = self._data.popitem(last=False)
+                    self._size -= evicted_size
+                    self.evictions += 1
+        return graph
+
+    @staticmethod
+    def _estimate_size(graph: Dict) -> int:
+        """
+        파싱된 그래프의 대략적인 메모리 크기 (바이트)
+
+        저장 형식이 압축되어 있어 원본 길이로는 메모리 사용량을 알 수 없으므로,
+        노드의 문자열 길이와 dict/엣지당 고정 오버헤드로 추정합니다.
+        """
+        size = 0
+        for node in graph['nodes']:
+            size += 600 + 2 * (len(node.get('label') or '') + len(node.get('description') or ''))
+            size += sum(64 + 2 * len(example) for example in node.get('real_world_examples') or ())
+        return size + 250 * len(graph['edges'])
+
+    @staticmethod
+    def overlay(graph: Dict) -> Dict:
+        """
+        요청별로 수정 가능한 그래프 복사본
+
+        노드 dict만 얕게 복사하므로 is_collected 같은 사용자별 필드를 안전하게 덮어쓸 수 있습니다.
+        엣지는 수정되지 않으므로 공유 객체를 새 리스트에 담아 반환합니다.
+
+        Returns:
+            dict: {'nodes': [...], 'edges': [...]}
+        """
+        return {
+            'nodes': [dict(node) for node in graph['nodes']],
+            'edges': list(graph['edges'])
+        }
+
+    def stats(self) -> Dict:
+        """
+        캐시 지표 반환
+
+        Returns:
+            dict: {'entries', 'bytes', 'max_bytes', 'hits', 'misses', 'evictions', 'hit_rate'}
+        """
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                'entries': len(self._data),
+                'bytes': self._size,
+                'max_bytes': self.max_bytes,
+                'hits': self.hits,
+                'misses': self.misses,
+                'evictions': self.evictions,
+                'hit_rate': round(self.hits / lookups, 4) if lookups else 0.0
+            }
+
+    def clear(self):
+        """전체 제거"""
+        with self._lock:
+            self._data.clear()
+            self._size = 0
+
+
+parsed_graph_cache = ParsedGraphCache(
+    max_bytes=int(os.getenv('GRAPH_PARSE_CACHE_MAX_BYTES', 32 * 1024 * 1024))
+)
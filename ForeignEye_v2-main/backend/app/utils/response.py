@@ -131,3 +131,50 @@ def paginated_response(items, page, total_items, items_per_page, meta=None):
     
     return success_response(data, meta=meta)
 
+
+
+def cursor_paginated_response(items, next_cursor, items_per_page, total_items=None,
+                              items_key='items', extra=None, meta=None):
+    """
+    커서(키셋) 페이지네이션 응답 생성
+    
+    Args:
+        items (list): 현재 페이지 항목 리스트
+        next_cursor (str): 다음 페이지 커서 (마지막 페이지면 None)
+        items_per_page (int): 페이지당 항목 수
+        total_items (int): 전체 항목 수 (선택적)
+        items_key (str): 항목 리스트의 키 (기본값: 'items')
+        extra (dict): data에 함께 넣을 필드 (선택적)
+        meta (dict): 추가 메타데이터 (선택적)
+        
+    Returns:
+        tuple: (JSON 응답, HTTP 상태 코드)
+        
+    Example:
+        >>> cursor_paginated_response([{'id': 1}], 'eyJ0Ijo...', 1, 20)
+        ({
+            "success": True,
+            "data": {
+                "items": [{"id": 1}],
+                "pagination": {
+                    "next_cursor": "eyJ0Ijo...",
+                    "has_next": True,
+                    "items_per_page": 1,
+                    "total_items": 20
+                }
+            },
+            "meta": {"timestamp": "...", "version": "v1"}
+        }, 200)
+    """
+    data = {
+        **(extra or {}),
+        items_key: items,
+        'pagination': {
+            'next_cursor': next_cursor,
+            'has_next': next_cursor is not None,
+            'items_per_page': items_per_page,
+            'total_items': total_items
+        }
+    }
+    
+    return success_response(data, meta=meta)
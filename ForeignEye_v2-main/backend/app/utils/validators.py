@@ -142,6 +142,35 @@ def validate_pagination(page, limit, max_limit=50):
     return page, limit
 
 
+def validate_limit(limit, default=20, max_limit=50):
+    """
+    커서 페이지네이션의 페이지 크기 검증
+
+    Args:
+        limit (any): 페이지당 항목 수 (문자열 또는 정수, 없으면 default)
+        default (int): 기본 페이지 크기 (기본값: 20)
+        max_limit (int): 최대 제한 (기본값: 50)
+
+    Returns:
+        int: 검증된 페이지 크기
+
+    Raises:
+        ValidationError: 검증 실패 시
+    """
+    try:
+        limit = int(limit or default)
+    except (ValueError, TypeError):
+        raise ValidationError('제한은 정수여야 합니다.', 'limit')
+
+    if limit < 1:
+        raise ValidationError('제한은 1 이상이어야 합니다.', 'limit')
+
+    if limit > max_limit:
+        raise ValidationError(f'제한은 최대 {max_limit}까지 가능합니다.', 'limit')
+
+    return limit
+
+
 def validate_concept_id(concept_id):
     """
     개념 ID 검증
@@ -0,0 +1,209 @@
+"""
+그래프 캐시 빌더 벤치마크
+
+기존 빌더(Primary 조회 + 정렬된 관계 쿼리 2회 + Python 2차 노드 제한)와
+단일 쿼리(UNION ALL + 윈도 함수) 빌더를 합성 그래프에서 비교하고,
+두 빌더의 출력이 모든 기사에서 동일한지 검증합니다.
+
+사용법:
+    python bench_graph_cache.py
+    python bench_graph_cache.py --relations 100000 --concepts 5000 --articles 500
+
+환경 변수:
+    BENCH_DATABASE_URL  벤치마크용 DB URL (기본값: 'sqlite://' 인메모리)
+                        테이블을 생성/삭제하므로 운영 DB를 지정하지 마세요.
+"""
+
+import argparse
+import os
+import random
+import time
+
+from flask import Flask
+from sqlalchemy import insert
+from sqlalchemy.orm import aliased
+
+from app.extensions import db
+from app.models import Article, Concept, Article_Concept, Concept_Relation
+from app.services.graph_service import GraphService
+
+
+def legacy_build_graph_cache_for_article(article_id, min_strength=3, max_secondary_nodes=15):
+    """
+    기존 빌더 (비교 기준)
+
+    관계 쿼리에 relation_id 동률 정렬만 추가한 것 외에는 이전 구현과 동일합니다.
+    """
+    primary_concepts = db.session.query(Concept).join(
+        Article_Concept,
+        Concept.concept_id == Article_Concept.concept_id
+    ).filter(
+        Article_Concept.article_id == article_id
+    ).order_by(Concept.concept_id).all()
+
+    primary_concept_ids = {c.concept_id for c in primary_concepts}
+
+    if not primary_concept_ids:
+        return {"nodes": [], "edges": []}
+
+    C1 = aliased(Concept)
+    C2 = aliased(Concept)
+
+    relations_query_1 = db.session.query(Concept_Relation, C2).join(
+        C2, Concept_Relation.to_concept_id == C2.concept_id
+    ).filter(
+        Concept_Relation.from_concept_id.in_(primary_concept_ids),
+        Concept_Relation.strength >= min_strength
+    ).order_by(Concept_Relation.strength.desc(), Concept_Relation.relation_id)
+
+    relations_query_2 = db.session.query(Concept_Relation, C1).join(
+        C1, Concept_Relation.from_concept_id == C1.concept_id
+    ).filter(
+        Concept_Relation.to_concept_id.in_(primary_concept_ids),
+        Concept_Relation.strength >= min_strength
+    ).order_by(Concept_Relation.strength.desc(), Concept_Relation.relation_id)
+
+    nodes_map = {}
+    edges_data = []
+    secondary_nodes_added = 0
+
+    for concept in primary_concepts:
+        nodes_map[concept.concept_id] = GraphService._primary_node(concept)
+
+    for query, other_attr in ((relations_query_1, 'to_concept_id'), (relations_query_2, 'from_concept_id')):
+        for relation, other in query.all():
+            if other.concept_id not in nodes_map:
+                if other.concept_id not in primary_concept_ids:
+                    if secondary_nodes_added >= max_secondary_nodes:
+                        continue
+                    secondary_nodes_added += 1
+
+                nodes_map[other.concept_id] = GraphService._related_node(
+                    other,
+                    other.concept_id in primary_concept_ids
+                )
+
+            edges_data.append({
+                "from": relation.from_concept_id,
+                "to": relation.to_concept_id,
+                "strength": relation.strength
+            })
+
+    return {
+        "nodes": list(nodes_map.values()),
+        "edges": edges_data
+    }
+
+
+def populate(num_concepts, num_relations, num_articles, concepts_per_article, seed):
+    """합성 그래프 생성 (strength 1~10 균등 분포)"""
+    rng = random.Random(seed)
+
+    db.session.execute(insert(Concept), [
+        {'name': f'concept-{i}', 'description_ko': f'개념 {i} 설명', 'real_world_examples_ko': [f'사례 {i}']}
+        for i in range(1, num_concepts + 1)
+    ])
+    db.session.execute(insert(Article), [
+        {'title': f'article-{i}', 'original_url': f'https://bench.local/{i}', 'summary_ko': '요약'}
+        for i in range(1, num_articles + 1)
+    ])
+    concept_ids = [row[0] for row in db.session.query(Concept.concept_id).all()]
+    article_ids = [row[0] for row in db.session.query(Article.article_id).all()]
+
+    db.session.execute(insert(Article_Concept), [
+        {'article_id': article_id, 'concept_id': concept_id}
+        for article_id in article_ids
+        for concept_id in rng.sample(concept_ids, concepts_per_article)
+    ])
+
+    pairs = set()
+    while len(pairs) < num_relations:
+        from_id, to_id = rng.sample(concept_ids, 2)
+        pairs.add((from_id, to_id))
+    db.session.execute(insert(Concept_Relation), [
+        {'from_concept_id': from_id, 'to_concept_id': to_id, 'relation_type': 'RELATED_TO', 'strength': rng.randint(1, 10)}
+        for from_id, to_id in pairs
+    ])
+    db.session.commit()
+    return article_ids
+
+
+def timed(label, func, repeat):
+    best = None
+    result = None
+    for _ in range(repeat):
+        started = time.perf_counter()
+        result = func()
+        elapsed = time.perf_counter() - started
+        best = elapsed if best is None else min(best, elapsed)
+    print(f"  ⏱ {label}: {best:.3f}s (best of {repeat})")
+    return result, best
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Graph cache builder benchmark')
+    parser.add_argument('--concepts', type=int, default=5000)
+    parser.add_argument('--relations', type=int, default=100000)
+    parser.add_argument('--articles', type=int, default=500)
+    parser.add_argument('--concepts-per-article', type=int, default=8)
+    parser.add_argument('--repeat', type=int, default=3)
+    parser.add_argument('--seed', type=int, default=42)
+    args = parser.parse_args()
+
+    app = Flask(__name__)
+    app.config['SQLALCHEMY_DATABASE_URI'] = os.getenv('BENCH_DATABASE_URL', 'sqlite://')
+    db.init_app(app)
+
+    with app.app_context():
+        db.create_all()
+        try:
+            print("=" * 70)
+            print("Graph Cache Builder Benchmark")
+            print("=" * 70)
+            print(f"Concepts: {args.concepts}, Relations: {args.relations}, "
+                  f"Articles: {args.articles} x {args.concepts_per_article} concepts")
+            print()
+
+            started = time.perf_counter()
+            article_ids = populate(
+                args.concepts, args.relations, args.articles, args.concepts_per_article, args.seed
+            )
+            print(f"✓ Synthetic graph populated in {time.perf_counter() - started:.2f}s")
+            print()
+
+            legacy, legacy_time = timed(
+                'Legacy builder (per article, 3 queries)',
+                lambda: {aid: legacy_build_graph_cache_for_article(aid) for aid in article_ids},
+                args.repeat
+            )
+            single, single_time = timed(
+                'Single-query builder (per article)',
+                lambda: {aid: GraphService.build_graph_cache_for_article(aid) for aid in article_ids},
+                args.repeat
+            )
+            bulk, bulk_time = timed(
+                'Single-query builder (all articles, 1 query)',
+                lambda: GraphService.build_graph_caches_bulk(article_ids),
+                args.repeat
+            )
+
+            mismatches = [aid for aid in article_ids if not (legacy[aid] == single[aid] == bulk[aid])]
+            edges = sum(len(graph['edges']) for graph in legacy.values())
+
+            print()
+            print("-" * 70)
+            print(f"✓ Edges in output: {edges}")
+            print(f"⚡ Speedup (per article): {legacy_time / single_time:.2f}x")
+            print(f"⚡ Speedup (bulk): {legacy_time / bulk_time:.2f}x")
+            if mismatches:
+                print(f"✗ Output mismatch in {len(mismatches)} articles (e.g. {mismatches[:5]})")
+            else:
+                print(f"✓ Identical output for all {len(article_ids)} articles")
+            print("=" * 70)
+        finally:
+            db.session.remove()
+            db.drop_all()
+
+
+if __name__ == "__main__":
+    main()
@@ -16,5 +16,7 @@ __all__ = [
     'AIAnalyzer',
     'DBLoader',
     'SimilarityCalculator',
+    'SimilarityEngine',
+    'ConceptLSHIndex',
     'neo4j_client' # 새로 추가한 neo4j_client 모듈
 ]
\ No newline at end of file
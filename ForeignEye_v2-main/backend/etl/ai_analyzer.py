@@ -7,18 +7,33 @@ OpenRouter API를 사용하여 기사를 분석하고 개념을 추출합니다.
 import os
 import json
 import re
-from typing import Optional, Dict, List
+from typing import Optional, Dict, List, Tuple
 from openai import OpenAI
 
+from app.utils.llm_cache import LLMCache, get_llm_cache
+
 
 class AIAnalyzer:
     """AI 기반 기사 분석 클래스"""
     
-    def __init__(self, api_key: Optional[str] = None, model: str = "anthropic/claude-3-haiku"):
+    # 기사 본문 최대 길이 (프롬프트에 포함되는 문자 수)
+    ARTICLE_CHAR_LIMIT = 3000
+    # 토큰 수 추정용 (영문 기준 대략 4자 = 1토큰)
+    CHARS_PER_TOKEN = 4
+    # 배치 요청에서 기사 1건당 예상 출력 토큰 수
+    BATCH_OUTPUT_TOKENS_PER_ARTICLE = 600
+    
+    def __init__(
+        self,
+        api_key: Optional[str] = None,
+        model: str = "anthropic/claude-3-haiku",
+        cache: Optional[LLMCache] = None
+    ):
         """
         Args:
             api_key (str, optional): OpenRouter API 키. None이면 환경 변수에서 로드
             model (str): 사용할 AI 모델 (기본값: claude-3-haiku)
+            cache (LLMCache, optional): LLM 응답 캐시. None이면 환경 변수 설정에 따른 기본 캐시
         """
         self.api_key = api_key or os.getenv('OPENROUTER_API_KEY')
         
@@ -34,6 +49,48 @@ class AIAnalyzer:
                 "X-Title": "TechExplained Project"
             }
         )
+        self.cache = cache if cache is not None else get_llm_cache()
+    
+    def _complete(self, prompt: str, temperature: float, max_tokens: int) -> Tuple[Optional[str], bool]:
+        """
+        채팅 완성 요청 (캐시 우선)
+        
+        Args:
+            prompt (str): 프롬프트
+            temperature (float): 샘플링 온도
+            max_tokens (int): 최대 출력 토큰 수
+            
+        Returns:
+            tuple: (응답 텍스트 or None, 캐시 적중 여부)
+        """
+        if self.cache:
+            cached = self.cache.get(self.model, prompt, temperature, max_tokens)
+            if cached is not None:
+                print("     ✓ LLM cache hit (no network call)")
+                return cached, True
+        
+        response = self.client.chat.completions.create(
+            model=self.model,
+            messages=[
+                {
+                    "role": "user",
+                    "content": prompt
+                }
+            ],
+            temperature=temperature,
+            max_tokens=max_tokens
+        )
+        
+        if not response or not response.choices:
+            print("     ✗ Empty response from OpenRouter API")
+            return None, False
+        
+        return response.choices[0].message.content.strip(), False
+    
+    def _remember(self, prompt: str, temperature: float, max_tokens: int, ai_response: str):
+        """검증을 통과한 응답을 캐시에 저장"""
+        if self.cache:
+            self.cache.set(self.model, prompt, temperature, max_tokens, ai_response)
     
     def analyze_article(self, article_text: str) -> Optional[Dict]:
         """
@@ -62,29 +119,19 @@ class AIAnalyzer:
             print(f"     → Model: {self.model}")
             print(f"     → Article length: {len(article_text)} chars")
             
-            response = self.client.chat.completions.create(
-                model=self.model,
-                messages=[
-                    {
-                        "role": "user",
-                        "content": prompt
-                    }
-                ],
-                temperature=0.5,
-                max_tokens=3000
-            )
+            ai_response, from_cache = self._complete(prompt, temperature=0.5, max_tokens=3000)
             
-            if not response or not response.choices:
-                print("     ✗ Empty response from OpenRouter API")
+            if ai_response is None:
                 return None
             
-            ai_response = response.choices[0].message.content.strip()
             print(f"     ✓ Received response ({len(ai_response)} chars)")
             
             # JSON 파싱
             analysis_result = self._parse_response(ai_response)
 
             if analysis_result:
+                if not from_cache:
+                    self._remember(prompt, 0.5, 3000, ai_response)
                 print(f"     ✓ AI analysis complete!")
                 print(f"     ✓ Title (ko): {analysis_result['title_ko'][:50]}...")
                 print(f"     ✓ Summary length: {len(analysis_result['summary_ko'])} chars")
@@ -107,7 +154,7 @@ class AIAnalyzer:
             str: 프롬프트
         """
         # 텍스트 길이 제한 (3000자)
-        truncated_text = article_text[:3000]
+        truncated_text = article_text[:self.ARTICLE_CHAR_LIMIT]
         
         prompt = f"""
 You are 'TechExplained', an expert technology scout.
@@ -235,6 +282,164 @@ Important rules:
         except Exception:
             pass
     
+    def analyze_articles_batch(
+        self,
+        article_texts: List[str],
+        token_budget: int = 6000,
+        max_batch_size: int = 5
+    ) -> Dict[int, Optional[Dict]]:
+        """
+        여러 기사를 하나의 요청으로 묶어 분석
+        
+        입력 토큰 추정치가 token_budget을 넘지 않도록 기사들을 배치로 나누고,
+        응답에서 검증에 실패했거나 누락된 기사는 analyze_article로 개별 재시도합니다.
+        
+        Args:
+            article_texts (List[str]): 분석할 기사 텍스트 목록
+            token_budget (int): 배치 1건의 입력 토큰 예산 (추정치)
+            max_batch_size (int): 배치 1건에 포함할 최대 기사 수
+            
+        Returns:
+            dict: {입력 인덱스: analyze_article과 같은 형식의 결과 or None}
+        """
+        results: Dict[int, Optional[Dict]] = {}
+        batches: List[List[int]] = []
+        current: List[int] = []
+        current_tokens = 0
+        
+        for idx, text in enumerate(article_texts):
+            if not text or len(text.strip()) < 100:
+                print(f"     ✗ Article #{idx} text too short (length: {len(text) if text else 0})")
+                results[idx] = None
+                continue
+            
+            tokens = len(text[:self.ARTICLE_CHAR_LIMIT]) // self.CHARS_PER_TOKEN
+            if current and (current_tokens + tokens > token_budget or len(current) >= max_batch_size):
+                batches.append(current)
+                current, current_tokens = [], 0
+            current.append(idx)
+            current_tokens += tokens
+        
+        if current:
+            batches.append(current)
+        
+        for batch in batches:
+            batch_results = self._analyze_batch(batch, article_texts) if len(batch) > 1 else {}
+            
+            for idx in batch:
+                if batch_results.get(idx):
+                    results[idx] = batch_results[idx]
+                else:
+                    # 배치 응답에서 검증 실패/누락된 기사는 단건 요청으로 폴백
+                    print(f"     → Falling back to single-article analysis for #{idx}")
+                    results[idx] = self.analyze_article(article_texts[idx])
+        
+        return results
+    
+    def _analyze_batch(self, batch: List[int], article_texts: List[str]) -> Dict[int, Dict]:
+        """
+        배치 1건 요청 및 기사별 결과 검증
+        
+        Args:
+            batch (List[int]): 배치에 포함된 입력 인덱스 목록
+            article_texts (List[str]): 전체 기사 텍스트 목록
+            
+        Returns:
+            dict: {입력 인덱스: 검증된 분석 결과} (검증 실패 항목은 제외)
+        """
+        prompt = self._build_batch_prompt([(idx, article_texts[idx]) for idx in batch])
+        max_tokens = min(4000, self.BATCH_OUTPUT_TOKENS_PER_ARTICLE * len(batch))
+        
+        try:
+            print(f"     ⟳ Sending batch request for {len(batch)} articles...")
+            ai_response, from_cache = self._complete(prompt, temperature=0.5, max_tokens=max_tokens)
+        except Exception as e:
+            print(f"     ✗ Error during batch analysis: {type(e).__name__}: {e}")
+            return {}
+        
+        if ai_response is None:
+            return {}
+        
+        try:
+            payload = json.loads(ai_response)
+        except json.JSONDecodeError:
+            json_match = re.search(r'\{.*\}', ai_response, re.DOTALL)
+            try:
+                payload = json.loads(json_match.group(0)) if json_match else None
+            except json.JSONDecodeError:
+                payload = None
+        
+        if not isinstance(payload, dict) or not isinstance(payload.get('articles'), list):
+            print("     ✗ Batch response has no 'articles' list")
+            self._save_debug_response(ai_response, prefix="debug_batch")
+            return {}
+        
+        validated: Dict[int, Dict] = {}
+        for entry in payload['articles']:
+            if not isinstance(entry, dict):
+                continue
+            idx = entry.pop('index', None)
+            if idx not in batch or idx in validated:
+                continue
+            analysis = self._validate_analysis(entry)
+            if analysis:
+                validated[idx] = analysis
+        
+        print(f"     ✓ Batch analysis complete ({len(validated)}/{len(batch)} valid)")
+        
+        if len(validated) == len(batch) and not from_cache:
+            self._remember(prompt, 0.5, max_tokens, ai_response)
+        
+        return validated
+    
+    def _build_batch_prompt(self, entries: List[Tuple[int, str]]) -> str:
+        """
+        배치 분석 프롬프트 생성
+        
+        Args:
+            entries (List[Tuple[int, str]]): (입력 인덱스, 기사 텍스트) 목록
+            
+        Returns:
+            str: 프롬프트
+        """
+        articles_block = "\n\n".join(
+            f"[Article index={idx}]\n{text[:self.ARTICLE_CHAR_LIMIT]}\n[End of article index={idx}]"
+            for idx, text in entries
+        )
+        
+        prompt = f"""
+You are 'TechExplained', an expert technology scout.
+Analyse EACH news article below independently and return ONLY a valid JSON object. No commentary, markdown, or extra text.
+
+For every article:
+1. Translate the article title into natural Korean (title_ko).
+2. Provide a detailed Korean summary in 3-5 sentences that captures the article's key developments, 주요 인물/기업, 그리고 영향 (summary_ko).
+3. List up to five distinct technology-related concepts that are explicitly mentioned in the article. Provide only their canonical names (prefer English terms). Do not invent new concepts. Output them as an array "concept_names".
+
+Articles:
+{articles_block}
+
+Return JSON exactly in this shape, with one entry per article and the same "index" values as above:
+{{
+  "articles": [
+    {{
+      "index": 0,
+      "title_ko": "한국어 제목",
+      "summary_ko": "한국어 요약",
+      "concept_names": ["Concept 1", "Concept 2"]
+    }}
+  ]
+}}
+
+Important rules:
+- Respond with JSON only.
+- Never mix information between articles.
+- If fewer than five valid concepts exist, return only the ones that are explicitly mentioned.
+- Remove duplicates and keep the order they appear in the article.
+"""
+        
+        return prompt
+    
     def analyze_concept_relations(self, concept_names: List[str]) -> Optional[Dict]:
         """
         개념 간 관계 분석
@@ -262,29 +467,20 @@ Important rules:
             print(f"     ⟳ Analyzing relations for {len(concept_names)} concepts...")
             print(f"     → Model: {self.model}")
             
-            response = self.client.chat.completions.create(
-                model=self.model,
-                messages=[
-                    {
-                        "role": "user",
-                        "content": prompt
-                    }
-                ],
-                temperature=0.3,  # Lower temperature for more consistent output
-                max_tokens=4000
-            )
+            # Lower temperature for more consistent output
+            ai_response, from_cache = self._complete(prompt, temperature=0.3, max_tokens=4000)
             
-            if not response or not response.choices:
-                print("     ✗ Empty response from OpenRouter API")
+            if ai_response is None:
                 return None
             
-            ai_response = response.choices[0].message.content.strip()
             print(f"     ✓ Received response ({len(ai_response)} chars)")
             
             # JSON 파싱
             relation_result = self._parse_relation_response(ai_response)
             
             if relation_result:
+                if not from_cache:
+                    self._remember(prompt, 0.3, 4000, ai_response)
                 relations_count = len(relation_result.get('relations', []))
                 print(f"     ✓ AI relation analysis complete!")
                 print(f"     ✓ Relations detected: {relations_count}")
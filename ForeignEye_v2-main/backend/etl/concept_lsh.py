@@ -0,0 +1,465 @@
+"""
+개념 유사 후보 쌍 인덱스 (MinHash + LSH)
+
+관계 분석이나 유사도 계산에 보낼 개념 쌍을 전체 쌍 비교 없이 고릅니다.
+개념마다 키워드 집합(SimilarityCalculator._extract_keywords)의 MinHash 서명을 한 번 계산하고,
+서명을 band 단위로 나눠 같은 band 값을 가진 개념끼리만 후보로 묶습니다 (개념 수에 거의 선형).
+후보는 서명 일치 비율(추정 Jaccard)로 한 번 더 거릅니다.
+
+band 수 b, band당 행 수 r일 때 Jaccard s인 쌍이 후보가 될 확률은 1 - (1 - s^r)^b 이며,
+기본값(128 순열, 32 band × 4행)의 임계점은 약 (1/32)^(1/4) ≈ 0.42 입니다.
+
+인덱스는 .npz 파일(개념 ID + 서명)로 저장되고, sync()가 DB에 새로 생긴 개념만 서명을 계산해 추가합니다.
+placeholder 설명은 모든 신규 개념에 공통이므로 키워드에서 제외합니다.
+
+환경 변수:
+    CONCEPT_LSH_PATH       인덱스 파일 경로 (기본값: 'instance/concept_lsh.npz')
+    CONCEPT_LSH_NUM_PERM   MinHash 순열 수 (기본값: 128)
+    CONCEPT_LSH_BANDS      LSH band 수 (기본값: 32, NUM_PERM의 약수)
+"""
+
+import os
+import zlib
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+import numpy as np
+
+from app.extensions import db
+from app.models import Concept
+from etl.similarity_calculator import SimilarityCalculator
+
+
+# 파일 형식 버전 (서명 계산 방식이 바뀌면 올려서 재구축)
+FORMAT_VERSION = 1
+# 2^32 보다 큰 가장 작은 소수 (a·x + b 가 uint64 안에서 넘치지 않음)
+HASH_PRIME = np.uint64(4294967311)
+MAX_HASH = np.uint64(0xFFFFFFFF)
+EMPTY_SIGNATURE = 0xFFFFFFFF
+# band 값을 64비트 키로 접을 때 쓰는 곱수 (FNV-1a 64 prime)
+BAND_KEY_MULTIPLIER = np.uint64(0x100000001B3)
+# 한 버킷에 이보다 많은 개념이 모이면(흔한 단어 하나짜리 이름 등) 후보로 쓰지 않음
+MAX_BUCKET_SIZE = 200
+SYNC_BATCH_SIZE = 5000
+SIMILARITY_BATCH_SIZE = 100000
+
+
+def concept_keywords(name: str, description: Optional[str]) -> Set[str]:
+    """
+    개념의 MinHash 입력 키워드 집합
+
+    Args:
+        name (str): 개념 이름
+        description (str): 개념 설명 (placeholder 설명은 무시)
+
+    Returns:
+        Set[str]: 키워드 집합
+    """
+    from etl.db_loader import PLACEHOLDER_DESCRIPTION  # db_loader가 이 모듈을 임포트하므로 지연 임포트
+
+    if not description or description == PLACEHOLDER_DESCRIPTION:
+        description = ''
+    return SimilarityCalculator._extract_keywords(f"{name} {description}")
+
+
+class ConceptLSHIndex:
+    """
+    개념 MinHash 서명 + LSH 버킷 인덱스
+
+    Attributes:
+        num_perm (int): 서명 길이 (순열 수)
+        bands (int): band 수
+        rows (int): band당 서명 행 수
+        max_concept_id (int): 인덱스에 반영된 가장 큰 concept_id
+    """
+
+    def __init__(self, num_perm: int = 128, bands: int = 32, seed: int = 1):
+        if num_perm % bands:
+            raise ValueError(f"num_perm({num_perm})은 bands({bands})의 배수여야 합니다.")
+
+        self.num_perm = num_perm
+        self.bands = bands
+        self.rows = num_perm // bands
+        self.seed = seed
+        self.max_concept_id = 0
+
+        generator = np.random.RandomState(seed)
+        self._a = generator.randint(1, 2 ** 32, size=num_perm, dtype=np.uint64)
+        self._b = generator.randint(0, 2 ** 32, size=num_perm, dtype=np.uint64)
+
+        self._ids = np.zeros(0, dtype=np.int64)
+        self._signatures = np.zeros((0, num_perm), dtype=np.uint32)
+        self._row_of: Dict[int, int] = {}
+        # add()로 쌓인 행 (조회 시점에 배열로 합침)
+        self._pending: Dict[int, np.ndarray] = {}
+        self._buckets = None
+        self.dirty = False
+
+    def __len__(self) -> int:
+        self._consolidate()
+        return len(self._ids)
+
+    def __contains__(self, concept_id: int) -> bool:
+        return concept_id in self._row_of or concept_id in self._pending
+
+    # ------------------------------------------------------------------
+    # 서명 계산 / 추가
+    # ------------------------------------------------------------------
+
+    def signature(self, keywords: Iterable[str]) -> np.ndarray:
+        """
+        키워드 집합의 MinHash 서명
+
+        Args:
+            keywords (Iterable[str]): 키워드 집합
+
+        Returns:
+            np.ndarray: uint32[num_perm] (키워드가 없으면 모두 EMPTY_SIGNATURE)
+        """
+        hashes = np.fromiter(
+            (zlib.crc32(keyword.encode('utf-8')) for keyword in set(keywords)),
+            dtype=np.uint64
+        )
+        if not len(hashes):
+            return np.full(self.num_perm, EMPTY_SIGNATURE, dtype=np.uint32)
+
+        permuted = (hashes[:, None] * self._a[None, :] + self._b[None, :]) % HASH_PRIME
+        return (permuted.min(axis=0) & MAX_HASH).astype(np.uint32)
+
+    def add(self, concepts: Iterable[Tuple[int, str, Optional[str]]]) -> int:
+        """
+        개념 추가 (이미 있는 ID면 서명 교체)
+
+        Args:
+            concepts: (concept_id, name, description_ko) 목록
+
+        Returns:
+            int: 추가/교체한 개념 수
+        """
+        count = 0
+        for concept_id, name, description in concepts:
+            self._pending[concept_id] = self.signature(concept_keywords(name, description))
+            self.max_concept_id = max(self.max_concept_id, concept_id)
+            count += 1
+
+        if count:
+            self._buckets = None
+            self.dirty = True
+        return count
+
+    def remove(self, concept_ids: Iterable[int]) -> int:
+        """
+        개념 제거 (삭제된 개념 정리용)
+
+        Returns:
+            int: 제거한 개념 수
+        """
+        self._consolidate()
+        drop = [self._row_of[cid] for cid in set(concept_ids) if cid in self._row_of]
+        if not drop:
+            return 0
+
+        keep = np.ones(len(self._ids), dtype=bool)
+        keep[drop] = False
+        self._ids = self._ids[keep]
+        self._signatures = self._signatures[keep]
+        self._row_of = {int(cid): row for row, cid in enumerate(self._ids)}
+        self._buckets = None
+        self.dirty = True
+        return len(drop)
+
+    def _consolidate(self):
+        """add()로 쌓인 행을 배열에 반영"""
+        if not self._pending:
+            return
+
+        appended_ids = []
+        appended = []
+        for concept_id, signature in self._pending.items():
+            row = self._row_of.get(concept_id)
+            if row is not None:
+                self._signatures[row] = signature
+            else:
+                self._row_of[concept_id] = len(self._ids) + len(appended_ids)
+                appended_ids.append(concept_id)
+                appended.append(signature)
+
+        if appended_ids:
+            self._ids = np.concatenate([self._ids, np.asarray(appended_ids, dtype=np.int64)])
+            self._signatures = np.vstack([self._signatures, np.asarray(appended, dtype=np.uint32)])
+        self._pending = {}
+
+    # ------------------------------------------------------------------
+    # LSH 버킷
+    # ------------------------------------------------------------------
+
+    def _band_keys(self, signatures: np.ndarray) -> np.ndarray:
+        """서명 → band별 64비트 키 (n × bands)"""
+        keys = np.zeros((len(signatures), self.bands), dtype=np.uint64)
+        for band in range(self.bands):
+            key = np.zeros(len(signatures), dtype=np.uint64)
+            for column in range(band * self.rows, (band + 1) * self.rows):
+                key = (key ^ signatures[:, column].astype(np.uint64)) * BAND_KEY_MULTIPLIER
+            keys[:, band] = key
+        return keys
+
+    def _ensure_buckets(self):
+        """band별 (정렬된 키, 행 번호) 배열 구성 (키가 같은 행이 같은 버킷)"""
+        self._consolidate()
+        if self._buckets is not None:
+            return
+
+        indexed = np.flatnonzero(self._signatures[:, 0] != EMPTY_SIGNATURE) \
+            if len(self._ids) else np.zeros(0, dtype=np.int64)
+        keys = self._band_keys(self._signatures[indexed])
+        self._buckets = []
+        for band in range(self.bands):
+            order = np.argsort(keys[:, band], kind='stable')
+            self._buckets.append((keys[order, band], indexed[order]))
+
+    # ------------------------------------------------------------------
+    # 후보 조회
+    # ------------------------------------------------------------------
+
+    def estimated_similarity(self, rows_a: np.ndarray, rows_b: np.ndarray) -> np.ndarray:
+        """행 쌍의 추정 Jaccard (서명 일치 비율)"""
+        result = np.empty(len(rows_a), dtype=np.float64)
+        for start in range(0, len(rows_a), SIMILARITY_BATCH_SIZE):
+            stop = start + SIMILARITY_BATCH_SIZE
+            matches = self._signatures[rows_a[start:stop]] == self._signatures[rows_b[start:stop]]
+            result[start:stop] = matches.mean(axis=1)
+        return result
+
+    def candidate_pairs(self, min_similarity: float = 0.3,
+                        max_bucket_size: int = MAX_BUCKET_SIZE) -> List[Tuple[int, int, float]]:
+        """
+        전체 후보 쌍 (같은 버킷에 한 번이라도 들어간 쌍)
+
+        Args:
+            min_similarity (float): 최소 추정 Jaccard
+            max_bucket_size (int): 이보다 큰 버킷은 무시
+
+        Returns:
+            list: [(concept_id_a, concept_id_b, 추정 Jaccard), ...]
+                (a < b, 추정값 내림차순, 동점이면 ID 오름차순)
+        """
+        self._ensure_buckets()
+        n = len(self._ids)
+        encoded = []
+
+        for sorted_keys, rows in self._buckets:
+            if len(sorted_keys) < 2:
+                continue
+            boundaries = np.flatnonzero(np.diff(sorted_keys)) + 1
+            starts = np.concatenate([[0], boundaries])
+            sizes = np.diff(np.concatenate([starts, [len(sorted_keys)]]))
+
+            for size in np.unique(sizes[(sizes >= 2) & (sizes <= max_bucket_size)]):
+                group_starts = starts[sizes == size]
+                first, second = np.triu_indices(size, 1)
+                left = rows[group_starts[:, None] + first[None, :]].ravel()
+                right = rows[group_starts[:, None] + second[None, :]].ravel()
+                encoded.append(np.minimum(left, right) * n + np.maximum(left, right))
+
+        if not encoded:
+            return []
+
+        pairs = np.unique(np.concatenate(encoded))
+        rows_a, rows_b = pairs // n, pairs % n
+        similarity = self.estimated_similarity(rows_a, rows_b)
+        keep = similarity >= min_similarity
+        ids_a, ids_b = self._ids[rows_a[keep]], self._ids[rows_b[keep]]
+        similarity = similarity[keep]
+
+        swap = ids_a > ids_b
+        ids_a, ids_b = np.where(swap, ids_b, ids_a), np.where(swap, ids_a, ids_b)
+        order = np.lexsort((ids_b, ids_a, -similarity))
+        return [
+            (int(ids_a[i]), int(ids_b[i]), float(similarity[i]))
+            for i in order
+        ]
+
+    def neighbours(self, concept_ids: Iterable[int], limit: int = 10,
+                   min_similarity: float = 0.3,
+                   max_bucket_size: int = MAX_BUCKET_SIZE) -> Dict[int, List[Tuple[int, float]]]:
+        """
+        지정한 개념들의 후보 이웃 (신규 개념 몇 개만 볼 때 사용)
+
+        Args:
+            concept_ids (Iterable[int]): 기준 개념 ID
+            limit (int): 개념당 최대 이웃 수
+            min_similarity (float): 최소 추정 Jaccard
+            max_bucket_size (int): 이보다 큰 버킷은 무시
+
+        Returns:
+            dict: {concept_id: [(이웃 concept_id, 추정 Jaccard), ...]} (추정값 내림차순, 동점이면 ID 오름차순)
+                인덱스에 없거나 키워드가 없는 개념은 포함하지 않음
+        """
+        self._ensure_buckets()
+        result = {}
+
+        for concept_id in concept_ids:
+            row = self._row_of.get(concept_id)
+            if row is None or self._signatures[row, 0] == EMPTY_SIGNATURE:
+                continue
+
+            keys = self._band_keys(self._signatures[row:row + 1])[0]
+            members = set()
+            for band, (sorted_keys, rows) in enumerate(self._buckets):
+                lo = np.searchsorted(sorted_keys, keys[band], side='left')
+                hi = np.searchsorted(sorted_keys, keys[band], side='right')
+                if hi - lo <= max_bucket_size:
+                    members.update(rows[lo:hi].tolist())
+            members.discard(row)
+            if not members:
+                continue
+
+            member_rows = np.fromiter(members, dtype=np.int64)
+            similarity = self.estimated_similarity(np.full(len(member_rows), row), member_rows)
+            keep = similarity >= min_similarity
+            member_ids, similarity = self._ids[member_rows[keep]], similarity[keep]
+            order = np.lexsort((member_ids, -similarity))[:limit]
+            if len(order):
+                result[concept_id] = [
+                    (int(member_ids[i]), float(similarity[i])) for i in order
+                ]
+
+        return result
+
+    # ------------------------------------------------------------------
+    # 저장 / 동기화
+    # ------------------------------------------------------------------
+
+    def save(self, path: str):
+        """
+        인덱스를 .npz 파일로 저장 (임시 파일에 쓴 뒤 교체)
+
+        Args:
+            path (str): 파일 경로
+        """
+        self._consolidate()
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        tmp_path = f"{path}.tmp.npz"
+        np.savez_compressed(
+            tmp_path,
+            params=np.asarray([FORMAT_VERSION, self.num_perm, self.bands, self.seed, self.max_concept_id],
+                              dtype=np.int64),
+            ids=self._ids,
+            signatures=self._signatures
+        )
+        os.replace(tmp_path, path)
+        self.dirty = False
+
+    @classmethod
+    def load(cls, path: str, num_perm: int = 128, bands: int = 32,
+             seed: int = 1) -> Optional['ConceptLSHIndex']:
+        """
+        저장된 인덱스 로드
+
+        Args:
+            path (str): 파일 경로
+            num_perm, bands, seed: 기대하는 파라미터 (다르면 재구축 대상)
+
+        Returns:
+            ConceptLSHIndex: 인덱스. 파일이 없거나 형식/파라미터가 다르면 None
+        """
+        if not os.path.exists(path):
+            return None
+
+        try:
+            with np.load(path) as data:
+                version, saved_perm, saved_bands, saved_seed, max_concept_id = data['params'].tolist()
+                if (version, saved_perm, saved_bands, saved_seed) != (FORMAT_VERSION, num_perm, bands, seed):
+                    print(f"  ! Concept LSH index parameters changed, rebuilding: {path}")
+                    return None
+
+                index = cls(num_perm, bands, seed)
+                index._ids = data['ids'].astype(np.int64)
+                index._signatures = data['signatures'].astype(np.uint32)
+        except Exception as e:
+            print(f"  ! Concept LSH index unreadable, rebuilding: {e}")
+            return None
+
+        index._row_of = {int(cid): row for row, cid in enumerate(index._ids)}
+        index.max_concept_id = int(max_concept_id)
+        return index
+
+    def sync(self) -> Dict[str, int]:
+        """
+        DB와 동기화: 인덱스에 없는 개념만 서명을 계산해 추가하고, 삭제된 개념은 제거
+
+        Returns:
+            dict: {'added': int, 'removed': int, 'total': int}
+        """
+        self._consolidate()
+        db_ids = {cid for (cid,) in db.session.query(Concept.concept_id).all()}
+        missing = sorted(db_ids - self._row_of.keys())
+        removed = self.remove(self._row_of.keys() - db_ids)
+
+        added = 0
+        for start in range(0, len(missing), SYNC_BATCH_SIZE):
+            batch = missing[start:start + SYNC_BATCH_SIZE]
+            rows = db.session.query(
+                Concept.concept_id, Concept.name, Concept.description_ko
+            ).filter(Concept.concept_id.in_(batch)).all()
+            added += self.add(rows)
+
+        return {'added': added, 'removed': removed, 'total': len(self)}
+
+
+def get_index_path() -> str:
+    return os.getenv('CONCEPT_LSH_PATH', os.path.join('instance', 'concept_lsh.npz'))
+
+
+def load_concept_lsh_index(sync: bool = True) -> ConceptLSHIndex:
+    """
+    환경 변수 설정에 따른 인덱스 로드 (없으면 새로 만듦)
+
+    Args:
+        sync (bool): True면 DB와 동기화하고 바뀐 내용을 저장
+
+    Returns:
+        ConceptLSHIndex: 인덱스
+    """
+    num_perm = int(os.getenv('CONCEPT_LSH_NUM_PERM', 128))
+    bands = int(os.getenv('CONCEPT_LSH_BANDS', 32))
+    path = get_index_path()
+
+    index = ConceptLSHIndex.load(path, num_perm, bands)
+    if index is None:
+        index = ConceptLSHIndex(num_perm, bands)
+
+    if sync:
+        stats = index.sync()
+        if index.dirty:
+            index.save(path)
+            print(f"  ✓ Concept LSH index synced (+{stats['added']} / -{stats['removed']}, "
+                  f"{stats['total']} concepts)")
+
+    return index
+
+
+def update_concept_lsh_index(concepts: List[Tuple[int, str, Optional[str]]]) -> int:
+    """
+    새로 만든 개념만 인덱스 파일에 추가 (DB 전체를 읽지 않음)
+
+    Args:
+        concepts: (concept_id, name, description_ko) 목록
+
+    Returns:
+        int: 추가한 개념 수
+    """
+    if not concepts:
+        return 0
+
+    path = get_index_path()
+    index = load_concept_lsh_index(sync=False)
+    if len(index):
+        added = index.add(concepts)
+    else:
+        # 파일이 아직 없으면 DB 전체로 구축 (신규 개념도 함께 반영됨)
+        added = index.sync()['added']
+    index.save(path)
+    return added
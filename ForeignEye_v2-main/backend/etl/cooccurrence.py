@@ -0,0 +1,251 @@
+"""
+개념 공동 등장(Concept_Cooccurrence) 계산 작업
+
+Article_Concept를 article_id 순서로 한 번만 읽으면서(키셋 배치) 배치마다 기사 × 개념 희소 행렬 X를 만들고,
+Xᵀ·X의 위쪽 삼각(개념 쌍별 공동 등장 기사 수)을 희소 누적기에 더합니다. 기사별 쿼리는 없습니다.
+
+    PMI(a, b) = log(count(a, b) · N / (count(a) · count(b)))
+    N = 개념이 하나 이상 연결된 기사 수, count(a) = 개념 a가 연결된 기사 수
+
+증분 실행은 워터마크('cooccurrence.article_id') 이후 적재된 기사만 읽어 쌍별 증가분을 더하고,
+바뀐 쌍의 PMI만 현재 N/빈도로 다시 계산합니다. (다른 쌍의 PMI는 전체 재계산 때 갱신)
+워터마크 행을 잠근 한 트랜잭션에서 증가분과 워터마크를 함께 커밋하므로 같은 기사를 두 번 세지 않습니다.
+
+환경 변수:
+    COOCCURRENCE_BATCH_ROWS   배치당 Article_Concept 행 수 (기본값: 20000)
+
+사용법:
+    python -m etl.cooccurrence
+    python -m etl.cooccurrence --full    (테이블을 비우고 전체 재계산)
+"""
+
+import os
+import sys
+from typing import Dict, Iterator, List, Tuple
+
+import numpy as np
+from dotenv import load_dotenv
+from scipy import sparse
+from sqlalchemy import delete, func, insert, tuple_, update
+
+from app import create_app
+from app.extensions import db
+from app.models import Article_Concept, Concept, Concept_Cooccurrence, ETL_Watermark
+
+
+COOCCURRENCE_WATERMARK = 'cooccurrence.article_id'
+WRITE_BATCH_SIZE = 1000
+
+
+def stream_article_concepts(after_article_id: int, max_article_id: int,
+                            batch_rows: int) -> Iterator[List[Tuple[int, int]]]:
+    """
+    (article_id, concept_id) 행을 기사 단위가 끊기지 않는 배치로 스트리밍
+
+    Args:
+        after_article_id (int): 이 ID 이후 기사부터
+        max_article_id (int): 이 ID까지
+        batch_rows (int): 배치당 최대 행 수 (한 기사가 이보다 크면 그 기사만 한 배치)
+
+    Yields:
+        List[Tuple[int, int]]: (article_id, concept_id) 목록
+    """
+    last_id = after_article_id
+    while True:
+        rows = db.session.query(Article_Concept.article_id, Article_Concept.concept_id).filter(
+            Article_Concept.article_id > last_id,
+            Article_Concept.article_id <= max_article_id
+        ).order_by(Article_Concept.article_id).limit(batch_rows).all()
+        if not rows:
+            return
+
+        if len(rows) == batch_rows:
+            # 마지막 기사는 잘렸을 수 있으므로 다음 배치에서 통째로 읽음
+            boundary = rows[-1][0]
+            complete = [row for row in rows if row[0] != boundary]
+            if not complete:
+                complete = db.session.query(Article_Concept.article_id, Article_Concept.concept_id).filter(
+                    Article_Concept.article_id == boundary
+                ).all()
+            rows = complete
+
+        last_id = rows[-1][0]
+        yield rows
+
+
+def accumulate_cooccurrences(batches: Iterator[List[Tuple[int, int]]],
+                             num_concepts: int) -> sparse.csr_matrix:
+    """
+    공동 등장 행렬 누적
+
+    Args:
+        batches: stream_article_concepts()의 배치
+        num_concepts (int): 열 수 (가장 큰 concept_id + 1)
+
+    Returns:
+        sparse.csr_matrix: (num_concepts × num_concepts) 위쪽 삼각 행렬.
+            [a, b] (a < b)는 공동 등장 기사 수, [a, a]는 개념 a가 연결된 기사 수
+    """
+    total = sparse.csr_matrix((num_concepts, num_concepts), dtype=np.int64)
+    for rows in batches:
+        article_ids = np.fromiter((article_id for article_id, _ in rows), dtype=np.int64, count=len(rows))
+        concept_ids = np.fromiter((concept_id for _, concept_id in rows), dtype=np.int64, count=len(rows))
+        _, article_rows = np.unique(article_ids, return_inverse=True)
+
+        incidence = sparse.csr_matrix(
+            (np.ones(len(rows), dtype=np.int64), (article_rows, concept_ids)),
+            shape=(article_rows.max() + 1, num_concepts)
+        )
+        # 같은 (기사, 개념) 연결이 중복 저장되어 있어도 1로 계산
+        incidence.sum_duplicates()
+        incidence.data[:] = 1
+
+        total = total + sparse.triu(incidence.T @ incidence, format='csr')
+    return total
+
+
+def _pmi(counts: np.ndarray, freq_a: np.ndarray, freq_b: np.ndarray, total_articles: int) -> np.ndarray:
+    return np.log(counts * float(total_articles) / (freq_a * freq_b))
+
+
+def _concept_frequencies(concept_ids: List[int], max_article_id: int) -> Dict[int, int]:
+    """개념별 연결 기사 수 (GROUP BY 쿼리, IN 목록 배치)"""
+    frequencies = {}
+    for start in range(0, len(concept_ids), WRITE_BATCH_SIZE):
+        batch = concept_ids[start:start + WRITE_BATCH_SIZE]
+        rows = db.session.query(
+            Article_Concept.concept_id, func.count(func.distinct(Article_Concept.article_id))
+        ).filter(
+            Article_Concept.concept_id.in_(batch),
+            Article_Concept.article_id <= max_article_id
+        ).group_by(Article_Concept.concept_id).all()
+        frequencies.update(rows)
+    return frequencies
+
+
+def _fetch_existing_counts(pairs: List[Tuple[int, int]]) -> Dict[Tuple[int, int], int]:
+    """이미 저장된 쌍의 기사 수 (tuple IN 쿼리, 배치)"""
+    existing = {}
+    for start in range(0, len(pairs), WRITE_BATCH_SIZE):
+        batch = pairs[start:start + WRITE_BATCH_SIZE]
+        rows = db.session.query(
+            Concept_Cooccurrence.concept_a_id,
+            Concept_Cooccurrence.concept_b_id,
+            Concept_Cooccurrence.article_count
+        ).filter(
+            tuple_(Concept_Cooccurrence.concept_a_id, Concept_Cooccurrence.concept_b_id).in_(batch)
+        ).all()
+        existing.update(((a, b), count) for a, b, count in rows)
+    return existing
+
+
+def _lock_watermark() -> int:
+    """워터마크 행을 잠그고 값을 반환 (동시 실행 시 나중 실행은 커밋까지 대기)"""
+    if db.session.get(ETL_Watermark, COOCCURRENCE_WATERMARK) is None:
+        ETL_Watermark.set_value(COOCCURRENCE_WATERMARK, 0)
+        db.session.commit()
+
+    watermark = db.session.query(ETL_Watermark).filter(
+        ETL_Watermark.name == COOCCURRENCE_WATERMARK
+    ).with_for_update().one()
+    return watermark.value
+
+
+def update_cooccurrences(full_refresh: bool = False, batch_rows: int = None) -> Dict[str, int]:
+    """
+    공동 등장 테이블 갱신 (증분 또는 전체)
+
+    Args:
+        full_refresh (bool): True면 테이블을 비우고 모든 기사로 다시 계산
+        batch_rows (int, optional): 배치당 행 수. None이면 COOCCURRENCE_BATCH_ROWS 환경 변수 (기본값: 20000)
+
+    Returns:
+        dict: {'articles': 읽은 기사 수, 'pairs': 갱신한 쌍 수, 'inserted': 새 쌍 수, 'updated': 기존 쌍 수}
+    """
+    batch_rows = max(1, batch_rows or int(os.getenv('COOCCURRENCE_BATCH_ROWS', 20000)))
+    result = {'articles': 0, 'pairs': 0, 'inserted': 0, 'updated': 0}
+
+    try:
+        watermark = _lock_watermark()
+        if full_refresh:
+            watermark = 0
+
+        max_article_id = db.session.query(func.max(Article_Concept.article_id)).scalar() or 0
+        if max_article_id <= watermark:
+            db.session.commit()
+            print("  ⊘ Co-occurrence table is up to date.")
+            return result
+
+        max_concept_id = db.session.query(func.max(Concept.concept_id)).scalar() or 0
+        result['articles'] = db.session.query(
+            func.count(func.distinct(Article_Concept.article_id))
+        ).filter(
+            Article_Concept.article_id > watermark,
+            Article_Concept.article_id <= max_article_id
+        ).scalar() or 0
+
+        print(f"  ⟳ Counting co-occurrences in {result['articles']} articles "
+              f"({'full' if full_refresh else f'article_id > {watermark}'})...")
+
+        delta = accumulate_cooccurrences(
+            stream_article_concepts(watermark, max_article_id, batch_rows),
+            max_concept_id + 1
+        ).tocoo()
+        pair_mask = delta.row < delta.col
+        concept_a = delta.row[pair_mask]
+        concept_b = delta.col[pair_mask]
+        added = delta.data[pair_mask]
+        pairs = list(zip(concept_a.tolist(), concept_b.tolist()))
+
+        if full_refresh:
+            db.session.execute(delete(Concept_Cooccurrence))
+            existing = {}
+            frequencies = dict(zip(delta.row[~pair_mask].tolist(), delta.data[~pair_mask].tolist()))
+        else:
+            existing = _fetch_existing_counts(pairs)
+            frequencies = _concept_frequencies(
+                sorted(set(concept_a.tolist()) | set(concept_b.tolist())), max_article_id
+            )
+
+        total_articles = db.session.query(
+            func.count(func.distinct(Article_Concept.article_id))
+        ).filter(Article_Concept.article_id <= max_article_id).scalar() or 0
+
+        counts = added + np.asarray([existing.get(pair, 0) for pair in pairs], dtype=np.int64)
+        pmi = _pmi(
+            counts.astype(np.float64),
+            np.asarray([frequencies[a] for a in concept_a.tolist()], dtype=np.float64),
+            np.asarray([frequencies[b] for b in concept_b.tolist()], dtype=np.float64),
+            total_articles
+        )
+
+        inserts = []
+        updates = []
+        for (a, b), count, score in zip(pairs, counts.tolist(), pmi.tolist()):
+            row = {'concept_a_id': a, 'concept_b_id': b, 'article_count': count, 'pmi': score}
+            (updates if (a, b) in existing else inserts).append(row)
+
+        for start in range(0, len(inserts), WRITE_BATCH_SIZE):
+            db.session.execute(insert(Concept_Cooccurrence), inserts[start:start + WRITE_BATCH_SIZE])
+        for start in range(0, len(updates), WRITE_BATCH_SIZE):
+            db.session.execute(update(Concept_Cooccurrence), updates[start:start + WRITE_BATCH_SIZE])
+
+        ETL_Watermark.set_value(COOCCURRENCE_WATERMARK, max_article_id)
+        db.session.commit()
+
+    except Exception:
+        db.session.rollback()
+        raise
+
+    result.update(pairs=len(pairs), inserted=len(inserts), updated=len(updates))
+    print(f"  ✓ Co-occurrence: {result['inserted']} new pairs, {result['updated']} updated "
+          f"(watermark → article_id {max_article_id})")
+    return result
+
+
+if __name__ == "__main__":
+    load_dotenv()
+
+    app = create_app(os.getenv('FLASK_ENV', 'development'))
+    with app.app_context():
+        update_cooccurrences(full_refresh='--full' in sys.argv)
@@ -4,119 +4,317 @@
 Discovery 단계에서 추출한 개념을 기사와 연결합니다.
 """
 
-from typing import Dict, Optional, List
+from typing import Dict, Optional, List, Set, Tuple
+
+from sqlalchemy import insert, tuple_
+from sqlalchemy.exc import IntegrityError
 
 from app.extensions import db
 from app.models import Article, Concept, Article_Concept, Concept_Relation
-from etl.neo4j_client import neo4j_conn
+from app.services.adjacency_service import AdjacencyService
+from app.services.etl_service import ETLService
+from etl.concept_lsh import update_concept_lsh_index
+from etl.neo4j_client import neo4j_conn, Neo4jBatchWriter
 
 
 PLACEHOLDER_DESCRIPTION = "(Placeholder) 기사에서 이 개념이 어떻게 사용되는지 확인하세요."
 
+# 벌크 조회 시 IN 목록 최대 길이
+RELATION_BATCH_SIZE = 1000
+
 
 class DBLoader:
     """간소화된 데이터베이스 적재 클래스"""
 
     def __init__(self, app_context):
         self.app_context = app_context
+        # Neo4j upsert는 버퍼에 모았다가 MySQL 커밋 후 UNWIND 배치로 반영
+        self.neo4j_writer = Neo4jBatchWriter(neo4j_conn)
+        # 이번 실행에서 새로 저장된 기사 ID (적재 후 그래프 캐시 일괄 계산 대상)
+        self.loaded_article_ids: List[int] = []
+        # 현재 트랜잭션에서 새로 만든 개념 (커밋 후 created_concepts로 이동, 롤백 시 이름 사전에서 제거)
+        # (웹 프로세스의 개념 검색 인덱스는 CONCEPT_SEARCH_REFRESH_INTERVAL마다 DB 증분 조회로 반영)
+        self.pending_concepts: List[Tuple[int, str, str]] = []
+        # 이번 실행에서 커밋된 새 개념 (실행 끝에 개념 LSH 인덱스 파일에 한 번에 반영)
+        self.created_concepts: List[Tuple[int, str, str]] = []
+        # 개념 이름(casefold) → ID 사전 (첫 사용 시 쿼리 1회로 적재, 이후 생성/조회 결과로 갱신)
+        # MySQL name 유일 키는 대소문자를 구분하지 않으므로 사전도 casefold한 이름을 키로 사용
+        self.concept_ids: Optional[Dict[str, int]] = None
 
     def load_article_data(self, article_data: Dict, analysis: Dict) -> Optional[Article]:
-        """기사와 개념을 저장하고 연결합니다."""
+        """기사와 개념을 저장하고 연결합니다. (load_articles_bulk의 1건 버전)"""
+        outcome = self.load_articles_bulk([(article_data, analysis)])[0]
+        if outcome['status'] != 'loaded':
+            return None
+
         with self.app_context:
+            return db.session.get(Article, outcome['article_id'])
+
+    def load_articles_bulk(self, batch: List[Tuple[Dict, Dict]]) -> List[Dict]:
+        """
+        기사 묶음을 한 트랜잭션으로 저장합니다.
+        
+        기사 수와 무관하게 고정된 수의 라운드트립만 사용합니다:
+        1. 이미 저장된 URL을 IN 쿼리 한 번으로 제외
+        2. 모든 개념 이름을 이름 사전으로 변환 (사전에 없는 이름만 upsert)
+        3. 신규 Article 행을 executemany INSERT 한 번으로 저장하고 URL IN 쿼리로 ID 조회
+        4. Article_Concept 연결을 executemany INSERT 한 번으로 저장
+        3~4단계가 실패하면 SAVEPOINT로 되돌린 뒤 기사별 SAVEPOINT로 다시 저장해,
+        문제 있는 기사만 실패 처리합니다.
+        
+        Args:
+            batch (List[Tuple[Dict, Dict]]): (article_data, analysis) 목록
+            
+        Returns:
+            List[Dict]: batch와 같은 순서의 기사별 결과
+                {'status': 'loaded' | 'exists' | 'error', 'article_id': int 또는 None, 'linked': int}
+        """
+        outcomes = [{'status': 'error', 'article_id': None, 'linked': 0} for _ in batch]
+        
+        with self.app_context:
+            # 0. 행 준비 (형식이 잘못된 기사만 실패 처리, 같은 묶음 안의 중복 URL은 exists)
+            items = []
+            urls = set()
+            for index, (article_data, analysis) in enumerate(batch):
+                try:
+                    row = {
+                        'title': article_data['title'],
+                        'title_ko': analysis.get('title_ko', ''),
+                        'original_url': article_data['url'],
+                        'summary_ko': analysis.get('summary_ko', '')
+                    }
+                    concept_names = list(analysis.get('concept_names') or [])
+                except (KeyError, TypeError, AttributeError) as e:
+                    print(f"  ✗ Invalid article data (#{index + 1}): {e}")
+                    continue
+                
+                if row['original_url'] in urls:
+                    outcomes[index]['status'] = 'exists'
+                    continue
+                urls.add(row['original_url'])
+                items.append((index, row, concept_names))
+            
+            if not items:
+                return outcomes
+            
             try:
-                # Stale State 방지: 세션 캐시 무효화
-                db.session.expire_all()
+                # 1. 이미 저장된 URL 제외
+                existing = self._fetch_existing_urls(urls)
+                new_items = []
+                for index, row, concept_names in items:
+                    article_id = existing.get(row['original_url'])
+                    if article_id is not None:
+                        outcomes[index].update(status='exists', article_id=article_id)
+                    else:
+                        new_items.append((index, row, concept_names))
+                
+                if not new_items:
+                    print(f"  ⊘ All {len(items)} articles already exist")
+                    return outcomes
+                
+                # 2. 개념 이름 → ID (사전 + upsert)
+                name_to_id = {}
+                for _, _, concept_names in new_items:
+                    for concept_name in concept_names:
+                        if concept_name not in name_to_id:
+                            name_to_id[concept_name] = self._get_or_create_concept(concept_name)
+                
+                # 3~4. 기사 + 연결 집합 INSERT (실패 시 기사별로 격리)
+                try:
+                    with db.session.begin_nested():
+                        loaded = self._insert_articles(new_items, name_to_id)
+                except Exception as e:
+                    print(f"  ! Batch insert failed, retrying article by article: {e}")
+                    loaded = self._insert_articles_isolated(new_items, name_to_id, outcomes)
                 
-                url = article_data['url']
-                existing_article = Article.query.filter_by(original_url=url).first()
-                if existing_article:
-                    print(f"  ⊘ Article already exists (ID: {existing_article.article_id})")
-                    return None
-
-                new_article = Article(
-                    title=article_data['title'],
-                    title_ko=analysis.get('title_ko', ''),
-                    original_url=url,
-                    summary_ko=analysis.get('summary_ko', '')
-                )
-                db.session.add(new_article)
-                db.session.flush()
-
-                print(f"  ✓ Created Article (ID: {new_article.article_id})")
-
-                concept_names = analysis.get('concept_names', [])
-                if not concept_names:
-                    print("  ! No concepts detected by AI.")
-                    db.session.commit()
-                    return new_article
-
-                linked_count = 0
-                for concept_name in concept_names:
-                    concept = self._get_or_create_concept(concept_name)
-                    if concept and self._link_concept_to_article(new_article, concept):
-                        linked_count += 1
-
                 db.session.commit()
-                print(f"  ✓ Linked {linked_count} concepts to article")
-                print(f"  ✓✓ Successfully saved article to database!")
-                return new_article
-
+            
             except Exception as e:
                 db.session.rollback()
-                print(f"  ✗✗ Database error: {e}")
+                self.neo4j_writer.clear()
+                self._discard_pending_concepts()
+                print(f"  ✗✗ Database error while loading {len(items)} articles: {e}")
                 import traceback
                 traceback.print_exc()
-                return None
+                return outcomes
+            
+            for index, (article_id, linked) in loaded.items():
+                outcomes[index].update(status='loaded', article_id=article_id, linked=linked)
+                self.loaded_article_ids.append(article_id)
+            self._commit_pending_concepts()
+            
+            # Neo4j에도 노드 생성 (ETL 1단계, MySQL 커밋 후 배치 반영)
+            self.neo4j_writer.flush()
+            
+            counts = {'loaded': 0, 'exists': 0, 'error': 0}
+            for outcome in outcomes:
+                counts[outcome['status']] += 1
+            print(f"  ✓ Saved {counts['loaded']} articles "
+                  f"({sum(o['linked'] for o in outcomes)} concept links)")
+            if counts['exists']:
+                print(f"  ⊘ Already exists: {counts['exists']} articles")
+            if counts['error']:
+                print(f"  ✗ Failed: {counts['error']} articles")
+            
+            return outcomes
+
+    def _fetch_existing_urls(self, urls) -> Dict[str, int]:
+        """이미 저장된 URL 조회 ({original_url: article_id}, IN 쿼리)"""
+        existing = {}
+        urls = list(urls)
+        for start in range(0, len(urls), RELATION_BATCH_SIZE):
+            batch = urls[start:start + RELATION_BATCH_SIZE]
+            rows = db.session.query(Article.original_url, Article.article_id).filter(
+                Article.original_url.in_(batch)
+            ).all()
+            existing.update({url: article_id for url, article_id in rows})
+        return existing
 
-    def _get_or_create_concept(self, concept_name: str) -> Optional[Concept]:
+    def _insert_articles(self, items, name_to_id: Dict[str, Optional[int]]) -> Dict[int, Tuple[int, int]]:
+        """
+        기사 행과 개념 연결을 집합 단위로 INSERT (커밋하지 않음)
+
+        Returns:
+            dict: {batch 내 index: (article_id, 연결 수)}
+        """
+        db.session.execute(insert(Article), [row for _, row, _ in items])
+        # MySQL은 executemany에서 생성된 ID를 돌려주지 않으므로 유일 키(URL)로 조회
+        article_ids = self._fetch_existing_urls(row['original_url'] for _, row, _ in items)
+        
+        loaded = {}
+        link_rows = []
+        for index, row, concept_names in items:
+            article_id = article_ids[row['original_url']]
+            # 새 기사이므로 기존 연결은 없음: 같은 기사 안의 중복 이름만 걸러냄
+            concept_ids = {
+                name_to_id[concept_name] for concept_name in concept_names
+                if name_to_id.get(concept_name)
+            }
+            link_rows.extend(
+                {'article_id': article_id, 'concept_id': concept_id}
+                for concept_id in sorted(concept_ids)
+            )
+            loaded[index] = (article_id, len(concept_ids))
+        
+        if link_rows:
+            db.session.execute(insert(Article_Concept), link_rows)
+        return loaded
+
+    def _insert_articles_isolated(self, items, name_to_id, outcomes) -> Dict[int, Tuple[int, int]]:
+        """기사마다 SAVEPOINT로 INSERT하여 실패한 기사만 outcomes에 표시"""
+        loaded = {}
+        for item in items:
+            index, row, _ = item
+            try:
+                with db.session.begin_nested():
+                    loaded.update(self._insert_articles([item], name_to_id))
+            except IntegrityError as e:
+                # 다른 워커가 같은 URL을 먼저 저장했으면 exists, 그 밖의 제약 위반은 실패
+                article_id = self._fetch_existing_urls([row['original_url']]).get(row['original_url'])
+                if article_id is not None:
+                    outcomes[index].update(status='exists', article_id=article_id)
+                else:
+                    print(f"  ✗ Failed to save article ({row['original_url']}): {e}")
+            except Exception as e:
+                print(f"  ✗ Failed to save article ({row['original_url']}): {e}")
+        return loaded
+
+    def warm_concept_ids(self):
+        """개념 이름 → ID 사전을 쿼리 1회로 적재"""
+        with self.app_context:
+            rows = db.session.query(Concept.name, Concept.concept_id).all()
+            self.concept_ids = {name.casefold(): concept_id for name, concept_id in rows}
+            print(f"  ✓ Loaded concept dictionary ({len(self.concept_ids)} concepts)")
+
+    def _get_or_create_concept(self, concept_name: str) -> Optional[int]:
+        """
+        개념 이름을 ID로 변환 (없으면 생성)
+
+        사전에 있으면 DB 조회 없이 반환하고, 없을 때만 INSERT를 시도합니다.
+        다른 워커가 먼저 만든 개념(또는 대소문자만 다른 이름)이면 기존 ID를 조회로 취급합니다.
+
+        Returns:
+            int: concept_id (빈 이름이면 None)
+        """
         cleaned_name = (concept_name or '').strip()
         if not cleaned_name:
             return None
 
-        # Stale State 방지: 최신 데이터 조회
-        db.session.expire_all()
-        
-        concept = Concept.query.filter_by(name=cleaned_name).first()
-        if concept:
-            return concept
-
-        concept = Concept(
-            name=cleaned_name,
-            description_ko=PLACEHOLDER_DESCRIPTION,
-            real_world_examples_ko=[]
+        if self.concept_ids is None:
+            self.warm_concept_ids()
+
+        key = cleaned_name.casefold()
+        concept_id = self.concept_ids.get(key)
+        if concept_id is not None:
+            return concept_id
+
+        # 사전에 없는 이름: 새 개념이거나, 사전 적재 이후 다른 워커가 만든 개념
+        concept_id, created = self._upsert_concept(cleaned_name)
+        self.concept_ids[key] = concept_id
+        if not created:
+            return concept_id
+        print(f"  ✓ Created concept: {cleaned_name} (ID: {concept_id})")
+
+        # Neo4j 노드 upsert 예약 (커밋 후 flush)
+        self.neo4j_writer.add_node(concept_id, cleaned_name)
+        self.pending_concepts.append(
+            (concept_id, cleaned_name, PLACEHOLDER_DESCRIPTION)
         )
-        db.session.add(concept)
-        db.session.flush()
-        print(f"  ✓ Created concept: {cleaned_name} (ID: {concept.concept_id})")
 
-        # Neo4j에도 노드 생성 (ETL 1단계)
+        return concept_id
+
+    def _upsert_concept(self, name: str) -> Tuple[int, bool]:
+        """
+        개념 INSERT (다른 워커가 먼저 만들었으면 그 행의 ID 사용)
+
+        SAVEPOINT 안에서 INSERT하고, 유일 키 충돌(IntegrityError)이면 기존 행을 이름으로 조회합니다.
+        (MySQL의 ON DUPLICATE KEY UPDATE는 CLIENT_FOUND_ROWS에서 삽입과 기존 행을 구분할 수 없음)
+
+        Returns:
+            tuple: (concept_id, 새로 만들었으면 True)
+        """
+        values = {
+            'name': name,
+            'description_ko': PLACEHOLDER_DESCRIPTION,
+            'real_world_examples_ko': []
+        }
+
         try:
-            neo4j_conn.execute_query(
-                f"MERGE (c:Concept {{name: '{cleaned_name}'}})"
-            )
-            print(f"  ✓ (Neo4j) Created node: {cleaned_name}")
-        except Exception as e:
-            print(f"  ✗ (Neo4j) Error creating node: {e}")
-        
-        return concept
+            with db.session.begin_nested():
+                result = db.session.execute(insert(Concept).values(**values))
+            return result.inserted_primary_key[0], True
+        except IntegrityError:
+            concept_id = db.session.query(Concept.concept_id).filter(
+                Concept.name == name
+            ).scalar()
+            return concept_id, False
 
-    def _link_concept_to_article(self, article: Article, concept: Concept) -> bool:
-        # Stale State 방지: 최신 데이터 조회
-        db.session.expire_all()
+    def _discard_pending_concepts(self):
+        """롤백된 트랜잭션에서 만든 개념을 사전과 대기 목록에서 제거"""
+        if self.concept_ids is not None:
+            for _, name, _ in self.pending_concepts:
+                self.concept_ids.pop(name.casefold(), None)
+        self.pending_concepts = []
+
+    def _commit_pending_concepts(self):
+        """커밋된 새 개념을 이번 실행의 생성 목록(개념 LSH 반영 대상)으로 이동"""
+        self.created_concepts.extend(self.pending_concepts)
+        self.pending_concepts = []
+
+    def flush_concept_lsh(self) -> int:
+        """
+        이번 실행에서 만든 개념을 개념 LSH 인덱스 파일에 반영 (새 개념만 서명 계산)
+        
+        Returns:
+            int: 인덱스에 반영한 개념 수
+        """
+        if not self.created_concepts:
+            return 0
         
-        existing_link = Article_Concept.query.filter_by(
-            article_id=article.article_id,
-            concept_id=concept.concept_id
-        ).first()
-
-        if existing_link:
-            return False
-
-        db.session.add(Article_Concept(
-            article_id=article.article_id,
-            concept_id=concept.concept_id
-        ))
-        return True
+        with self.app_context:
+            added = update_concept_lsh_index(self.created_concepts)
+        self.created_concepts = []
+        return added
     
     def load_concept_relations(self, relations: List[Dict]) -> int:
         """
@@ -128,94 +326,146 @@ class DBLoader:
         Returns:
             int: 저장된 관계 수
         """
+        return self.load_concept_relations_bulk(relations)['saved']
+    
+    def load_concept_relations_bulk(self, relations: List[Dict]) -> Dict[str, int]:
+        """
+        개념 간 관계를 집합 단위로 저장합니다.
+        
+        관계 수와 무관하게 고정된 수의 라운드트립만 사용합니다:
+        1. 모든 개념 이름을 IN 쿼리로 한 번에 ID로 변환
+        2. 기존 (from, to) 쌍을 한 번에 조회
+        3. 신규 Concept_Relation 행을 executemany INSERT 한 번으로 저장
+        (IN 목록이 너무 길어지지 않도록 RELATION_BATCH_SIZE 단위로 나눠 조회)
+        
+        Args:
+            relations (List[Dict]): 관계 목록. 각 항목은 {'from': str, 'to': str, 'relation_type': str} 형태
+            
+        Returns:
+            dict: {'saved': int, 'skipped': int, 'errors': int, 'stale_articles': int}
+        """
+        counts = {'saved': 0, 'skipped': 0, 'errors': 0, 'stale_articles': 0}
+        
         with self.app_context:
             try:
                 # Stale State 방지: 이전 세션의 모든 변경사항을 먼저 커밋
                 db.session.commit()
-                # 세션 캐시 무효화 (신선한 데이터 조회 보장)
-                db.session.expire_all()
-                
-                saved_count = 0
-                skipped_count = 0
-                error_count = 0
                 
-                print(f"\n  ⟳ Processing {len(relations)} relations...")
-                print(f"  ✓ Session committed and cache cleared (Stale State prevention)")
+                print(f"\n  ⟳ Processing {len(relations)} relations (bulk)...")
                 
+                cleaned = []
+                names = set()
                 for rel in relations:
-                    from_name = rel.get('from', '').strip()
-                    to_name = rel.get('to', '').strip()
-                    relation_type = rel.get('relation_type', '').strip()
+                    from_name = (rel.get('from') or '').strip()
+                    to_name = (rel.get('to') or '').strip()
+                    relation_type = (rel.get('relation_type') or '').strip()
                     
                     if not all([from_name, to_name, relation_type]):
-                        error_count += 1
+                        counts['errors'] += 1
                         continue
                     
-                    # from 개념 조회
-                    from_concept = Concept.query.filter_by(name=from_name).first()
-                    if not from_concept:
-                        print(f"  ! Concept not found: {from_name}")
-                        error_count += 1
-                        continue
-                    
-                    # to 개념 조회
-                    to_concept = Concept.query.filter_by(name=to_name).first()
-                    if not to_concept:
-                        print(f"  ! Concept not found: {to_name}")
-                        error_count += 1
+                    cleaned.append((from_name, to_name, relation_type))
+                    names.update((from_name, to_name))
+                
+                # 1. 이름 → ID (IN 쿼리)
+                name_to_id = self._resolve_concept_ids(names)
+                
+                candidates = []
+                for from_name, to_name, relation_type in cleaned:
+                    missing = [n for n in (from_name, to_name) if n not in name_to_id]
+                    if missing:
+                        print(f"  ! Concept not found: {', '.join(missing)}")
+                        counts['errors'] += 1
                         continue
-                    
-                    # 중복 관계 확인 (Stale State 방지: 매번 최신 데이터 조회)
-                    db.session.expire_all()
-                    existing_relation = Concept_Relation.query.filter_by(
-                        from_concept_id=from_concept.concept_id,
-                        to_concept_id=to_concept.concept_id
-                    ).first()
-                    
-                    if existing_relation:
-                        skipped_count += 1
+                    candidates.append((name_to_id[from_name], name_to_id[to_name], relation_type, from_name, to_name))
+                
+                # 2. 기존 (from, to) 쌍 조회
+                existing_pairs = self._fetch_existing_relation_pairs(
+                    {(from_id, to_id) for from_id, to_id, *_ in candidates}
+                )
+                
+                new_rows = []
+                for from_id, to_id, relation_type, from_name, to_name in candidates:
+                    if (from_id, to_id) in existing_pairs:
+                        counts['skipped'] += 1
                         continue
-                    
-                    # 1. MySQL에 관계 저장
-                    new_relation = Concept_Relation(
-                        from_concept_id=from_concept.concept_id,
-                        to_concept_id=to_concept.concept_id,
-                        relation_type=relation_type,
-                        strength=5  # Default strength
+                    # 같은 배치 안의 중복도 건너뜀
+                    existing_pairs.add((from_id, to_id))
+                    new_rows.append({
+                        'from_concept_id': from_id,
+                        'to_concept_id': to_id,
+                        'relation_type': relation_type,
+                        'strength': 5  # Default strength
+                    })
+                    self.neo4j_writer.add_relation(
+                        from_id, to_id, relation_type, 5,
+                        from_name=from_name, to_name=to_name
                     )
-                    db.session.add(new_relation)
-                    
-                    # 2. Neo4j에 관계 저장 (ETL 2단계)
-                    try:
-                        neo4j_conn.execute_query(
-                            f"""
-                            MATCH (c1:Concept {{name: '{from_name}'}})
-                            MATCH (c2:Concept {{name: '{to_name}'}})
-                            MERGE (c1)-[r:{relation_type} {{strength: 5}}]->(c2)
-                            """
-                        )
-                        print(f"  ✓ (Neo4j) Linked: {from_name} -> {to_name}")
-                    except Exception as e:
-                        print(f"  ✗ (Neo4j) Error linking relations: {e}")
-                    
-                    saved_count += 1
-                    
-                    if saved_count % 10 == 0:
-                        print(f"  → Processed {saved_count} relations...")
                 
-                # 최종 커밋
+                # 3. 신규 관계 INSERT (executemany)
+                #    + 양 끝 개념의 이웃 목록 재계산, 그 개념을 포함한 기사의 그래프 캐시 stale 표시 (같은 트랜잭션)
+                if new_rows:
+                    db.session.execute(insert(Concept_Relation), new_rows)
+                    endpoint_ids = (
+                        {row['from_concept_id'] for row in new_rows}
+                        | {row['to_concept_id'] for row in new_rows}
+                    )
+                    AdjacencyService.refresh(endpoint_ids)
+                    counts['stale_articles'] = ETLService.mark_graph_caches_stale(endpoint_ids)
                 db.session.commit()
+                counts['saved'] = len(new_rows)
+                
+                # Neo4j에 관계 저장 (ETL 2단계, UNWIND 배치)
+                self.neo4j_writer.flush()
                 
                 print(f"\n  ✓ Relation loading complete!")
-                print(f"  ✓ Saved: {saved_count} relations")
-                print(f"  ⊘ Skipped (duplicates): {skipped_count} relations")
-                print(f"  ✗ Errors: {error_count} relations")
+                print(f"  ✓ Saved: {counts['saved']} relations")
+                print(f"  ⊘ Skipped (duplicates): {counts['skipped']} relations")
+                print(f"  ✗ Errors: {counts['errors']} relations")
+                print(f"  ⟳ Graph caches marked stale: {counts['stale_articles']} articles")
                 
-                return saved_count
+                return counts
             
             except Exception as e:
                 db.session.rollback()
+                self.neo4j_writer.clear()
                 print(f"  ✗✗ Database error while loading relations: {e}")
                 import traceback
                 traceback.print_exc()
-                return 0
+                return {'saved': 0, 'skipped': counts['skipped'], 'errors': len(relations) - counts['skipped'], 'stale_articles': 0}
+    
+    def _resolve_concept_ids(self, names) -> Dict[str, int]:
+        """개념 이름 집합을 {name: concept_id}로 변환 (사전에 없는 이름만 IN 쿼리, 대소문자 무시)"""
+        known = self.concept_ids or {}
+        name_to_id = {name: known[name.casefold()] for name in names if name.casefold() in known}
+        
+        missing = [name for name in names if name not in name_to_id]
+        found = {}
+        for start in range(0, len(missing), RELATION_BATCH_SIZE):
+            batch = missing[start:start + RELATION_BATCH_SIZE]
+            rows = db.session.query(Concept.name, Concept.concept_id).filter(
+                Concept.name.in_(batch)
+            ).all()
+            found.update({name.casefold(): concept_id for name, concept_id in rows})
+        name_to_id.update({
+            name: found[name.casefold()] for name in missing if name.casefold() in found
+        })
+        
+        if self.concept_ids is not None:
+            self.concept_ids.update(found)
+        return name_to_id
+    
+    def _fetch_existing_relation_pairs(self, pairs) -> Set[Tuple[int, int]]:
+        """이미 저장된 (from_concept_id, to_concept_id) 쌍 조회"""
+        existing = set()
+        pairs = list(pairs)
+        for start in range(0, len(pairs), RELATION_BATCH_SIZE):
+            batch = pairs[start:start + RELATION_BATCH_SIZE]
+            rows = db.session.query(
+                Concept_Relation.from_concept_id,
+                Concept_Relation.to_concept_id
+            ).filter(
+                tuple_(Concept_Relation.from_concept_id, Concept_Relation.to_concept_id).in_(batch)
+            ).all()
+            existing.update((from_id, to_id) for from_id, to_id in rows)
+        return existing
@@ -1,34 +1,165 @@
 import os
 import atexit
+from collections import defaultdict
+from typing import Dict, List, Optional
+
 from neo4j import GraphDatabase, Driver
 
+# 관계 타입은 Cypher 파라미터로 넘길 수 없으므로 허용 목록으로 검증 후 쿼리에 삽입
+VALID_RELATION_TYPES = {'IS_A_TYPE_OF', 'USED_IN', 'RELATED_TO', 'ENABLES', 'PART_OF'}
+
 class Neo4jConnection:
     def __init__(self):
         uri = os.getenv('NEO4J_URI')
         user = os.getenv('NEO4J_USERNAME')
         password = os.getenv('NEO4J_PASSWORD')
-        
+
         if not all([uri, user, password]):
             print("⚠️ 경고: Neo4j 환경 변수(URI, USERNAME, PASSWORD)가 설정되지 않았습니다.")
             self.driver = None
         else:
             self.driver = GraphDatabase.driver(uri, auth=(user, password), max_connection_lifetime=300)
 
+        self._constraints_ready = False
+
     def close(self):
         if self.driver:
             self.driver.close()
 
-    def execute_query(self, query):
+    def execute_query(self, query, parameters=None):
         if not self.driver:
             print("✗ 오류: Neo4j 드라이버가 초기화되지 않아 쿼리를 실행할 수 없습니다.")
             return None
-        
+
         with self.driver.session() as session:
-            result = session.run(query)
-            return result
+            # 세션이 닫히기 전에 결과를 모두 소비
+            return list(session.run(query, parameters or {}))
+
+    def ensure_constraints(self):
+        """concept_id 유니크 제약 보장 (MERGE가 인덱스를 타도록 함, 프로세스당 1회)"""
+        if self._constraints_ready or not self.driver:
+            return
+
+        self.execute_query(
+            "CREATE CONSTRAINT concept_id_unique IF NOT EXISTS "
+            "FOR (c:Concept) REQUIRE c.concept_id IS UNIQUE"
+        )
+        self._constraints_ready = True
+
+
+class Neo4jBatchWriter:
+    """
+    노드/관계 upsert를 버퍼에 모았다가 한 트랜잭션에서
+    파라미터화된 `UNWIND $rows` 배치로 반영하는 writer
+
+    노드는 concept_id로 MERGE합니다. 예전 ETL이 이름으로 만든 노드(concept_id 없음)는
+    배포 후 한 번 `python -m etl.neo4j_reconcile`로 정리해야 중복 노드가 생기지 않습니다.
+    """
+
+    def __init__(self, connection: Neo4jConnection, batch_size: Optional[int] = None):
+        """
+        Args:
+            connection (Neo4jConnection): Neo4j 연결
+            batch_size (int, optional): UNWIND 1회당 행 수. None이면 NEO4J_BATCH_SIZE 환경 변수 (기본값: 500)
+        """
+        self.connection = connection
+        self.batch_size = batch_size or int(os.getenv('NEO4J_BATCH_SIZE', 500))
+        self._nodes: Dict[int, str] = {}
+        self._relations: Dict[str, List[Dict]] = defaultdict(list)
+
+    def add_node(self, concept_id: int, name: str):
+        """Concept 노드 upsert 예약"""
+        self._nodes[concept_id] = name
+
+    def add_relation(
+        self,
+        from_id: int,
+        to_id: int,
+        relation_type: str,
+        strength: int,
+        from_name: Optional[str] = None,
+        to_name: Optional[str] = None
+    ):
+        """관계 upsert 예약 (허용되지 않은 관계 타입은 무시)"""
+        if relation_type not in VALID_RELATION_TYPES:
+            print(f"  ! (Neo4j) Skipping invalid relation_type: {relation_type}")
+            return
+
+        self._relations[relation_type].append({
+            'from_id': from_id,
+            'to_id': to_id,
+            'from_name': from_name,
+            'to_name': to_name,
+            'strength': strength
+        })
+
+    def pending(self) -> int:
+        """버퍼에 남아있는 upsert 수"""
+        return len(self._nodes) + sum(len(rows) for rows in self._relations.values())
+
+    def clear(self):
+        """버퍼 비우기 (MySQL 롤백 시 사용)"""
+        self._nodes.clear()
+        self._relations.clear()
+
+    def flush(self) -> bool:
+        """
+        버퍼의 모든 upsert를 단일 트랜잭션으로 반영
+
+        Returns:
+            bool: 성공 여부 (실패해도 버퍼는 비움 - MySQL이 SoT)
+        """
+        if not self.pending():
+            return True
+
+        nodes = [{'id': cid, 'name': name} for cid, name in self._nodes.items()]
+        relations = {rel_type: list(rows) for rel_type, rows in self._relations.items()}
+        self.clear()
+
+        driver = self.connection.driver
+        if not driver:
+            print("✗ 오류: Neo4j 드라이버가 초기화되지 않아 쿼리를 실행할 수 없습니다.")
+            return False
+
+        try:
+            self.connection.ensure_constraints()
+            with driver.session() as session:
+                session.execute_write(self._write_batches, nodes, relations)
+            relation_count = sum(len(rows) for rows in relations.values())
+            print(f"  ✓ (Neo4j) Flushed {len(nodes)} nodes, {relation_count} relations")
+            return True
+        except Exception as e:
+            print(f"  ✗ (Neo4j) Batch write failed: {e}")
+            return False
+
+    def _write_batches(self, tx, nodes: List[Dict], relations: Dict[str, List[Dict]]):
+        for start in range(0, len(nodes), self.batch_size):
+            tx.run(
+                """
+                UNWIND $rows AS row
+                MERGE (c:Concept {concept_id: row.id})
+                SET c.name = row.name
+                """,
+                rows=nodes[start:start + self.batch_size]
+            )
+
+        for relation_type, rows in relations.items():
+            for start in range(0, len(rows), self.batch_size):
+                tx.run(
+                    f"""
+                    UNWIND $rows AS row
+                    MERGE (c1:Concept {{concept_id: row.from_id}})
+                    ON CREATE SET c1.name = row.from_name
+                    MERGE (c2:Concept {{concept_id: row.to_id}})
+                    ON CREATE SET c2.name = row.to_name
+                    MERGE (c1)-[r:{relation_type}]->(c2)
+                    SET r.strength = row.strength
+                    """,
+                    rows=rows[start:start + self.batch_size]
+                )
 
 # 전역 Neo4j 연결 인스턴스 생성
 neo4j_conn = Neo4jConnection()
 
 # 앱 종료 시 자동으로 연결이 닫히도록 등록
-atexit.register(neo4j_conn.close)
\ No newline at end of file
+atexit.register(neo4j_conn.close)
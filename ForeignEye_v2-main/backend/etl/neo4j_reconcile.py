@@ -0,0 +1,157 @@
+"""
+Neo4j 기존 개념 노드 정리 (1회성, 재실행 가능)
+
+예전 ETL은 개념 노드를 이름으로 MERGE(`(:Concept {name})`)하여 concept_id 속성이 없습니다.
+지금의 Neo4jBatchWriter/동기화 작업은 concept_id로 MERGE하므로, 정리하지 않으면 같은 개념의
+노드가 둘이 되고 예전 관계는 이름 노드에 남습니다.
+
+MySQL Concept(name → concept_id)를 기준으로 배치마다:
+    1. concept_id가 없는 이름 노드에 concept_id를 부여 (같은 concept_id 노드가 아직 없을 때)
+    2. 이미 concept_id 노드가 있으면 이름 노드의 관계(허용된 관계 타입)를 그 노드로 옮김
+       (같은 관계가 이미 있으면 기존 강도 유지)
+    3. 관계가 모두 옮겨진 이름 노드 삭제
+이후 concept_id 유니크 제약을 보장합니다. MySQL에 없는 이름의 노드나 다른 타입의 관계가 남은 노드는
+건드리지 않고 개수만 보고합니다.
+
+배포 후(새 ETL 실행 전) 한 번 실행하세요:
+    python -m etl.neo4j_reconcile
+
+환경 변수:
+    NEO4J_BATCH_SIZE   UNWIND 1회당 개념 수 (기본값: 500)
+"""
+
+import os
+from typing import Dict
+
+from dotenv import load_dotenv
+
+from app import create_app
+from app.extensions import db
+from app.models import Concept
+from etl.neo4j_client import neo4j_conn, VALID_RELATION_TYPES
+
+
+_STAMP_LEGACY_NODES = """
+UNWIND $rows AS row
+MATCH (legacy:Concept {name: row.name})
+WHERE legacy.concept_id IS NULL
+WITH row, collect(legacy)[0] AS legacy
+OPTIONAL MATCH (keyed:Concept {concept_id: row.id})
+WITH row, legacy, keyed
+WHERE keyed IS NULL
+SET legacy.concept_id = row.id
+RETURN count(legacy) AS stamped
+"""
+
+_MOVE_OUTGOING = """
+UNWIND $rows AS row
+MATCH (legacy:Concept {{name: row.name}})
+WHERE legacy.concept_id IS NULL
+MATCH (keyed:Concept {{concept_id: row.id}})
+MATCH (legacy)-[old:{relation_type}]->(other)
+WITH keyed, old, CASE WHEN other = legacy THEN keyed ELSE other END AS target
+MERGE (keyed)-[r:{relation_type}]->(target)
+ON CREATE SET r.strength = old.strength
+DELETE old
+RETURN count(r) AS moved
+"""
+
+_MOVE_INCOMING = """
+UNWIND $rows AS row
+MATCH (legacy:Concept {{name: row.name}})
+WHERE legacy.concept_id IS NULL
+MATCH (keyed:Concept {{concept_id: row.id}})
+MATCH (other)-[old:{relation_type}]->(legacy)
+WHERE other <> legacy
+MERGE (other)-[r:{relation_type}]->(keyed)
+ON CREATE SET r.strength = old.strength
+DELETE old
+RETURN count(r) AS moved
+"""
+
+_DELETE_EMPTY_LEGACY_NODES = """
+UNWIND $rows AS row
+MATCH (legacy:Concept {name: row.name})
+WHERE legacy.concept_id IS NULL AND NOT (legacy)--()
+MATCH (:Concept {concept_id: row.id})
+DELETE legacy
+RETURN count(*) AS deleted
+"""
+
+_COUNT_REMAINING = """
+MATCH (legacy:Concept)
+WHERE legacy.concept_id IS NULL
+RETURN count(legacy) AS remaining
+"""
+
+
+def _single(tx, query: str, rows, key: str) -> int:
+    record = tx.run(query, rows=rows).single()
+    return record[key] if record else 0
+
+
+def _reconcile_batch(tx, rows) -> Dict[str, int]:
+    counts = {
+        'stamped': _single(tx, _STAMP_LEGACY_NODES, rows, 'stamped'),
+        'moved': 0,
+        'deleted': 0
+    }
+    for relation_type in sorted(VALID_RELATION_TYPES):
+        counts['moved'] += _single(tx, _MOVE_OUTGOING.format(relation_type=relation_type), rows, 'moved')
+        counts['moved'] += _single(tx, _MOVE_INCOMING.format(relation_type=relation_type), rows, 'moved')
+    counts['deleted'] = _single(tx, _DELETE_EMPTY_LEGACY_NODES, rows, 'deleted')
+    return counts
+
+
+def reconcile_legacy_concept_nodes(batch_size: int = None) -> Dict[str, int]:
+    """
+    이름으로 만들어진 개념 노드를 concept_id 노드로 정리
+
+    Args:
+        batch_size (int, optional): 배치당 개념 수. None이면 NEO4J_BATCH_SIZE 환경 변수 (기본값: 500)
+
+    Returns:
+        dict: {'stamped': concept_id 부여, 'moved': 옮긴 관계, 'deleted': 삭제한 이름 노드,
+               'remaining': 남은 concept_id 없는 노드}
+    """
+    batch_size = max(1, batch_size or int(os.getenv('NEO4J_BATCH_SIZE', 500)))
+    result = {'stamped': 0, 'moved': 0, 'deleted': 0, 'remaining': 0}
+
+    driver = neo4j_conn.driver
+    if not driver:
+        print("✗ 오류: Neo4j 드라이버가 초기화되지 않아 정리를 실행할 수 없습니다.")
+        return result
+
+    rows = [
+        {'id': concept_id, 'name': name}
+        for concept_id, name in db.session.query(Concept.concept_id, Concept.name)
+        .order_by(Concept.concept_id).all()
+    ]
+    print(f"  ⟳ Reconciling Neo4j concept nodes against {len(rows)} MySQL concepts...")
+
+    with driver.session() as session:
+        for start in range(0, len(rows), batch_size):
+            counts = session.execute_write(_reconcile_batch, rows[start:start + batch_size])
+            for key, value in counts.items():
+                result[key] += value
+
+        result['remaining'] = session.execute_read(
+            lambda tx: tx.run(_COUNT_REMAINING).single()['remaining']
+        )
+
+    neo4j_conn.ensure_constraints()
+
+    print(f"  ✓ (Neo4j) {result['stamped']} nodes keyed by concept_id, "
+          f"{result['moved']} relations moved, {result['deleted']} duplicate nodes deleted")
+    if result['remaining']:
+        print(f"  ! (Neo4j) {result['remaining']} concept nodes still have no concept_id "
+              f"(unknown name or non-ETL relations)")
+    return result
+
+
+if __name__ == "__main__":
+    load_dotenv()
+
+    app = create_app(os.getenv('FLASK_ENV', 'development'))
+    with app.app_context():
+        reconcile_legacy_concept_nodes()
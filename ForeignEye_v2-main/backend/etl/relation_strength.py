@@ -0,0 +1,232 @@
+"""
+개념 관계 강도(Concept_Relation.strength) 재계산 작업
+
+관계는 적재 시 strength=5로 저장되므로, 그래프의 min_strength 필터와 2차 노드 순위가 의미를 갖도록
+두 근거로 강도를 다시 매깁니다.
+    - 유사도: SimilarityCalculator 점수 규칙 (SimilarityEngine.score_pairs로 일괄 계산)
+    - 공동 등장: 두 개념이 함께 연결된 기사 수 (Article_Concept)
+
+    score    = w × 유사도 + (1 - w) × min(1, log(1 + 공동 등장) / log(1 + 포화 기사 수))
+    strength = 3 + round(7 × score)   (최저 3, 최고 10)
+
+LLM이 확인한 관계이므로 근거가 없어도(점수 0) 그래프/강한 연결의 기본 min_strength(3) 이상으로 남깁니다.
+
+증분 실행 시 다음 관계만 다시 계산합니다 (워터마크 2개):
+    - 마지막 실행 이후 추가된 관계 (relation_id > 'relation_strength.relation_id')
+    - 마지막 실행 이후 적재된 기사에 양 끝 개념이 함께 등장한 관계 (article_id > 'relation_strength.article_id')
+강도가 바뀐 관계만 executemany UPDATE로 저장하고, 양 끝 개념의 이웃 목록(Concept_Adjacency)을 다시 계산하며
+기사 그래프 캐시를 stale로 표시합니다.
+
+환경 변수:
+    RELATION_STRENGTH_BATCH_SIZE            배치당 관계 수 (기본값: 1000)
+    RELATION_STRENGTH_SIMILARITY_WEIGHT     유사도 가중치 w (기본값: 0.5)
+    RELATION_STRENGTH_COOCCURRENCE_SATURATION  점수가 1이 되는 공동 등장 기사 수 (기본값: 10)
+
+사용법:
+    python -m etl.relation_strength
+    python -m etl.relation_strength --full    (워터마크 무시, 전체 재계산)
+"""
+
+import os
+import sys
+from typing import Dict, List, Set
+
+import numpy as np
+from dotenv import load_dotenv
+from sqlalchemy import and_, func, update
+from sqlalchemy.orm import aliased
+
+from app import create_app
+from app.extensions import db
+from app.models import Article, Article_Concept, Concept, Concept_Relation, ETL_Watermark
+from app.services.adjacency_service import AdjacencyService
+from app.services.etl_service import ETLService
+from etl.db_loader import PLACEHOLDER_DESCRIPTION
+from etl.neo4j_client import neo4j_conn, Neo4jBatchWriter
+from etl.similarity_engine import SimilarityEngine
+
+
+RELATION_WATERMARK = 'relation_strength.relation_id'
+ARTICLE_WATERMARK = 'relation_strength.article_id'
+# 그래프 캐시(build_graph_caches_bulk)와 find_new_strong_connections의 기본 최소 강도
+MIN_STRENGTH = 3
+MAX_STRENGTH = 10
+
+
+def compute_strengths(similarity: np.ndarray, cooccurrence: np.ndarray,
+                      similarity_weight: float = 0.5, saturation: int = 10) -> np.ndarray:
+    """
+    유사도/공동 등장 기사 수 → 관계 강도
+
+    Args:
+        similarity (np.ndarray): 유사도 점수 (0.0 ~ 1.0)
+        cooccurrence (np.ndarray): 공동 등장 기사 수
+        similarity_weight (float): 유사도 가중치
+        saturation (int): 공동 등장 점수가 1이 되는 기사 수
+
+    Returns:
+        np.ndarray: 강도 (int, MIN_STRENGTH ~ MAX_STRENGTH)
+    """
+    cooccurrence_score = np.minimum(1.0, np.log1p(cooccurrence) / np.log1p(max(saturation, 1)))
+    score = similarity_weight * np.clip(similarity, 0.0, 1.0) + (1 - similarity_weight) * cooccurrence_score
+    strengths = MIN_STRENGTH + np.rint(score * (MAX_STRENGTH - MIN_STRENGTH))
+    return np.clip(strengths, MIN_STRENGTH, MAX_STRENGTH).astype(np.int64)
+
+
+def _touched_relation_ids(relation_watermark: int, max_relation_id: int,
+                          article_watermark: int, max_article_id: int) -> List[int]:
+    """워터마크 이후 추가된 관계 + 새 기사에서 양 끝 개념이 함께 등장한 관계"""
+    relation_ids = {
+        relation_id for (relation_id,) in db.session.query(Concept_Relation.relation_id).filter(
+            Concept_Relation.relation_id > relation_watermark,
+            Concept_Relation.relation_id <= max_relation_id
+        ).all()
+    }
+
+    if max_article_id > article_watermark:
+        AC1 = aliased(Article_Concept)
+        AC2 = aliased(Article_Concept)
+        rows = (
+            db.session.query(Concept_Relation.relation_id)
+            .join(AC1, AC1.concept_id == Concept_Relation.from_concept_id)
+            .join(AC2, and_(
+                AC2.article_id == AC1.article_id,
+                AC2.concept_id == Concept_Relation.to_concept_id
+            ))
+            .filter(
+                AC1.article_id > article_watermark,
+                AC1.article_id <= max_article_id,
+                Concept_Relation.relation_id <= max_relation_id
+            )
+            .distinct()
+            .all()
+        )
+        relation_ids.update(relation_id for (relation_id,) in rows)
+
+    return sorted(relation_ids)
+
+
+def _load_engine(concept_ids: Set[int]) -> SimilarityEngine:
+    """관계 양 끝 개념만으로 유사도 엔진 구성 (placeholder 설명은 무시)"""
+    rows = db.session.query(
+        Concept.concept_id, Concept.name, Concept.description_ko
+    ).filter(Concept.concept_id.in_(concept_ids)).all()
+
+    return SimilarityEngine(
+        (concept_id, name, '' if description == PLACEHOLDER_DESCRIPTION else (description or ''))
+        for concept_id, name, description in rows
+    )
+
+
+def _count_cooccurrences(relation_ids: List[int]) -> Dict[int, int]:
+    """관계별 양 끝 개념 공동 등장 기사 수 (GROUP BY 쿼리 1회)"""
+    AC1 = aliased(Article_Concept)
+    AC2 = aliased(Article_Concept)
+    rows = (
+        db.session.query(Concept_Relation.relation_id, func.count(AC1.article_id))
+        .join(AC1, AC1.concept_id == Concept_Relation.from_concept_id)
+        .join(AC2, and_(
+            AC2.article_id == AC1.article_id,
+            AC2.concept_id == Concept_Relation.to_concept_id
+        ))
+        .filter(Concept_Relation.relation_id.in_(relation_ids))
+        .group_by(Concept_Relation.relation_id)
+        .all()
+    )
+    return dict(rows)
+
+
+def recompute_relation_strengths(full_refresh: bool = False, batch_size: int = None) -> Dict[str, int]:
+    """
+    관계 강도 재계산 (증분 또는 전체)
+
+    Args:
+        full_refresh (bool): True면 워터마크를 무시하고 모든 관계를 재계산
+        batch_size (int, optional): 배치당 관계 수. None이면 RELATION_STRENGTH_BATCH_SIZE 환경 변수 (기본값: 1000)
+
+    Returns:
+        dict: {'relations': 재계산한 관계 수, 'updated': 강도가 바뀐 관계 수, 'stale_articles': stale 표시한 기사 수}
+    """
+    batch_size = max(1, batch_size or int(os.getenv('RELATION_STRENGTH_BATCH_SIZE', 1000)))
+    similarity_weight = float(os.getenv('RELATION_STRENGTH_SIMILARITY_WEIGHT', 0.5))
+    saturation = int(os.getenv('RELATION_STRENGTH_COOCCURRENCE_SATURATION', 10))
+    result = {'relations': 0, 'updated': 0, 'stale_articles': 0}
+
+    # 시작 시점의 최댓값까지만 처리 (실행 중 추가된 행은 다음 실행에서 처리)
+    max_relation_id = db.session.query(func.max(Concept_Relation.relation_id)).scalar() or 0
+    max_article_id = db.session.query(func.max(Article.article_id)).scalar() or 0
+
+    if full_refresh:
+        relation_ids = [
+            relation_id for (relation_id,) in db.session.query(Concept_Relation.relation_id).filter(
+                Concept_Relation.relation_id <= max_relation_id
+            ).order_by(Concept_Relation.relation_id).all()
+        ]
+    else:
+        relation_ids = _touched_relation_ids(
+            ETL_Watermark.get_value(RELATION_WATERMARK), max_relation_id,
+            ETL_Watermark.get_value(ARTICLE_WATERMARK), max_article_id
+        )
+
+    print(f"  ⟳ Recomputing strength for {len(relation_ids)} relations "
+          f"({'full' if full_refresh else 'incremental'})...")
+
+    neo4j_writer = Neo4jBatchWriter(neo4j_conn)
+
+    for start in range(0, len(relation_ids), batch_size):
+        batch_ids = relation_ids[start:start + batch_size]
+        relations = db.session.query(
+            Concept_Relation.relation_id,
+            Concept_Relation.from_concept_id,
+            Concept_Relation.to_concept_id,
+            Concept_Relation.relation_type,
+            Concept_Relation.strength
+        ).filter(Concept_Relation.relation_id.in_(batch_ids)).all()
+        if not relations:
+            continue
+
+        engine = _load_engine(
+            {rel.from_concept_id for rel in relations} | {rel.to_concept_id for rel in relations}
+        )
+        similarity = engine.score_pairs((rel.from_concept_id, rel.to_concept_id) for rel in relations)
+        counts = _count_cooccurrences(batch_ids)
+        cooccurrence = np.asarray([counts.get(rel.relation_id, 0) for rel in relations], dtype=np.float64)
+        strengths = compute_strengths(similarity, cooccurrence, similarity_weight, saturation)
+
+        changed = [
+            (rel, int(strength)) for rel, strength in zip(relations, strengths)
+            if rel.strength != strength
+        ]
+        if changed:
+            db.session.execute(
+                update(Concept_Relation),
+                [{'relation_id': rel.relation_id, 'strength': strength} for rel, strength in changed]
+            )
+            endpoint_ids = {rel.from_concept_id for rel, _ in changed} | {rel.to_concept_id for rel, _ in changed}
+            AdjacencyService.refresh(endpoint_ids)
+            result['stale_articles'] += ETLService.mark_graph_caches_stale(endpoint_ids)
+            for rel, strength in changed:
+                neo4j_writer.add_relation(rel.from_concept_id, rel.to_concept_id, rel.relation_type, strength)
+        db.session.commit()
+
+        result['relations'] += len(relations)
+        result['updated'] += len(changed)
+
+    # 모든 배치가 커밋된 뒤에만 워터마크 전진
+    ETL_Watermark.set_value(RELATION_WATERMARK, max_relation_id)
+    ETL_Watermark.set_value(ARTICLE_WATERMARK, max_article_id)
+    db.session.commit()
+
+    neo4j_writer.flush()
+
+    print(f"  ✓ Relation strengths: {result['updated']}/{result['relations']} changed, "
+          f"{result['stale_articles']} graph caches marked stale")
+    return result
+
+
+if __name__ == "__main__":
+    load_dotenv()
+
+    app = create_app(os.getenv('FLASK_ENV', 'development'))
+    with app.app_context():
+        recompute_relation_strengths(full_refresh='--full' in sys.argv)
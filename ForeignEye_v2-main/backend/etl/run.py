@@ -11,17 +11,26 @@ ETL 파이프라인 실행 스크립트
     run_etl_pipeline()
 """
 
+import asyncio
 import os
+import queue
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, List, Optional
 from dotenv import load_dotenv
 from flask import current_app
 # [추가] db 확장 임포트 (COMMIT 사용 목적)
 from app.extensions import db
 
 from app import create_app
+from app.services.etl_service import ETLService
 from etl.gnews_fetcher import GNewsFetcher
 from etl.web_scraper import WebScraper
 from etl.ai_analyzer import AIAnalyzer
 from etl.db_loader import DBLoader
+from etl.url_filter import get_url_filter
+from etl.cooccurrence import update_cooccurrences
 
 def check_environment():
     """환경 변수 검증"""
@@ -49,12 +58,46 @@ def check_environment():
     print("✓ Environment variables validated")
     return True
 
-def run_etl_pipeline(max_articles: int = 3):
+def _scrape_articles(scraper: WebScraper, articles: List[dict], on_scraped: Callable[[int, Optional[str]], None]):
+    """
+    기사 본문을 비동기로 스크래핑하여 완료되는 순서대로 on_scraped(기사 번호, 본문 or None) 호출
+    
+    WebScraper.scrape_many가 커넥션 풀 하나를 공유하므로 같은 호스트의 기사는 연결을 재사용합니다.
+    (전용 스레드에서 실행, DB 접근 없음)
+    
+    환경 변수:
+        ETL_SCRAPE_MAX_CONNECTIONS   전체 동시 연결 수 (기본값: 20)
+        ETL_SCRAPE_MAX_PER_HOST      호스트별 동시 요청 수 (기본값: 4)
+        ETL_SCRAPE_DEADLINE          전체 스크래핑 제한 시간 (초, 기본값: 제한 없음)
+    """
+    idx_by_url = {article_data['url']: idx for idx, article_data in enumerate(articles, 1)}
+    deadline = os.getenv('ETL_SCRAPE_DEADLINE')
+    
+    async def consume():
+        async for url, content in scraper.scrape_many(
+            list(idx_by_url),
+            max_connections=int(os.getenv('ETL_SCRAPE_MAX_CONNECTIONS', 20)),
+            max_per_host=int(os.getenv('ETL_SCRAPE_MAX_PER_HOST', 4)),
+            deadline=float(deadline) if deadline else None
+        ):
+            on_scraped(idx_by_url[url], content)
+    
+    asyncio.run(consume())
+
+def run_etl_pipeline(
+    max_articles: int = 3,
+    workers: Optional[int] = None,
+    load_batch_size: Optional[int] = None,
+    analyze_batch_size: Optional[int] = None
+):
     """
     ETL 파이프라인 실행
     
     Args:
         max_articles (int): 수집할 최대 기사 수
+        workers (int, optional): AI 분석 워커 수. None이면 ETL_WORKERS 환경 변수 (기본값: 4)
+        load_batch_size (int, optional): 한 트랜잭션으로 적재할 기사 수. None이면 ETL_LOAD_BATCH_SIZE 환경 변수 (기본값: 20)
+        analyze_batch_size (int, optional): AI 요청 1건에 묶을 최대 기사 수. None이면 ETL_ANALYZE_BATCH_SIZE 환경 변수 (기본값: 5)
         
     Returns:
         dict: {
@@ -68,6 +111,18 @@ def run_etl_pipeline(max_articles: int = 3):
     print("=" * 70)
     print()
     
+    if workers is None:
+        workers = int(os.getenv('ETL_WORKERS', 4))
+    workers = max(1, workers)
+    if load_batch_size is None:
+        load_batch_size = int(os.getenv('ETL_LOAD_BATCH_SIZE', 20))
+    load_batch_size = max(1, load_batch_size)
+    if analyze_batch_size is None:
+        analyze_batch_size = int(os.getenv('ETL_ANALYZE_BATCH_SIZE', 5))
+    analyze_batch_size = max(1, analyze_batch_size)
+    # 배치 요청 1건의 입력 토큰 예산 (추정치, 넘으면 analyze_articles_batch가 요청을 나눔)
+    analyze_token_budget = int(os.getenv('ETL_ANALYZE_TOKEN_BUDGET', 6000))
+    
     # 환경 변수 검증
     if not check_environment():
         return {'processed': 0, 'skipped': 0, 'errors': 0}
@@ -79,6 +134,7 @@ def run_etl_pipeline(max_articles: int = 3):
     scraper = WebScraper()
     analyzer = AIAnalyzer()
     loader = DBLoader(current_app.app_context())
+    url_filter = get_url_filter()
     
     # Step 1: 기사 URL 수집
     print("STEP 1: Fetching articles from GNews API...")
@@ -96,53 +152,156 @@ def run_etl_pipeline(max_articles: int = 3):
     
     print()
     
-    # Step 2: 각 기사 처리
-    print("STEP 2: Processing articles...")
+    # Step 1-1: 이미 저장된 URL 제외 (스크래핑/AI 분석 비용을 쓰기 전에)
+    print("STEP 1-1: Filtering already stored articles...")
+    print("-" * 70)
+    
+    fetched_count = len(articles)
+    articles, filter_stats = url_filter.filter_new(articles)
+    known_count = fetched_count - len(articles)
+    print(f"✓ New: {filter_stats['new']} / Fetched: {filter_stats['fetched']} "
+          f"(invalid {filter_stats['invalid']}, duplicates {filter_stats['duplicates']}, known via cache {filter_stats['known_cache']}, "
+          f"known via DB {filter_stats['known_db']})")
+    
+    if not articles:
+        print("\n⊘ No new articles to process. Exiting.")
+        return {'processed': 0, 'skipped': known_count, 'errors': 0}
+    
+    print()
+    
+    # Step 2: 각 기사 처리 (스크래핑은 비동기 스레드, 분석은 워커 풀, 적재는 단일 writer)
+    print(f"STEP 2: Processing articles... (workers: {workers}, analysis batch: {analyze_batch_size})")
     print("-" * 70)
     
     processed_count = 0
-    skipped_count = 0
+    skipped_count = known_count
     error_count = 0
+    stage_times = {'scrape': 0.0, 'analyze': 0.0, 'load': 0.0}
+    pipeline_started = time.perf_counter()
+    
+    # 분석이 끝난 기사는 모아 두었다가 load_batch_size개씩 한 트랜잭션으로 적재
+    pending_loads = []
+    
+    def flush_loads():
+        nonlocal processed_count, skipped_count, error_count
+        if not pending_loads:
+            return
+        
+        print(f"\n  ⟳ Saving {len(pending_loads)} articles to database...")
+        load_started = time.perf_counter()
+        outcomes = loader.load_articles_bulk(pending_loads)
+        stage_times['load'] += time.perf_counter() - load_started
+        
+        stored_urls = []
+        for (article_data, _), outcome in zip(pending_loads, outcomes):
+            if outcome['status'] == 'loaded':
+                processed_count += 1
+            elif outcome['status'] == 'exists':
+                skipped_count += 1
+            else:
+                error_count += 1
+                continue
+            stored_urls.append(article_data['url'])
+        url_filter.remember(stored_urls)
+        pending_loads.clear()
+    
+    # 스크래핑은 전용 스레드의 이벤트 루프에서 비동기로 실행하고, 본문이 도착하는 대로 analyze_batch_size개씩 묶어
+    # AI 배치 분석(요청 1건에 여러 기사)을 워커 풀에 넘깁니다.
+    # 두 단계의 결과는 큐로 모으며, DB 적재는 세션을 공유하지 않도록 현재(앱 컨텍스트) 스레드에서만 직렬로 수행합니다.
+    # 큐 항목: (기사 번호, analysis or None, 실패 단계 ('scrape'/'analyze'/'error') or None, 분석 소요 시간, 오류 or None)
+    results = queue.Queue()
+    scraped = set()
+    scraped_batch = []
     
-    for idx, article_data in enumerate(articles, 1):
-        print(f"\n[Article {idx}/{len(articles)}]")
-        print(f"Title: {article_data['title']}")
-        print(f"URL: {article_data['url']}")
+    def analyze(batch):
+        started = time.perf_counter()
+        try:
+            analyses = analyzer.analyze_articles_batch(
+                [content for _, content in batch],
+                token_budget=analyze_token_budget,
+                max_batch_size=analyze_batch_size
+            )
+        except Exception as e:
+            elapsed = (time.perf_counter() - started) / len(batch)
+            for idx, _ in batch:
+                results.put((idx, None, 'error', elapsed, e))
+            return
         
+        # 배치 소요 시간은 기사 수로 나누어 기록
+        elapsed = (time.perf_counter() - started) / len(batch)
+        for position, (idx, _) in enumerate(batch):
+            analysis = analyses.get(position)
+            results.put((idx, analysis, None if analysis else 'analyze', elapsed, None))
+    
+    def submit_scraped_batch():
+        if scraped_batch:
+            executor.submit(analyze, list(scraped_batch))
+            scraped_batch.clear()
+    
+    def on_scraped(idx, content):
+        if content:
+            scraped_batch.append((idx, content))
+            if len(scraped_batch) >= analyze_batch_size:
+                submit_scraped_batch()
+        else:
+            results.put((idx, None, 'scrape', 0.0, None))
+        scraped.add(idx)
+    
+    def scrape_all():
+        started = time.perf_counter()
         try:
-            # Step 2-1: 웹 스크래핑
-            content = scraper.scrape_article(article_data['url'])
+            _scrape_articles(scraper, articles, on_scraped)
+        except Exception as e:
+            print(f"  ✗✗ Error while scraping articles: {e}")
+        finally:
+            stage_times['scrape'] = time.perf_counter() - started
+            try:
+                submit_scraped_batch()
+            except Exception as e:
+                print(f"  ✗✗ Error while scheduling analysis: {e}")
+                for idx, _ in scraped_batch:
+                    results.put((idx, None, 'error', 0.0, e))
+            # 스크래핑이 중단되어 결과가 없는 기사는 스크래핑 실패로 처리
+            for idx in range(1, len(articles) + 1):
+                if idx not in scraped:
+                    results.put((idx, None, 'scrape', 0.0, None))
+    
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix='etl-worker') as executor:
+        scrape_thread = threading.Thread(target=scrape_all, name='etl-scraper', daemon=True)
+        scrape_thread.start()
+        
+        for _ in range(len(articles)):
+            idx, analysis, failed_stage, elapsed, error = results.get()
+            stage_times['analyze'] += elapsed
+            article_data = articles[idx - 1]
+            print(f"\n[Article {idx}/{len(articles)}]")
+            print(f"Title: {article_data['title']}")
+            print(f"URL: {article_data['url']}")
             
-            if not content:
+            if failed_stage == 'scrape':
                 print("  ✗ Failed to scrape content. Skipping.")
                 error_count += 1
                 continue
             
-            # Step 2-2: AI 분석
-            analysis = analyzer.analyze_article(content)
-            
-            if not analysis:
+            if failed_stage == 'analyze':
                 print("  ✗ Failed to analyze content. Skipping.")
                 error_count += 1
                 continue
             
-            # Step 2-3: 데이터베이스 적재
-            print("  ⟳ Saving to database...")
-            
-            result = loader.load_article_data(
-                article_data=article_data,
-                analysis=analysis
-            )
+            if failed_stage == 'error':
+                print(f"  ✗✗ Error processing article: {error}")
+                error_count += 1
+                continue
             
-            if result:
-                processed_count += 1
-            else:
-                skipped_count += 1
+            # Step 2-3: 데이터베이스 적재 (single writer, 배치 단위)
+            print("  ✓ Analyzed. Queued for database load.")
+            pending_loads.append((article_data, analysis))
+            if len(pending_loads) >= load_batch_size:
+                flush_loads()
         
-        except Exception as e:
-            print(f"  ✗✗ Error processing article: {e}")
-            error_count += 1
-            continue
+        scrape_thread.join()
+    
+    flush_loads()
     
     # [추가] 파이프라인 완료 후, 세션에 추가된 데이터를 최종 커밋
     try:
@@ -153,6 +312,38 @@ def run_etl_pipeline(max_articles: int = 3):
         print(f"✗ ERROR: Final session commit failed (rolling back): {e}")
         error_count += 1
     
+    # 새 기사의 개념 공동 등장을 Concept_Cooccurrence에 반영 (증분)
+    if loader.loaded_article_ids:
+        try:
+            update_cooccurrences()
+        except Exception as e:
+            print(f"✗ Co-occurrence update failed: {e}")
+            ETLService.schedule_task('update_concept_cooccurrence_task')
+    
+    # 새 개념을 개념 LSH 인덱스에 반영 (관계 분석 후보 쌍 생성용)
+    if loader.created_concepts:
+        try:
+            lsh_added = loader.flush_concept_lsh()
+            print(f"✓ Concept LSH index updated (+{lsh_added} concepts)")
+        except Exception as e:
+            print(f"✗ Concept LSH index update failed (will be synced by the relations ETL): {e}")
+    
+    # Step 3: 신규 기사 그래프 캐시 일괄 사전 계산 (조회 요청 시 생성하지 않도록)
+    graph_caches_built = 0
+    if loader.loaded_article_ids:
+        print()
+        print("STEP 3: Precomputing graph caches for new articles...")
+        print("-" * 70)
+        try:
+            graph_caches_built = ETLService.precompute_graph_caches(loader.loaded_article_ids)
+            print(f"✓ Precomputed {graph_caches_built} graph caches")
+        except Exception as e:
+            db.session.rollback()
+            print(f"✗ Graph cache precomputation failed: {e}")
+            ETLService.schedule_task('backfill_graph_caches_task')
+    
+    wall_time = time.perf_counter() - pipeline_started
+    
     # 최종 요약
     print()
     print("=" * 70)
@@ -161,7 +352,19 @@ def run_etl_pipeline(max_articles: int = 3):
     print(f"✓ Successfully processed: {processed_count} articles")
     print(f"⊘ Skipped (already exists): {skipped_count} articles")
     print(f"✗ Errors: {error_count} articles")
-    print(f"Total fetched: {len(articles)} articles")
+    print(f"Total fetched: {fetched_count} articles")
+    print(f"✓ Graph caches precomputed: {graph_caches_built} articles")
+    print("-" * 70)
+    print(f"⏱ Scrape (wall): {stage_times['scrape']:.2f}s")
+    print(f"⏱ Analyze (sum): {stage_times['analyze']:.2f}s")
+    print(f"⏱ Load (sum): {stage_times['load']:.2f}s")
+    print(f"⏱ Wall time: {wall_time:.2f}s")
+    if wall_time > 0:
+        print(f"⏱ Throughput: {len(articles) / wall_time:.2f} new articles/s")
+    if analyzer.cache:
+        cache_stats = analyzer.cache.stats()
+        print(f"⚡ LLM cache: {cache_stats['hits']} hits / {cache_stats['misses']} misses "
+              f"(hit rate {cache_stats['hit_rate']:.0%})")
     print("=" * 70)
     
     return {
@@ -4,162 +4,447 @@ ETL Phase 2: 개념 관계 분석 및 저장 스크립트
 기존 Concept 테이블의 개념들 간의 관계를 AI로 분석하여
 Concept_Relation 테이블에 저장합니다.
 
+- 마지막 실행 이후 추가된 개념(워터마크 이후)만 분석 대상이 됩니다.
+- 개념들은 Concept_Cooccurrence 공동 등장 이웃과 개념 LSH 인덱스(키워드 MinHash)의 유사 후보 이웃을
+  기준으로 크기가 제한된 청크로 나뉘고, 청크들은 워커 풀에서 동시에 (재시도 포함) 분석됩니다.
+
+환경 변수:
+    RELATIONS_LSH_NEIGHBOURS       신규 개념당 추가할 LSH 유사 후보 수 (기본값: 10, 0이면 사용 안 함)
+    RELATIONS_LSH_MIN_SIMILARITY   LSH 후보 최소 추정 Jaccard (기본값: 0.3)
+
 사용법:
     python -m etl.run_relations
-    
+    python -m etl.run_relations --full    (워터마크 무시, 전체 재분석)
+
 또는:
     from etl.run_relations import run_relations_etl
     run_relations_etl()
 """
 
 import os
+import sys
+import time
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Dict, List, Optional, Set
+
 from dotenv import load_dotenv
 from flask import current_app
 
 from app import create_app
 from app.extensions import db
-from app.models import Concept
+from app.models import Concept, ETL_Watermark
+from app.services.adjacency_service import AdjacencyService
+from app.services.cooccurrence_service import CooccurrenceService
+from app.services.etl_service import ETLService
 from etl.ai_analyzer import AIAnalyzer
+from etl.concept_lsh import load_concept_lsh_index
+from etl.cooccurrence import update_cooccurrences
 from etl.db_loader import DBLoader
+from etl.relation_strength import recompute_relation_strengths
+
+
+# 관계 분석을 마친 마지막 concept_id
+RELATIONS_WATERMARK = 'relations.concept_id'
+
+
+def _load_cooccurrence_neighbours(concept_ids: Set[int], limit: int) -> Dict[int, List[int]]:
+    """
+    개념별 공동 등장 이웃 조회 (Concept_Cooccurrence를 증분 갱신한 뒤 인덱스 조회)
+
+    Args:
+        concept_ids (Set[int]): 기준 개념 ID 집합
+        limit (int): 개념당 최대 이웃 수
+
+    Returns:
+        dict: {concept_id: [이웃 concept_id, ...]} (공동 등장 기사 수 내림차순)
+    """
+    if not concept_ids:
+        return {}
+
+    try:
+        update_cooccurrences()
+    except Exception as e:
+        print(f"! Co-occurrence update failed (using stored counts): {e}")
+        ETLService.schedule_task('update_concept_cooccurrence_task')
+
+    neighbours = CooccurrenceService.get_neighbours(concept_ids, limit=limit)
+    return {
+        concept_id: [neighbour['concept_id'] for neighbour in rows]
+        for concept_id, rows in neighbours.items()
+        if rows
+    }
+
+
+def _load_similar_neighbours(concept_ids: List[int], limit: int,
+                             min_similarity: float) -> Dict[int, List[int]]:
+    """
+    개념 LSH 인덱스의 유사 후보 이웃 조회 (인덱스는 DB와 동기화 후 사용)
+
+    Args:
+        concept_ids (List[int]): 기준 개념 ID 목록
+        limit (int): 개념당 최대 이웃 수
+        min_similarity (float): 최소 추정 Jaccard
+
+    Returns:
+        dict: {concept_id: [이웃 concept_id, ...]} (추정 Jaccard 내림차순)
+    """
+    index = load_concept_lsh_index(sync=True)
+    similar = index.neighbours(concept_ids, limit=limit, min_similarity=min_similarity)
+    return {
+        concept_id: [nid for nid, _ in pairs]
+        for concept_id, pairs in similar.items()
+    }
 
 
-def run_relations_etl():
+def merge_neighbours(*sources: Dict[int, List[int]]) -> Dict[int, List[int]]:
+    """
+    이웃 목록 병합 (앞선 소스의 순서 우선, 중복 제거)
+
+    Returns:
+        dict: {concept_id: [이웃 concept_id, ...]}
+    """
+    merged: Dict[int, List[int]] = {}
+    seen: Dict[int, Set[int]] = defaultdict(set)
+    for source in sources:
+        for concept_id, neighbour_ids in source.items():
+            current = merged.setdefault(concept_id, [])
+            for nid in neighbour_ids:
+                if nid not in seen[concept_id]:
+                    seen[concept_id].add(nid)
+                    current.append(nid)
+    return merged
+
+
+def build_relation_chunks(
+    target_ids: List[int],
+    neighbours: Dict[int, List[int]],
+    chunk_size: int
+) -> List[List[int]]:
+    """
+    분석 대상 개념을 크기가 제한된 청크로 분할
+
+    각 대상 개념은 이웃(공동 등장 + LSH 유사 후보, 최대 chunk_size의 절반)과 같은 청크에 배치되므로,
+    LLM은 실제로 함께 언급되거나 키워드가 겹치는 개념 쌍을 우선적으로 보게 됩니다.
+
+    Args:
+        target_ids (List[int]): 분석 대상(신규) 개념 ID 목록
+        neighbours (dict): {concept_id: [이웃 ID, ...]}
+        chunk_size (int): 청크당 최대 개념 수
+
+    Returns:
+        List[List[int]]: 개념 ID 청크 목록
+    """
+    chunks = []
+    current: List[int] = []
+    current_set: Set[int] = set()
+    neighbour_cap = max(1, chunk_size // 2)
+
+    for concept_id in target_ids:
+        members = [concept_id] + neighbours.get(concept_id, [])[:neighbour_cap]
+        new_members = [m for m in members if m not in current_set]
+
+        if current and len(current) + len(new_members) > chunk_size:
+            chunks.append(current)
+            current, current_set = [], set()
+            new_members = members
+
+        for member in new_members:
+            current.append(member)
+            current_set.add(member)
+
+    if len(current) >= 2:
+        chunks.append(current)
+    elif current and chunks:
+        # 혼자 남은 개념은 마지막 청크에 합류 (크기를 1 초과하는 것은 허용)
+        chunks[-1].extend(m for m in current if m not in chunks[-1])
+
+    return chunks
+
+
+def _analyze_chunk(analyzer: AIAnalyzer, names: List[str], max_retries: int) -> Optional[List[Dict]]:
+    """
+    청크 1건 관계 분석 (지수 백오프 재시도)
+
+    Returns:
+        list: 관계 목록. 모든 시도가 실패하면 None
+    """
+    for attempt in range(max_retries + 1):
+        try:
+            analysis = analyzer.analyze_concept_relations(names)
+            if analysis:
+                return analysis.get('relations', [])
+        except Exception as e:
+            print(f"     ✗ Chunk analysis error: {type(e).__name__}: {e}")
+
+        if attempt < max_retries:
+            time.sleep(2 ** attempt)
+
+    return None
+
+
+def run_relations_etl(
+    full_refresh: bool = False,
+    chunk_size: Optional[int] = None,
+    workers: Optional[int] = None,
+    max_retries: int = 2
+):
     """
     개념 관계 ETL 파이프라인 실행
-    
+
+    Args:
+        full_refresh (bool): True면 워터마크를 무시하고 모든 개념을 재분석
+        chunk_size (int, optional): 청크당 최대 개념 수. None이면 RELATIONS_CHUNK_SIZE 환경 변수 (기본값: 40)
+        workers (int, optional): 동시 분석 청크 수. None이면 ETL_WORKERS 환경 변수 (기본값: 4)
+        max_retries (int): 청크별 재시도 횟수
+
     Returns:
         dict: {
             'total_concepts': int,
+            'new_concepts': int,
+            'chunks': int,
+            'failed_chunks': int,
             'relations_saved': int
         }
     """
+    chunk_size = max(2, chunk_size or int(os.getenv('RELATIONS_CHUNK_SIZE', 40)))
+    workers = max(1, workers or int(os.getenv('ETL_WORKERS', 4)))
+
+    result = {
+        'total_concepts': 0,
+        'new_concepts': 0,
+        'chunks': 0,
+        'failed_chunks': 0,
+        'relations_saved': 0
+    }
+
     print("=" * 70)
     print("ETL Phase 2: Concept Relations Pipeline")
     print("=" * 70)
     print()
-    
-    # Step 1: DB에서 모든 개념 로드
+
+    # Step 1: DB에서 개념 로드 및 신규 개념 선별
     print("STEP 1: Loading concepts from database...")
     print("-" * 70)
-    
+
     try:
-        concepts = Concept.query.all()
-        
-        if not concepts:
+        concept_rows = db.session.query(Concept.concept_id, Concept.name).all()
+
+        if not concept_rows:
             print("\n✗ No concepts found in database.")
             print("   Please run 'python -m etl.run' first to populate concepts.")
-            return {'total_concepts': 0, 'relations_saved': 0}
-        
-        concept_names = [c.name for c in concepts]
-        print(f"✓ Loaded {len(concept_names)} concepts from database")
-        print(f"  Concepts: {', '.join(concept_names[:10])}")
-        if len(concept_names) > 10:
-            print(f"  ... and {len(concept_names) - 10} more")
-        
+            return result
+
+        id_to_name = {concept_id: name for concept_id, name in concept_rows}
+        max_concept_id = max(id_to_name)
+        watermark = 0 if full_refresh else ETL_Watermark.get_value(RELATIONS_WATERMARK)
+        target_ids = sorted(cid for cid in id_to_name if cid > watermark)
+
+        result['total_concepts'] = len(id_to_name)
+        result['new_concepts'] = len(target_ids)
+
+        print(f"✓ Loaded {len(id_to_name)} concepts from database")
+        print(f"✓ Watermark: concept_id > {watermark} → {len(target_ids)} concepts to analyze")
+
+        # 마이그레이션 직후 비어 있는 이웃 목록은 백그라운드에서 채움
+        if AdjacencyService.needs_rebuild():
+            print("! Concept adjacency table is empty")
+            ETLService.schedule_task('rebuild_concept_adjacency_task')
+
+        if not target_ids:
+            print("\n⊘ No new concepts since the last run. Nothing to analyze.")
+            return result
+
     except Exception as e:
         print(f"\n✗ Failed to load concepts from database: {e}")
-        return {'total_concepts': 0, 'relations_saved': 0}
-    
+        return result
+
     print()
-    
-    # Step 2: AI 분석기 및 DB 로더 초기화
-    print("STEP 2: Initializing AI analyzer and DB loader...")
+
+    # Step 2: 공동 등장 + LSH 유사 후보 기반 청크 분할
+    print("STEP 2: Partitioning concepts into chunks...")
+    print("-" * 70)
+
+    neighbours = _load_cooccurrence_neighbours(set(target_ids), chunk_size)
+
+    lsh_limit = int(os.getenv('RELATIONS_LSH_NEIGHBOURS', 10))
+    if lsh_limit > 0:
+        try:
+            similar = _load_similar_neighbours(
+                target_ids, lsh_limit, float(os.getenv('RELATIONS_LSH_MIN_SIMILARITY', 0.3))
+            )
+            print(f"✓ LSH candidates: {sum(len(v) for v in similar.values())} pairs "
+                  f"for {len(similar)} concepts")
+            neighbours = merge_neighbours(neighbours, similar)
+        except Exception as e:
+            db.session.rollback()
+            print(f"! LSH candidate lookup failed (co-occurrence only): {e}")
+
+    chunks = build_relation_chunks(target_ids, neighbours, chunk_size)
+
+    # 청크가 하나도 만들어지지 않으면(예: 신규 개념 1개, 이웃 없음) 분석할 쌍이 없음
+    if not chunks:
+        print("⊘ Not enough concepts to form a pair. Nothing to analyze.")
+        return result
+
+    result['chunks'] = len(chunks)
+    print(f"✓ {len(chunks)} chunks (max {chunk_size} concepts each)")
+    print()
+
+    # Step 3: AI 분석기 및 DB 로더 초기화
+    print("STEP 3: Initializing AI analyzer and DB loader...")
     print("-" * 70)
-    
+
     try:
         analyzer = AIAnalyzer()
         loader = DBLoader(current_app.app_context())
         print("✓ Components initialized successfully")
     except Exception as e:
         print(f"\n✗ Failed to initialize components: {e}")
-        return {'total_concepts': len(concept_names), 'relations_saved': 0}
-    
+        return result
+
     print()
-    
-    # Step 3: AI에게 관계 분석 요청
-    print("STEP 3: Analyzing concept relations with AI...")
+
+    # Step 4: 청크별 관계 분석 (동시 실행)
+    print(f"STEP 4: Analyzing concept relations with AI... (workers: {workers})")
     print("-" * 70)
-    
-    try:
-        print(f"Requesting AI to analyze {len(concept_names)} concepts...")
-        print("This may take a minute...")
-        
-        analysis = analyzer.analyze_concept_relations(concept_names)
-        
-        if not analysis:
-            print("\n✗ AI analysis failed or returned no results.")
-            return {'total_concepts': len(concept_names), 'relations_saved': 0}
-        
-        relations = analysis.get('relations', [])
-        
-        if not relations:
-            print("\n✗ No relations found by AI.")
-            return {'total_concepts': len(concept_names), 'relations_saved': 0}
-        
-        print(f"✓ AI analysis complete!")
-        print(f"✓ Found {len(relations)} potential relations")
-        
-        # 샘플 관계 출력
+
+    target_names = {id_to_name[cid] for cid in target_ids}
+    relations = []
+    seen_pairs = set()
+
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix='relations-worker') as executor:
+        futures = {
+            executor.submit(
+                _analyze_chunk,
+                analyzer,
+                [id_to_name[cid] for cid in chunk],
+                max_retries
+            ): chunk_idx
+            for chunk_idx, chunk in enumerate(chunks, 1)
+        }
+
+        for future in as_completed(futures):
+            chunk_idx = futures[future]
+            chunk_relations = future.result()
+
+            if chunk_relations is None:
+                print(f"  ✗ Chunk {chunk_idx}/{len(chunks)} failed after {max_retries + 1} attempts")
+                result['failed_chunks'] += 1
+                continue
+
+            # 신규 개념이 포함된 쌍만 유지 (기존 쌍은 이전 실행에서 이미 분석됨)
+            kept = 0
+            for rel in chunk_relations:
+                if rel['from'] not in target_names and rel['to'] not in target_names:
+                    continue
+                pair = (rel['from'], rel['to'])
+                if pair in seen_pairs:
+                    continue
+                seen_pairs.add(pair)
+                relations.append(rel)
+                kept += 1
+
+            print(f"  ✓ Chunk {chunk_idx}/{len(chunks)}: {kept} relations")
+
+    print(f"\n✓ Found {len(relations)} potential relations")
+
+    # 샘플 관계 출력
+    if relations:
         print("\nSample relations:")
         for i, rel in enumerate(relations[:5], 1):
             print(f"  {i}. {rel['from']} --[{rel['relation_type']}]--> {rel['to']}")
         if len(relations) > 5:
             print(f"  ... and {len(relations) - 5} more")
-        
-    except Exception as e:
-        print(f"\n✗ Error during AI analysis: {e}")
-        import traceback
-        traceback.print_exc()
-        return {'total_concepts': len(concept_names), 'relations_saved': 0}
-    
+
     print()
-    
-    # Step 4: DB에 관계 저장
-    print("STEP 4: Saving relations to database...")
+
+    # Step 5: DB에 관계 저장
+    print("STEP 5: Saving relations to database...")
     print("-" * 70)
-    
+
+    saved_count = 0
     try:
-        saved_count = loader.load_concept_relations(relations)
-        
+        if relations:
+            saved_count = loader.load_concept_relations(relations)
+
         if saved_count > 0:
             print(f"\n✓✓ Successfully saved {saved_count} relations to database!")
         else:
             print("\n⊘ No new relations were saved (all might be duplicates).")
-        
+
     except Exception as e:
         print(f"\n✗✗ Error saving relations: {e}")
         import traceback
         traceback.print_exc()
-        return {'total_concepts': len(concept_names), 'relations_saved': 0}
-    
+        return result
+
+    result['relations_saved'] = saved_count
+
+    # Step 6: 워터마크 갱신 (실패한 청크가 있으면 다음 실행에서 재분석)
+    if result['failed_chunks'] == 0:
+        try:
+            ETL_Watermark.set_value(RELATIONS_WATERMARK, max_concept_id)
+            db.session.commit()
+            print(f"✓ Watermark advanced to concept_id {max_concept_id}")
+        except Exception as e:
+            db.session.rollback()
+            print(f"✗ Failed to update watermark: {e}")
+    else:
+        print(f"! Watermark kept at {watermark} ({result['failed_chunks']} chunks failed)")
+
+    # Step 6-1: 새 관계(기본 강도 5)의 강도를 유사도/공동 등장 기준으로 재계산
+    strength_stale = 0
+    if saved_count > 0:
+        try:
+            strength_stale = recompute_relation_strengths()['stale_articles']
+        except Exception as e:
+            db.session.rollback()
+            print(f"✗ Relation strength recomputation failed: {e}")
+            ETLService.schedule_task('recompute_relation_strengths_task')
+
+    # Step 7: 그래프 캐시가 stale인 기사(이번 실행 또는 이전에 실패한 재생성)를 일괄 재계산
+    graph_caches_rebuilt = 0
+    if saved_count > 0 or strength_stale > 0 or ETLService.has_stale_graph_caches():
+        print()
+        print("STEP 7: Rebuilding graph caches for affected articles...")
+        print("-" * 70)
+        try:
+            graph_caches_rebuilt = ETLService.rebuild_stale_graph_caches()
+            print(f"✓ Rebuilt {graph_caches_rebuilt} graph caches")
+        except Exception as e:
+            db.session.rollback()
+            print(f"✗ Graph cache rebuild failed (unfinished articles stay stale): {e}")
+            ETLService.schedule_task('rebuild_stale_graph_caches_task')
+
     # 최종 요약
     print()
     print("=" * 70)
     print("ETL Phase 2 Complete")
     print("=" * 70)
-    print(f"✓ Total concepts analyzed: {len(concept_names)}")
+    print(f"✓ Total concepts: {result['total_concepts']}")
+    print(f"✓ New concepts analyzed: {result['new_concepts']}")
+    print(f"✓ Chunks: {result['chunks']} (failed: {result['failed_chunks']})")
     print(f"✓ Relations discovered: {len(relations)}")
     print(f"✓ Relations saved to DB: {saved_count}")
+    print(f"✓ Graph caches rebuilt: {graph_caches_rebuilt}")
     print("=" * 70)
-    
-    return {
-        'total_concepts': len(concept_names),
-        'relations_saved': saved_count
-    }
+
+    return result
 
 
 if __name__ == "__main__":
     load_dotenv()
-    
+
     print("[App Context] Creating Flask app context...")
     config_name = os.getenv('FLASK_ENV', 'development')
     app = create_app(config_name)
-    
+
     with app.app_context():
         print("[App Context] Flask app context created. Starting ETL Phase 2...")
-        result = run_relations_etl()
+        result = run_relations_etl(full_refresh='--full' in sys.argv)
         print("[App Context] ETL Phase 2 complete. DB commit guaranteed.")
-        
+
         # 결과 출력
         if result['relations_saved'] > 0:
             print(f"\n✅ SUCCESS: {result['relations_saved']} concept relations saved!")
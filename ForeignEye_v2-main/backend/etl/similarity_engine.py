@@ -0,0 +1,260 @@
+"""
+개념 유사도 일괄 계산 엔진
+
+SimilarityCalculator.calculate_similarity는 두 개념을 받을 때마다 양쪽 설명에서 키워드를 다시 추출하므로,
+전체 쌍 계산이 O(n²)번의 정규식 처리가 됩니다. 이 엔진은 개념마다 한 번만 토큰화하여
+희소 행렬(개념 × 용어)을 만들고, 행렬 곱으로 모든 쌍의 공통 용어 수를 한꺼번에 구해
+같은 점수 규칙을 적용한 뒤 개념별 상위 k개 이웃을 반환합니다.
+
+점수 규칙 (SimilarityCalculator.calculate_similarity와 동일, 위에서부터 우선):
+    1. 이름 완전 일치 0.95
+    2. 한쪽 이름이 다른 쪽을 포함 0.8
+    3. 이름 단어 겹침 비율 >= 0.5 이면 0.6 + 0.2 × 비율
+    4. 키워드 Jaccard × 공통 키워드 수 가중치(3/5/8개 이상 1.1/1.2/1.3) + 공통 기술 키워드당 0.15 (최대 1.0)
+
+메모리는 행 블록(block_size × 전체 개념 수) 단위로만 사용하므로 5만 개념도 한 대에서 계산할 수 있습니다.
+정해진 쌍만 필요하면 score_pairs()가 같은 규칙을 쌍 단위로 계산합니다.
+"""
+
+import re
+from typing import Dict, Iterable, Iterator, List, Tuple
+
+import numpy as np
+from scipy import sparse
+
+from etl.similarity_calculator import SimilarityCalculator
+
+
+NAME_WORD_RE = re.compile(r'[a-zA-Z가-힣]{2,}')
+
+
+def _binary_matrix(rows: List[Iterable[str]], vocabulary: Dict[str, int]) -> sparse.csr_matrix:
+    """용어 집합 목록을 0/1 희소 행렬로 변환 (vocabulary에 없는 용어는 추가)"""
+    indptr = [0]
+    indices = []
+    for terms in rows:
+        for term in terms:
+            indices.append(vocabulary.setdefault(term, len(vocabulary)))
+        indptr.append(len(indices))
+
+    data = np.ones(len(indices), dtype=np.int32)
+    return sparse.csr_matrix(
+        (data, np.asarray(indices, dtype=np.int64), np.asarray(indptr, dtype=np.int64)),
+        shape=(len(rows), max(len(vocabulary), 1))
+    )
+
+
+class SimilarityEngine:
+    """
+    전체 개념 쌍 유사도 엔진
+
+    Attributes:
+        concept_ids (np.ndarray): 행 순서의 개념 ID
+    """
+
+    def __init__(self, concepts: Iterable[Tuple[int, str, str]]):
+        """
+        Args:
+            concepts: (concept_id, name, description_ko) 목록
+        """
+        concept_ids = []
+        names = []
+        name_words = []
+        name_grams = []
+        keywords = []
+
+        for concept_id, name, description in concepts:
+            lowered = name.lower().strip()
+            concept_ids.append(concept_id)
+            names.append(lowered)
+            name_words.append(set(NAME_WORD_RE.findall(lowered)))
+            name_grams.append({lowered[i:i + 2] for i in range(len(lowered) - 1)})
+            keywords.append(SimilarityCalculator._extract_keywords(f"{name} {description}"))
+
+        self.concept_ids = np.asarray(concept_ids, dtype=np.int64)
+        self._row_of = {concept_id: row for row, concept_id in enumerate(concept_ids)}
+        self._names = names
+
+        vocabulary: Dict[str, int] = {}
+        self._keywords = _binary_matrix(keywords, vocabulary)
+        tech_columns = sorted(
+            column for term, column in vocabulary.items()
+            if term in SimilarityCalculator.TECH_KEYWORDS
+        )
+        self._tech = self._keywords[:, tech_columns] if tech_columns else None
+        self._words = _binary_matrix(name_words, {})
+        self._grams = _binary_matrix(name_grams, {})
+
+        # 행렬 곱의 오른쪽 피연산자 (전치 CSR)
+        self._keywords_t = self._keywords.T.tocsr()
+        self._tech_t = self._tech.T.tocsr() if self._tech is not None else None
+        self._words_t = self._words.T.tocsr()
+        self._grams_t = self._grams.T.tocsr()
+
+        self._keyword_counts = np.asarray([len(terms) for terms in keywords], dtype=np.float64)
+        self._word_counts = np.asarray([len(words) for words in name_words], dtype=np.float64)
+        self._gram_counts = np.asarray([len(grams) for grams in name_grams], dtype=np.int64)
+        # 2-gram이 없는 1글자 이름은 포함 후보를 따로 확인
+        self._short_names = [
+            (column, name) for column, name in enumerate(names) if len(name) < 2 and name
+        ]
+
+    def __len__(self) -> int:
+        return len(self.concept_ids)
+
+    def top_k(self, k: int = 10, min_score: float = 0.0,
+              block_size: int = 128) -> Dict[int, List[Tuple[int, float]]]:
+        """
+        개념별 유사도 상위 k개 이웃
+
+        Args:
+            k (int): 개념당 이웃 수
+            min_score (float): 포함할 최소 점수 (0점 쌍은 항상 제외)
+            block_size (int): 한 번에 계산할 행 수 (메모리 ≈ block_size × 개념 수 × 8바이트 × 몇 배)
+
+        Returns:
+            dict: {concept_id: [(이웃 concept_id, 점수), ...]} (점수 내림차순, 동점이면 ID 오름차순)
+        """
+        return dict(self.iter_top_k(k, min_score, block_size))
+
+    def iter_top_k(self, k: int = 10, min_score: float = 0.0,
+                   block_size: int = 128) -> Iterator[Tuple[int, List[Tuple[int, float]]]]:
+        """
+        top_k()의 스트리밍 버전 (행 블록마다 결과를 내보내므로 전체 결과를 메모리에 두지 않음)
+
+        Yields:
+            tuple: (concept_id, [(이웃 concept_id, 점수), ...])
+        """
+        n = len(self)
+        for start in range(0, n, block_size):
+            stop = min(start + block_size, n)
+            scores = self._score_block(start, stop)
+            for offset, row in enumerate(scores):
+                yield int(self.concept_ids[start + offset]), self._select(row, k, min_score)
+
+    def score_pairs(self, pairs: Iterable[Tuple[int, int]], batch_size: int = 10000) -> np.ndarray:
+        """
+        지정한 개념 쌍의 유사도 (SimilarityCalculator.calculate_similarity와 같은 점수)
+
+        Args:
+            pairs: (concept_id, concept_id) 목록 (두 개념 모두 엔진에 있어야 함)
+            batch_size (int): 한 번에 계산할 쌍 수
+
+        Returns:
+            np.ndarray: pairs와 같은 순서의 점수 (float64)
+        """
+        pairs = list(pairs)
+        rows_a = np.asarray([self._row_of[a] for a, _ in pairs], dtype=np.int64)
+        rows_b = np.asarray([self._row_of[b] for _, b in pairs], dtype=np.int64)
+        scores = np.zeros(len(pairs), dtype=np.float64)
+
+        for start in range(0, len(pairs), batch_size):
+            a = rows_a[start:start + batch_size]
+            b = rows_b[start:start + batch_size]
+            scores[start:start + batch_size] = self._score_rows(a, b)
+
+        return scores
+
+    def _score_rows(self, a: np.ndarray, b: np.ndarray) -> np.ndarray:
+        """행 a[i]와 b[i] 쌍의 점수 (_score_block과 같은 규칙)"""
+        def common_terms(matrix):
+            return np.asarray(matrix[a].multiply(matrix[b]).sum(axis=1), dtype=np.float64).ravel()
+
+        # 4. 키워드 Jaccard + 가중치
+        common = common_terms(self._keywords)
+        union = self._keyword_counts[a] + self._keyword_counts[b] - common
+        jaccard = np.divide(common, union, out=np.zeros_like(common), where=union > 0)
+        jaccard *= np.select([common >= 8, common >= 5, common >= 3], [1.3, 1.2, 1.1], 1.0)
+        if self._tech is not None:
+            jaccard += common_terms(self._tech) * 0.15
+        scores = np.minimum(jaccard, 1.0)
+        scores[(self._keyword_counts[a] == 0) | (self._keyword_counts[b] == 0)] = 0.0
+
+        # 3. 이름 단어 겹침
+        word_common = common_terms(self._words)
+        word_max = np.maximum(self._word_counts[a], self._word_counts[b])
+        overlap = np.divide(word_common, word_max, out=np.zeros_like(word_common), where=word_max > 0)
+        name_match = (self._word_counts[a] > 0) & (self._word_counts[b] > 0) & (overlap >= 0.5)
+        scores = np.where(name_match, 0.6 + overlap * 0.2, scores)
+
+        # 1~2. 이름 일치/포함
+        for i, (row_a, row_b) in enumerate(zip(a, b)):
+            name1 = self._names[row_a]
+            name2 = self._names[row_b]
+            if name1 == name2:
+                scores[i] = 0.95
+            elif name1 in name2 or name2 in name1:
+                scores[i] = 0.8
+
+        scores[a == b] = 0.0
+        return scores
+
+    def _score_block(self, start: int, stop: int) -> np.ndarray:
+        """행 [start, stop)과 전체 개념 사이의 점수 행렬 (자기 자신은 0)"""
+        rows = np.arange(start, stop)
+
+        # 4. 키워드 Jaccard + 가중치
+        common = (self._keywords[start:stop] @ self._keywords_t).toarray().astype(np.float64)
+        row_counts = self._keyword_counts[start:stop, None]
+        union = row_counts + self._keyword_counts[None, :] - common
+        jaccard = np.divide(common, union, out=np.zeros_like(common), where=union > 0)
+        jaccard *= np.select([common >= 8, common >= 5, common >= 3], [1.3, 1.2, 1.1], 1.0)
+        if self._tech is not None:
+            tech_common = (self._tech[start:stop] @ self._tech_t).toarray()
+            jaccard += tech_common * 0.15
+        scores = np.minimum(jaccard, 1.0)
+        scores[(row_counts == 0) | (self._keyword_counts[None, :] == 0)] = 0.0
+
+        # 3. 이름 단어 겹침
+        word_common = (self._words[start:stop] @ self._words_t).toarray().astype(np.float64)
+        word_max = np.maximum(self._word_counts[start:stop, None], self._word_counts[None, :])
+        overlap = np.divide(word_common, word_max, out=np.zeros_like(word_common), where=word_max > 0)
+        has_words = (self._word_counts[start:stop, None] > 0) & (self._word_counts[None, :] > 0)
+        name_match = has_words & (overlap >= 0.5)
+        scores = np.where(name_match, 0.6 + overlap * 0.2, scores)
+
+        # 1~2. 이름 일치/포함: 한쪽의 2-gram이 모두 다른 쪽에 있는 쌍만 문자열로 확인
+        gram_common = (self._grams[start:stop] @ self._grams_t).toarray()
+        row_grams = self._gram_counts[start:stop, None]
+        col_grams = self._gram_counts[None, :]
+        candidates = ((gram_common == row_grams) & (row_grams > 0)) | \
+                     ((gram_common == col_grams) & (col_grams > 0))
+        candidates[rows - start, rows] = False
+
+        for offset, column in zip(*np.nonzero(candidates)):
+            self._apply_name_rule(scores, offset, start + offset, column)
+        for offset in range(stop - start):
+            row_name = self._names[start + offset]
+            for column, short_name in self._short_names:
+                if column != start + offset and (short_name in row_name or row_name in short_name):
+                    self._apply_name_rule(scores, offset, start + offset, column)
+            if len(row_name) < 2 and row_name:
+                for column, name in enumerate(self._names):
+                    if column != start + offset and row_name in name:
+                        self._apply_name_rule(scores, offset, start + offset, column)
+
+        scores[rows - start, rows] = 0.0
+        return scores
+
+    def _apply_name_rule(self, scores: np.ndarray, offset: int, row: int, column: int):
+        name1 = self._names[row]
+        name2 = self._names[column]
+        if name1 == name2:
+            scores[offset, column] = 0.95
+        elif name1 in name2 or name2 in name1:
+            scores[offset, column] = 0.8
+
+    def _select(self, row: np.ndarray, k: int, min_score: float) -> List[Tuple[int, float]]:
+        """한 행에서 상위 k개 선택 (동점은 개념 ID 오름차순)"""
+        columns = np.flatnonzero((row > 0) & (row >= min_score))
+        if len(columns) > k:
+            values = row[columns]
+            kth = np.partition(values, len(values) - k)[len(values) - k]
+            above = columns[values > kth]
+            ties = columns[values == kth]
+            ties = ties[np.argsort(self.concept_ids[ties], kind='stable')][:k - len(above)]
+            columns = np.concatenate([above, ties])
+
+        order = np.lexsort((self.concept_ids[columns], -row[columns]))
+        columns = columns[order]
+        return [(int(self.concept_ids[column]), float(row[column])) for column in columns]
@@ -0,0 +1,252 @@
+"""
+수집 URL 사전 필터
+
+GNews에서 가져온 기사 중 이미 저장된 기사를 스크래핑/AI 분석 전에 걸러냅니다.
+같은 헤드라인을 반복 수집하는 정기 실행에서 스크래핑과 LLM 호출 비용이 들지 않도록 합니다.
+
+판정 순서:
+1. 정규화 URL 기준으로 같은 수집 결과 안의 중복 제거
+2. Redis 집합(정규화 URL)에 있는 기사 제외 (SMISMEMBER 1회)
+3. 남은 URL을 Article.original_url IN 쿼리 1회로 확인
+
+Redis 집합은 처음 사용할 때 Article 테이블 전체에서 적재하고(키셋 배치),
+이후 커밋된 기사 URL을 remember()로 추가합니다.
+집합 키에는 DB 세대 값(ETL_Watermark 'url_filter.generation', 없으면 새로 생성)을 붙이므로
+reset_db.py 등으로 DB를 다시 만들면 새 키로 다시 적재됩니다. (이전 키는 TTL로 만료)
+
+환경 변수:
+    ETL_URL_FILTER_BACKEND  'redis' | 'none' (기본값: 'redis', 'none'이면 DB IN 쿼리만 사용)
+    ETL_URL_FILTER_KEY      Redis 집합 키 접두사 (기본값: 'etl:known_urls')
+    ETL_URL_FILTER_TTL      집합 유효 시간 (초, 기본값: 30일, 사용할 때마다 연장)
+"""
+
+import os
+import secrets
+from typing import Dict, Iterable, List, Tuple
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+
+from app.extensions import db
+from app.models import Article, ETL_Watermark
+
+
+# 같은 기사를 가리키지만 URL만 달라지는 추적용 파라미터
+TRACKING_PARAMS = {'gclid', 'fbclid', 'mc_cid', 'mc_eid', 'ref', 'ref_src', 'cmpid', 'ocid'}
+WARM_BATCH_SIZE = 5000
+DB_BATCH_SIZE = 1000
+# 집합이 DB에서 적재되었음을 나타내는 표식 멤버
+WARM_SENTINEL = '__warm__'
+GENERATION_WATERMARK = 'url_filter.generation'
+
+
+def normalize_url(url: str) -> str:
+    """
+    중복 판정용 URL 정규화
+
+    - scheme/host 소문자, 'www.' 및 기본 포트 제거
+    - fragment, 추적용 파라미터(utm_* 등) 제거, 나머지 파라미터 정렬
+    - 경로 끝 '/' 제거
+
+    Args:
+        url (str): 원본 URL
+
+    Returns:
+        str: 정규화된 URL (파싱할 수 없으면 공백만 정리한 원본)
+    """
+    url = (url or '').strip()
+    if not url:
+        return ''
+    try:
+        parts = urlsplit(url)
+        host = (parts.hostname or '').lower()
+        port = parts.port
+    except ValueError:
+        return url
+
+    if host.startswith('www.'):
+        host = host[4:]
+    scheme = parts.scheme.lower()
+    if port and not ((scheme == 'http' and port == 80) or (scheme == 'https' and port == 443)):
+        host = f'{host}:{port}'
+
+    query = sorted(
+        (key, value) for key, value in parse_qsl(parts.query, keep_blank_values=True)
+        if not key.lower().startswith('utm_') and key.lower() not in TRACKING_PARAMS
+    )
+    path = parts.path.rstrip('/') or '/'
+
+    return urlunsplit((scheme, host, path, urlencode(query), ''))
+
+
+class KnownURLFilter:
+    """
+    이미 저장된 기사 URL 필터
+
+    Attributes:
+        redis_client: Redis 클라이언트 (None이면 DB 조회만 사용)
+        key_prefix (str): Redis 집합 키 접두사 (실제 키는 '{key_prefix}:{DB 세대}')
+        ttl (int): 집합 유효 시간 (초)
+    """
+
+    def __init__(self, redis_client=None, key_prefix: str = 'etl:known_urls', ttl: int = 30 * 86400):
+        self.redis_client = redis_client
+        self.key_prefix = key_prefix
+        self.ttl = ttl
+        self.key = None
+        self._warmed = False
+
+    def filter_new(self, articles: List[Dict]) -> Tuple[List[Dict], Dict[str, int]]:
+        """
+        새 기사만 남기기
+
+        Args:
+            articles (List[Dict]): [{'title': str, 'url': str}, ...]
+
+        Returns:
+            tuple: (새 기사 리스트, {'fetched', 'invalid', 'duplicates', 'known_cache', 'known_db', 'new'})
+        """
+        stats = {'fetched': len(articles), 'invalid': 0, 'duplicates': 0, 'known_cache': 0, 'known_db': 0, 'new': 0}
+
+        # 1. 같은 수집 결과 안의 중복 (정규화 URL 기준)
+        candidates = []
+        seen = set()
+        for article in articles:
+            normalized = normalize_url(article.get('url', ''))
+            if not normalized:
+                stats['invalid'] += 1
+                continue
+            if normalized in seen:
+                stats['duplicates'] += 1
+                continue
+            seen.add(normalized)
+            candidates.append((normalized, article))
+
+        # 2. Redis 집합
+        if candidates and self._ensure_warm():
+            try:
+                flags = self.redis_client.smismember(self.key, [normalized for normalized, _ in candidates])
+                remaining = [item for item, known in zip(candidates, flags) if not known]
+                stats['known_cache'] = len(candidates) - len(remaining)
+                candidates = remaining
+            except Exception as e:
+                print(f"  ! URL filter cache lookup failed (falling back to DB): {e}")
+
+        # 3. DB (원본 URL 기준)
+        if candidates:
+            stored = self._fetch_stored_urls(article['url'] for _, article in candidates)
+            known = [normalized for normalized, article in candidates if article['url'] in stored]
+            if known:
+                stats['known_db'] = len(known)
+                self._add_to_cache(known)
+                candidates = [item for item in candidates if item[1]['url'] not in stored]
+
+        new_articles = [article for _, article in candidates]
+        stats['new'] = len(new_articles)
+        return new_articles, stats
+
+    def remember(self, urls: Iterable[str]):
+        """
+        적재된(또는 이미 있던) 기사 URL을 필터에 추가
+
+        Args:
+            urls (Iterable[str]): 원본 URL 목록
+        """
+        normalized = [normalize_url(url) for url in urls if url]
+        if normalized and self._ensure_warm():
+            self._add_to_cache(normalized)
+
+    def _ensure_warm(self) -> bool:
+        """Redis 집합이 DB에서 적재되어 있는지 확인하고, 없으면 적재 (Redis를 쓸 수 없으면 False)"""
+        if self.redis_client is None:
+            return False
+        if self._warmed:
+            return True
+
+        try:
+            self.key = f"{self.key_prefix}:{self._db_generation()}"
+            if not self.redis_client.sismember(self.key, WARM_SENTINEL):
+                count = 0
+                last_id = 0
+                while True:
+                    rows = db.session.query(Article.article_id, Article.original_url).filter(
+                        Article.article_id > last_id
+                    ).order_by(Article.article_id).limit(WARM_BATCH_SIZE).all()
+                    if not rows:
+                        break
+                    self.redis_client.sadd(self.key, *(normalize_url(url) for _, url in rows))
+                    count += len(rows)
+                    last_id = rows[-1][0]
+                self.redis_client.sadd(self.key, WARM_SENTINEL)
+                print(f"  ✓ URL filter cache loaded ({count} known URLs)")
+            self.redis_client.expire(self.key, self.ttl)
+            self._warmed = True
+            return True
+        except Exception as e:
+            print(f"  ! URL filter cache unavailable (using DB only): {e}")
+            self.redis_client = None
+            return False
+
+    @staticmethod
+    def _db_generation() -> int:
+        """
+        DB 세대 값 조회 (없으면 무작위 값으로 생성하여 커밋)
+
+        DB를 다시 만들면 ETL_Watermark 행도 사라지므로 새 세대(= 새 Redis 키)가 됩니다.
+        """
+        generation = ETL_Watermark.get_value(GENERATION_WATERMARK)
+        if generation:
+            return generation
+
+        ETL_Watermark.set_value(GENERATION_WATERMARK, secrets.randbits(48) or 1)
+        try:
+            db.session.commit()
+        except Exception:
+            # 동시에 다른 실행이 먼저 만든 경우 그 값을 사용
+            db.session.rollback()
+        return ETL_Watermark.get_value(GENERATION_WATERMARK)
+
+    def _add_to_cache(self, normalized_urls: List[str]):
+        if self.redis_client is None:
+            return
+        try:
+            self.redis_client.sadd(self.key, *normalized_urls)
+        except Exception as e:
+            print(f"  ! URL filter cache update failed: {e}")
+
+    @staticmethod
+    def _fetch_stored_urls(urls: Iterable[str]) -> set:
+        """이미 저장된 원본 URL 조회 (IN 쿼리)"""
+        stored = set()
+        urls = list(urls)
+        for start in range(0, len(urls), DB_BATCH_SIZE):
+            batch = urls[start:start + DB_BATCH_SIZE]
+            rows = db.session.query(Article.original_url).filter(
+                Article.original_url.in_(batch)
+            ).all()
+            stored.update(url for (url,) in rows)
+        return stored
+
+
+def get_url_filter() -> KnownURLFilter:
+    """
+    환경 변수 설정에 따른 KnownURLFilter 생성
+
+    Redis 연결에 실패하면 DB 조회만 사용합니다.
+
+    Returns:
+        KnownURLFilter: 필터 객체
+    """
+    backend_name = os.getenv('ETL_URL_FILTER_BACKEND', 'redis').lower()
+    key_prefix = os.getenv('ETL_URL_FILTER_KEY', 'etl:known_urls')
+    ttl = int(os.getenv('ETL_URL_FILTER_TTL', 30 * 86400))
+
+    redis_client = None
+    if backend_name == 'redis':
+        try:
+            from app.extensions import get_redis_client
+            redis_client = get_redis_client()
+            redis_client.ping()
+        except Exception as e:
+            print(f"⚠️ URL 필터 Redis 연결 실패 (DB 조회만 사용): {e}")
+            redis_client = None
+
+    return KnownURLFilter(redis_client, key_prefix, ttl)
@@ -4,9 +4,13 @@
 주어진 URL에서 기사 본문을 추출합니다.
 """
 
+import asyncio
+from typing import AsyncIterator, Dict, List, Optional, Tuple
+from urllib.parse import urlsplit
+
+import httpx
 import requests
 from bs4 import BeautifulSoup
-from typing import Optional
 
 
 class WebScraper:
@@ -36,17 +40,7 @@ class WebScraper:
             response = requests.get(url, headers=self.headers, timeout=self.timeout)
             response.raise_for_status()
             
-            soup = BeautifulSoup(response.content, 'html.parser')
-            
-            # 본문 추출 (여러 전략 시도)
-            article_text = self._extract_text(soup)
-            
-            if not article_text:
-                print(f"  ✗ No content found in article: {url}")
-                return None
-            
-            print(f"  ✓ Scraped {len(article_text)} characters from {url}")
-            return article_text
+            return self._parse_content(response.content, url)
         
         except requests.exceptions.Timeout:
             print(f"  ✗ Timeout error while scraping: {url}")
@@ -64,6 +58,29 @@ class WebScraper:
             print(f"  ✗ Unexpected error while scraping: {e}")
             return None
     
+    def _parse_content(self, content: bytes, url: str) -> Optional[str]:
+        """
+        HTML 응답 본문을 파싱하여 기사 텍스트 추출 (동기/비동기 공용)
+        
+        Args:
+            content (bytes): HTML 응답 본문
+            url (str): 기사 URL (로그용)
+            
+        Returns:
+            str: 추출된 텍스트. 실패 시 None
+        """
+        soup = BeautifulSoup(content, 'html.parser')
+        
+        # 본문 추출 (여러 전략 시도)
+        article_text = self._extract_text(soup)
+        
+        if not article_text:
+            print(f"  ✗ No content found in article: {url}")
+            return None
+        
+        print(f"  ✓ Scraped {len(article_text)} characters from {url}")
+        return article_text
+    
     def _extract_text(self, soup: BeautifulSoup) -> str:
         """
         BeautifulSoup 객체에서 텍스트 추출
@@ -100,7 +117,7 @@ class WebScraper:
     
     def scrape_multiple(self, urls: list) -> dict:
         """
-        여러 URL을 한 번에 스크래핑
+        여러 URL을 한 번에 스크래핑 (scrape_many 기반 동기 래퍼)
         
         Args:
             urls (list): URL 리스트
@@ -108,10 +125,121 @@ class WebScraper:
         Returns:
             dict: {url: content or None}
         """
-        results = {}
+        async def _collect() -> Dict[str, Optional[str]]:
+            collected = {url: None for url in urls}
+            async for url, content in self.scrape_many(urls):
+                collected[url] = content
+            return collected
         
-        for url in urls:
-            results[url] = self.scrape_article(url)
+        return asyncio.run(_collect())
+    
+    async def scrape_many(
+        self,
+        urls: List[str],
+        max_connections: int = 20,
+        max_per_host: int = 4,
+        deadline: Optional[float] = None
+    ) -> AsyncIterator[Tuple[str, Optional[str]]]:
+        """
+        여러 URL을 비동기로 스크래핑하고 완료되는 순서대로 결과를 스트리밍
         
-        return results
-
+        하나의 httpx.AsyncClient(커넥션 풀, HTTP keep-alive)를 공유하므로
+        같은 호스트의 기사들은 TCP/TLS 핸드셰이크를 재사용합니다.
+        
+        Args:
+            urls (List[str]): URL 리스트
+            max_connections (int): 전체 동시 연결 수 상한
+            max_per_host (int): 호스트별 동시 요청 수 상한
+            deadline (float, optional): 전체 작업 제한 시간 (초). 초과 시 남은 URL은 None으로 반환
+            
+        Yields:
+            tuple: (url, content or None)
+        """
+        unique_urls = list(dict.fromkeys(url for url in urls if url))
+        if not unique_urls:
+            return
+        
+        host_semaphores: Dict[str, asyncio.Semaphore] = {}
+        limits = httpx.Limits(
+            max_connections=max_connections,
+            max_keepalive_connections=max_connections,
+            keepalive_expiry=30.0
+        )
+        
+        async with httpx.AsyncClient(
+            headers=self.headers,
+            timeout=self.timeout,
+            limits=limits,
+            follow_redirects=True
+        ) as client:
+            
+            async def _fetch(url: str) -> Tuple[str, Optional[str]]:
+                host = urlsplit(url).netloc.lower()
+                semaphore = host_semaphores.setdefault(host, asyncio.Semaphore(max_per_host))
+                async with semaphore:
+                    return url, await self._scrape_article_async(client, url)
+            
+            tasks = {asyncio.create_task(_fetch(url)): url for url in unique_urls}
+            loop = asyncio.get_running_loop()
+            expires_at = loop.time() + deadline if deadline is not None else None
+            pending = set(tasks)
+            
+            try:
+                while pending:
+                    remaining = None
+                    if expires_at is not None:
+                        remaining = expires_at - loop.time()
+                        if remaining <= 0:
+                            break
+                    
+                    done, pending = await asyncio.wait(
+                        pending,
+                        timeout=remaining,
+                        return_when=asyncio.FIRST_COMPLETED
+                    )
+                    for task in done:
+                        yield task.result()
+            finally:
+                for task in pending:
+                    task.cancel()
+                if pending:
+                    await asyncio.gather(*pending, return_exceptions=True)
+            
+            if pending:
+                print(f"  ✗ Deadline exceeded: {len(pending)} URLs were not scraped")
+                for task in pending:
+                    yield tasks[task], None
+    
+    async def _scrape_article_async(self, client: httpx.AsyncClient, url: str) -> Optional[str]:
+        """
+        공유 AsyncClient로 단일 기사 본문 추출 (scrape_article의 비동기 버전)
+        
+        Args:
+            client (httpx.AsyncClient): 커넥션 풀을 가진 공유 클라이언트
+            url (str): 기사 URL
+            
+        Returns:
+            str: 추출된 텍스트. 실패 시 None
+        """
+        try:
+            response = await client.get(url)
+            response.raise_for_status()
+            
+            # HTML 파싱은 CPU 작업이므로 이벤트 루프를 막지 않도록 스레드로 넘김
+            return await asyncio.to_thread(self._parse_content, response.content, url)
+        
+        except httpx.TimeoutException:
+            print(f"  ✗ Timeout error while scraping: {url}")
+            return None
+        
+        except httpx.HTTPStatusError as e:
+            print(f"  ✗ HTTP error {e.response.status_code}: {url}")
+            return None
+        
+        except httpx.HTTPError as e:
+            print(f"  ✗ Request error while scraping: {e}")
+            return None
+        
+        except Exception as e:
+            print(f"  ✗ Unexpected error while scraping: {e}")
+            return None
@@ -0,0 +1,29 @@
+"""M2 ETL watermark table
+
+Revision ID: 5c2a8e41b7d3
+Revises: 096efcc86413
+Create Date: 2026-10-17 10:12:41.318204
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '5c2a8e41b7d3'
+down_revision = '096efcc86413'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_table('ETL_Watermark',
+    sa.Column('name', sa.String(length=100), nullable=False),
+    sa.Column('value', sa.BigInteger(), nullable=False),
+    sa.Column('updated_at', sa.DateTime(), nullable=False),
+    sa.PrimaryKeyConstraint('name')
+    )
+
+
+def downgrade():
+    op.drop_table('ETL_Watermark')
@@ -0,0 +1,30 @@
+"""M2 Article graph cache staleness and version
+
+Revision ID: 8e4d17a2c9f0
+Revises: 5c2a8e41b7d3
+Create Date: 2026-10-17 11:03:52.904117
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '8e4d17a2c9f0'
+down_revision = '5c2a8e41b7d3'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    with op.batch_alter_table('Article', schema=None) as batch_op:
+        batch_op.add_column(sa.Column('graph_cache_stale', sa.Boolean(), nullable=False, server_default=sa.false()))
+        batch_op.add_column(sa.Column('graph_cache_version', sa.Integer(), nullable=False, server_default='0'))
+        batch_op.create_index(batch_op.f('ix_Article_graph_cache_stale'), ['graph_cache_stale'], unique=False)
+
+
+def downgrade():
+    with op.batch_alter_table('Article', schema=None) as batch_op:
+        batch_op.drop_index(batch_op.f('ix_Article_graph_cache_stale'))
+        batch_op.drop_column('graph_cache_version')
+        batch_op.drop_column('graph_cache_stale')
@@ -0,0 +1,119 @@
+"""M2 Compact binary Article graph cache
+
+Revision ID: b71f3c9d2e58
+Revises: 8e4d17a2c9f0
+Create Date: 2026-10-17 14:22:07.318604
+
+"""
+import json
+import zlib
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'b71f3c9d2e58'
+down_revision = '8e4d17a2c9f0'
+branch_labels = None
+depends_on = None
+
+# app.utils.graph_format v2와 동일 (마이그레이션은 앱 코드 변경과 무관하게 고정)
+GRAPH_FORMAT_V2 = 2
+BATCH_SIZE = 500
+
+
+def _encode_v2(graph_data):
+    primary_ids = []
+    secondary_ids = []
+    for node in graph_data.get('nodes', []):
+        (primary_ids if node.get('is_primary') else secondary_ids).append(node['id'])
+
+    payload = {
+        'p': primary_ids,
+        's': secondary_ids,
+        'e': [[edge['from'], edge['to'], edge['strength']] for edge in graph_data.get('edges', [])]
+    }
+    body = json.dumps(payload, separators=(',', ':')).encode('utf-8')
+    return bytes([GRAPH_FORMAT_V2]) + zlib.compress(body, 6)
+
+
+def upgrade():
+    with op.batch_alter_table('Article', schema=None) as batch_op:
+        batch_op.alter_column(
+            'graph_cache',
+            existing_type=sa.Text(),
+            type_=sa.LargeBinary(),
+            existing_nullable=True
+        )
+
+    # 기존 JSON 캐시를 v2 형식으로 변환 (article_id 키셋 배치)
+    conn = op.get_bind()
+    article = sa.table(
+        'Article',
+        sa.column('article_id', sa.Integer),
+        sa.column('graph_cache', sa.LargeBinary),
+        sa.column('graph_cache_stale', sa.Boolean)
+    )
+
+    last_id = 0
+    while True:
+        rows = conn.execute(
+            sa.select(article.c.article_id, article.c.graph_cache)
+            .where(article.c.article_id > last_id)
+            .where(article.c.graph_cache.isnot(None))
+            .order_by(article.c.article_id)
+            .limit(BATCH_SIZE)
+        ).fetchall()
+        if not rows:
+            break
+
+        converted = []
+        corrupt = []
+        for article_id, raw in rows:
+            raw = bytes(raw)
+            if raw[:1] != b'{':
+                continue
+            try:
+                converted.append({'b_id': article_id, 'b_cache': _encode_v2(json.loads(raw.decode('utf-8')))})
+            except (ValueError, KeyError, TypeError):
+                corrupt.append(article_id)
+
+        if converted:
+            conn.execute(
+                article.update()
+                .where(article.c.article_id == sa.bindparam('b_id'))
+                .values(graph_cache=sa.bindparam('b_cache')),
+                converted
+            )
+        if corrupt:
+            # 읽을 수 없는 캐시는 비우고 재생성 대상으로 표시
+            conn.execute(
+                article.update()
+                .where(article.c.article_id.in_(corrupt))
+                .values(graph_cache=None, graph_cache_stale=True)
+            )
+
+        last_id = rows[-1][0]
+
+
+def downgrade():
+    # v2 캐시에는 개념 설명이 없으므로 JSON으로 되돌리지 않고 비운 뒤 재생성 대상으로 표시
+    article = sa.table(
+        'Article',
+        sa.column('graph_cache', sa.LargeBinary),
+        sa.column('graph_cache_stale', sa.Boolean)
+    )
+    op.execute(
+        article.update()
+        .where(article.c.graph_cache.isnot(None))
+        .values(graph_cache=None, graph_cache_stale=True)
+    )
+
+    with op.batch_alter_table('Article', schema=None) as batch_op:
+        batch_op.alter_column(
+            'graph_cache',
+            existing_type=sa.LargeBinary(),
+            type_=sa.Text(),
+            existing_nullable=True
+        )
@@ -0,0 +1,39 @@
+"""M2 Concept co-occurrence table
+
+Revision ID: d4a9e6c1f7b2
+Revises: b71f3c9d2e58
+Create Date: 2026-10-17 16:41:28.507319
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'd4a9e6c1f7b2'
+down_revision = 'b71f3c9d2e58'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_table('Concept_Cooccurrence',
+    sa.Column('concept_a_id', sa.Integer(), nullable=False),
+    sa.Column('concept_b_id', sa.Integer(), nullable=False),
+    sa.Column('article_count', sa.Integer(), nullable=False),
+    sa.Column('pmi', sa.Float(), nullable=False),
+    sa.ForeignKeyConstraint(['concept_a_id'], ['Concept.concept_id'], ondelete='CASCADE'),
+    sa.ForeignKeyConstraint(['concept_b_id'], ['Concept.concept_id'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('concept_a_id', 'concept_b_id')
+    )
+    with op.batch_alter_table('Concept_Cooccurrence', schema=None) as batch_op:
+        batch_op.create_index('idx_cooccurrence_a_count', ['concept_a_id', 'article_count'], unique=False)
+        batch_op.create_index('idx_cooccurrence_b_count', ['concept_b_id', 'article_count'], unique=False)
+
+
+def downgrade():
+    with op.batch_alter_table('Concept_Cooccurrence', schema=None) as batch_op:
+        batch_op.drop_index('idx_cooccurrence_b_count')
+        batch_op.drop_index('idx_cooccurrence_a_count')
+
+    op.drop_table('Concept_Cooccurrence')
@@ -0,0 +1,34 @@
+"""M2 Concept adjacency (denormalized neighbour lists)
+
+Revision ID: f3b8c2d5a614
+Revises: d4a9e6c1f7b2
+Create Date: 2026-10-17 18:05:46.231957
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'f3b8c2d5a614'
+down_revision = 'd4a9e6c1f7b2'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # 기존 관계의 이웃 목록은 `flask rebuild-adjacency`(또는 rebuild_concept_adjacency_task)로 채움
+    # (다음 run_relations_etl 실행도 테이블이 비어 있으면 작업을 예약)
+    # (채워지기 전에는 조회 시 Concept_Relation에서 계산)
+    op.create_table('Concept_Adjacency',
+    sa.Column('concept_id', sa.Integer(), nullable=False),
+    sa.Column('out_neighbours', sa.JSON(), nullable=False),
+    sa.Column('in_neighbours', sa.JSON(), nullable=False),
+    sa.Column('updated_at', sa.DateTime(), nullable=False),
+    sa.ForeignKeyConstraint(['concept_id'], ['Concept.concept_id'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('concept_id')
+    )
+
+
+def downgrade():
+    op.drop_table('Concept_Adjacency')
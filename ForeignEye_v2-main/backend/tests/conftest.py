@@ -0,0 +1,26 @@
+"""
+pytest 공통 픽스처
+
+TestingConfig(인메모리 SQLite)로 앱을 만들고 테스트마다 빈 스키마를 제공합니다.
+"""
+
+import os
+
+import pytest
+
+# 테스트에서는 외부 캐시 백엔드(Redis)를 쓰지 않음
+os.environ.setdefault('LLM_CACHE_BACKEND', 'none')
+os.environ.setdefault('COLLECTION_CACHE_BACKEND', 'local')
+
+from app import create_app
+from app.extensions import db
+
+
+@pytest.fixture
+def app():
+    app = create_app('testing')
+    with app.app_context():
+        db.create_all()
+        yield app
+        db.session.remove()
+        db.drop_all()
@@ -0,0 +1,82 @@
+"""
+검색 결과 직렬화 쿼리 수 회귀 테스트
+
+SearchService._serialize_articles는 결과 기사 수와 무관하게 고정된 수의 쿼리만 사용해야 합니다.
+"""
+
+from contextlib import contextmanager
+
+import pytest
+from sqlalchemy import event
+
+from app.extensions import db
+from app.models import Article, Article_Concept, Concept, Concept_Relation
+from app.services.adjacency_service import AdjacencyService
+from app.services.search_service import SearchService
+
+
+def _seed(num_articles, concepts_per_article=3):
+    """기사마다 고유 개념 + 개념마다 외부 개념으로 향하는 관계 2개"""
+    articles = []
+    for i in range(num_articles):
+        article = Article(title=f'Article {i}', original_url=f'https://example.com/{i}', summary_ko='요약')
+        concepts = [
+            Concept(name=f'Concept {i}-{j}', description_ko='설명')
+            for j in range(concepts_per_article)
+        ]
+        related = [Concept(name=f'Related {i}-{j}', description_ko='설명') for j in range(2)]
+        db.session.add_all([article, *concepts, *related])
+        db.session.flush()
+
+        for strength, concept in enumerate(concepts, start=3):
+            db.session.add(Article_Concept(article_id=article.article_id, concept_id=concept.concept_id))
+            for other in related:
+                db.session.add(Concept_Relation(
+                    from_concept_id=concept.concept_id,
+                    to_concept_id=other.concept_id,
+                    relation_type='related_to',
+                    strength=strength
+                ))
+        articles.append(article)
+
+    db.session.commit()
+    return articles
+
+
+@contextmanager
+def _count_statements():
+    statements = []
+
+    def before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    event.listen(db.engine, 'before_cursor_execute', before_cursor_execute)
+    try:
+        yield statements
+    finally:
+        event.remove(db.engine, 'before_cursor_execute', before_cursor_execute)
+
+
+def _serialize_query_count(articles):
+    # 직렬화 전에 이미 로드된 Article 컬럼이 다시 조회되지 않도록 속성을 채워 둠
+    for article in articles:
+        db.session.refresh(article)
+
+    with _count_statements() as statements:
+        serialized = SearchService._serialize_articles(articles)
+
+    assert len(serialized) == len(articles)
+    assert all(data['relative_concepts'] for data in serialized)
+    return len(statements)
+
+
+@pytest.mark.parametrize('adjacency_built', [True, False], ids=['adjacency', 'read-through'])
+def test_serialize_articles_query_count_is_constant(app, adjacency_built):
+    articles = _seed(12)
+    if adjacency_built:
+        AdjacencyService.rebuild_all()
+
+    single = _serialize_query_count(articles[:1])
+    many = _serialize_query_count(articles)
+
+    assert single == many